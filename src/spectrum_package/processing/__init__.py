@@ -8,7 +8,11 @@ from .image import ImageModel, ImageCollection
 from .header import HeaderProfile
 from .spectrum import SpectrumBase
 from .velocity import VelocityModel
+from .multi_line import MultiLineVelocityModel
+from .decomposition import ComponentVelocityModel
 from .velocity_map import VelocityMap
+from .quantity_map import QuantityMap
+from .cube import DataCube
 
 __all__ = [
     "InstrumentModel",
@@ -17,5 +21,9 @@ __all__ = [
     "HeaderProfile",
     "SpectrumBase",
     "VelocityModel",
+    "MultiLineVelocityModel",
+    "ComponentVelocityModel",
     "VelocityMap",
+    "QuantityMap",
+    "DataCube",
 ]
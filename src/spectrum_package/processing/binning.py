@@ -0,0 +1,198 @@
+"""空間方向のビニング.
+
+フィッティングの前にスリット方向の隣接列を足し合わせ、フィット回数を減らす。
+ビンは連続する列からなり、固定幅のビニングと、統計的誤差（HDU 2）から
+求めた輝線の S/N が目標値に達するまで列を加える適応的ビニングに対応する。
+ビンごとのフィット結果は `SpatialBinning.expand` で元の列に戻す。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Self
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SpatialBinning:
+    """空間方向の列からビンへの割り当て.
+
+    Attributes
+    ----------
+    labels : np.ndarray
+        各空間ピクセルのビン番号 (n_spatial,)。どのビンにも属さない
+        （フィットしない）列は -1。
+    n_bins : int
+        ビン数
+    """
+
+    labels: np.ndarray
+    n_bins: int
+
+    def __repr__(self) -> str:
+        return f"SpatialBinning(n_spatial={len(self.labels)}, n_bins={self.n_bins})"
+
+    @classmethod
+    def fixed(cls, n_spatial: int, factor: int) -> Self:
+        """``factor`` 列ずつの固定幅ビニングを生成する.
+
+        Parameters
+        ----------
+        n_spatial : int
+            空間ピクセル数
+        factor : int
+            1ビンあたりの列数。``factor`` に満たない端数の列は最後のビンに
+            まとめる（``n_spatial`` が ``factor`` 未満の場合は全列で1ビン）。
+
+        Returns
+        -------
+        SpatialBinning
+            生成されたビニング
+
+        Raises
+        ------
+        ValueError
+            ``factor`` が 1 未満の場合
+        """
+        if factor < 1:
+            raise ValueError("bin_factor は 1 以上を指定してください")
+        n_bins = max(n_spatial // factor, 1) if n_spatial else 0
+        labels = np.minimum(np.arange(n_spatial) // factor, n_bins - 1)
+        return cls(labels=labels, n_bins=n_bins)
+
+    @classmethod
+    def adaptive(
+        cls,
+        signal: np.ndarray,
+        noise: np.ndarray,
+        target_snr: float,
+        max_bin_size: int | None = None,
+    ) -> Self:
+        """S/N が目標値に達するまで隣接列を加える適応的ビニングを生成する.
+
+        スリットの一端から順に列を加え、合算した S/N = Σsignal / √(Σnoise²)
+        が ``target_snr`` 以上になった時点でビンを閉じる。目標に達しないまま
+        スリット端に達した残りの列は直前のビンに加える。
+
+        Parameters
+        ----------
+        signal : np.ndarray
+            各列の輝線の信号（連続光を差し引いた積分フラックス）(n_spatial,)
+        noise : np.ndarray
+            各列の信号の誤差 (n_spatial,)
+        target_snr : float
+            各ビンの目標 S/N
+        max_bin_size : int or None, optional
+            1ビンあたりの最大列数。この列数で目標 S/N に達しないビンは
+            フィット対象から除外する（ラベル -1）。None の場合は上限なし
+            （デフォルト: None）
+
+        Returns
+        -------
+        SpatialBinning
+            生成されたビニング
+        """
+        signal = np.where(np.isfinite(signal), signal, 0.0)
+        variance = np.where(np.isfinite(noise), noise, 0.0) ** 2
+        labels = np.full(len(signal), -1)
+        n_bins = 0
+        start = 0
+        total_signal = total_variance = 0.0
+        for i in range(len(signal)):
+            total_signal += signal[i]
+            total_variance += variance[i]
+            size = i - start + 1
+            reached = total_variance > 0 and total_signal >= target_snr * np.sqrt(total_variance)
+            if reached:
+                labels[start:i + 1] = n_bins
+                n_bins += 1
+            elif max_bin_size is not None and size >= max_bin_size:
+                pass  # 目標に達しないビンはフィットしない
+            else:
+                continue
+            start = i + 1
+            total_signal = total_variance = 0.0
+
+        if start < len(signal) and max_bin_size is None:
+            # 目標 S/N に達しなかった端の列
+            if n_bins > 0:
+                labels[start:] = n_bins - 1
+            else:
+                labels[start:] = 0
+                n_bins = 1
+        return cls(labels=labels, n_bins=n_bins)
+
+    def _members(self) -> np.ndarray:
+        """列とビンの対応行列 (n_spatial, n_bins)."""
+        members = np.zeros((len(self.labels), self.n_bins))
+        binned = self.labels >= 0
+        members[np.flatnonzero(binned), self.labels[binned]] = 1.0
+        return members
+
+    def coadd(
+        self,
+        data: np.ndarray,
+        error: np.ndarray | None = None,
+        weights: np.ndarray | None = None,
+        use_error: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None]:
+        """ビン内の列を平均した 2D データを返す.
+
+        ``weights`` が 0 の点は平均から除外する。
+
+        Parameters
+        ----------
+        data : np.ndarray
+            スペクトルデータ（2D: [波長, 空間位置]）
+        error : np.ndarray or None, optional
+            統計的誤差（data と同形状）。誤差は二乗和で合成する。
+        weights : np.ndarray or None, optional
+            フィッティングの重み（data と同形状）
+        use_error : bool, optional
+            ``weights`` が 1/error² であるかどうか。True の場合は合成後の
+            誤差から重みを作り直す（デフォルト: False）
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray | None, np.ndarray | None]
+            (ビン平均したデータ (n_wave, n_bins), 合成誤差, 重み)。
+            入力が None のものは None。
+        """
+        members = self._members()
+        good = np.ones(data.shape) if weights is None else (weights > 0).astype(float)
+        values = np.where(good > 0, np.asarray(data, dtype=float), 0.0)
+        count = good @ members
+        with np.errstate(divide="ignore", invalid="ignore"):
+            binned = (values @ members) / count
+            binned_error = None
+            if error is not None:
+                variance = np.where(good > 0, np.asarray(error, dtype=float) ** 2, 0.0)
+                binned_error = np.sqrt(variance @ members) / count
+        binned = np.where(count > 0, binned, 0.0)
+
+        binned_weights = None
+        if weights is not None:
+            binned_weights = (count > 0).astype(float)
+            if use_error and binned_error is not None:
+                ok = (count > 0) & (binned_error > 0)
+                binned_weights = np.where(ok, 1.0 / np.where(ok, binned_error, 1.0) ** 2, 0.0)
+        return binned, binned_error, binned_weights
+
+    def expand(self, values: np.ndarray) -> np.ndarray:
+        """ビンごとの値を元の列に戻す（除外された列は NaN）.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            ビンごとの値 (n_bins, ...)
+
+        Returns
+        -------
+        np.ndarray
+            列ごとの値 (n_spatial, ...)
+        """
+        expanded = np.full((len(self.labels),) + values.shape[1:], np.nan)
+        binned = self.labels >= 0
+        expanded[binned] = values[self.labels[binned]]
+        return expanded
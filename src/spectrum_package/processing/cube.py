@@ -0,0 +1,367 @@
+"""3次元データキューブモデル.
+
+複数のスリットのスペクトル画像を、スリット垂直方向 × スリット長方向 ×
+波長方向の3次元データキューブにまとめる。
+
+キューブの各面（科学データ・統計的誤差・品質フラグ）はディスク上の
+``.npy`` ファイルをメモリマップとして開き、スリットごとに書き込む。
+そのため、キューブ全体よりも少ないメモリでキューブを構築・参照できる。
+遅延モードの Reader から `DataCube.from_readers` で構築すると、
+スリットのデータも1本ずつ読み込まれる。
+
+キューブの構成::
+
+    <directory>/data.npy      科学データ (n_slits, n_spatial, n_wave)
+    <directory>/error.npy     統計的誤差（data と同形状）
+    <directory>/quality.npy   品質フラグ（data と同形状）
+    <directory>/cube.json     WCS などのメタデータ
+
+``cube.json`` は全スリットの書き込みが終わった後に作成するため、
+構築途中で中断されたキューブは `DataCube.open` で開けない。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Self
+
+from astropy.io import fits  # type: ignore
+from astropy.wcs import WCS  # type: ignore
+import numpy as np
+
+from .image import ImageCollection, ImageModel
+from .spectrum import SpectrumBase
+from ..util.fits_reader import ReaderCollection
+
+#: キューブの面の名前（SpectrumBase の属性名・ファイル名に対応）
+_PLANES: tuple[str, ...] = ("data", "error", "quality")
+
+#: メタデータファイル名
+_META_NAME: str = "cube.json"
+
+#: メタデータのフォーマットバージョン
+_META_VERSION: int = 1
+
+
+def _cube_wcs(wavelengths: np.ndarray, pixel_scale: float, slit_step: float) -> WCS:
+    """キューブの3軸の WCS を作成する.
+
+    FITS の軸順（numpy の逆順）で、第1軸が波長 [m]、第2軸がスリット方向の
+    空間座標 [arcsec]、第3軸がスリットオフセット [arcsec] となる。
+
+    Raises
+    ------
+    ValueError
+        波長軸が線形でない場合
+    """
+    n_wave = len(wavelengths)
+    delta = (wavelengths[-1] - wavelengths[0]) / max(n_wave - 1, 1)
+    if not np.allclose(np.diff(wavelengths), delta, rtol=1e-6, atol=0.0):
+        raise ValueError("波長軸が線形ではないため、キューブの WCS を作成できません")
+
+    wcs = WCS(naxis=3)
+    w = wcs.wcs  # type: ignore
+    w.ctype = ["WAVE", "SLITPOS", "SLITOFF"]
+    w.cunit = ["m", "arcsec", "arcsec"]
+    w.crpix = [1.0, 1.0, 1.0]
+    w.crval = [float(wavelengths[0]), 0.0, 0.0]
+    w.cdelt = [float(delta), pixel_scale, slit_step]
+    return wcs
+
+
+def _check_slit(
+    index: int, image: ImageModel, shape: tuple[int, int], wavelengths: np.ndarray
+) -> None:
+    """スリットの形状と波長グリッドが最初のスリットと一致するか検査する."""
+    if image.spectrum.data.shape != shape:
+        raise ValueError(
+            f"スリット {index} のデータ形状 {image.spectrum.data.shape} が"
+            f"最初のスリット {shape} と一致しません"
+        )
+    slit_wavelengths = image.header.spectrogram.wavelength_array
+    if not np.allclose(slit_wavelengths, wavelengths, rtol=1e-9, atol=0.0):
+        raise ValueError(f"スリット {index} の波長グリッドが最初のスリットと一致しません")
+
+
+@dataclass(frozen=True)
+class DataCube:
+    """ディスク上の3次元データキューブ.
+
+    各面の配列の形状は (スリット数, 空間ピクセル数, 波長ピクセル数) で、
+    1つの空間位置のスペクトルがディスク上で連続する。
+
+    Attributes
+    ----------
+    directory : Path
+        キューブのディレクトリ
+    data : np.ndarray
+        科学データ（メモリマップ）
+    error : np.ndarray
+        統計的誤差（メモリマップ）
+    quality : np.ndarray
+        品質フラグ（メモリマップ）
+    wcs : WCS
+        3軸の World Coordinate System（波長, スリット方向, スリットオフセット）
+    """
+
+    directory: Path
+    data: np.ndarray
+    error: np.ndarray
+    quality: np.ndarray
+    wcs: WCS
+
+    def __repr__(self) -> str:
+        size = sum(getattr(self, name).nbytes for name in _PLANES)
+        return (
+            f"DataCube(directory={self.directory}, shape={self.shape}, "
+            f"size={size / 1024**2:.1f} MiB)"
+        )
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __iter__(self) -> Iterator[SpectrumBase]:
+        return (self.slit(i) for i in range(len(self)))
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """キューブの形状 (スリット数, 空間ピクセル数, 波長ピクセル数)."""
+        n_slits, n_spatial, n_wave = self.data.shape
+        return n_slits, n_spatial, n_wave
+
+    def _axis(self, axis: int) -> np.ndarray:
+        """WCS の指定軸（FITS の軸順）のピクセル中心の座標を返す."""
+        w = self.wcs.wcs  # type: ignore
+        n = self.data.shape[2 - axis]
+        return w.crval[axis] + w.cdelt[axis] * (np.arange(n) + 1 - w.crpix[axis])
+
+    @property
+    def wavelength_array(self) -> np.ndarray:
+        """波長配列 [m] (n_wave,)."""
+        return self._axis(0)
+
+    @property
+    def spatial_positions(self) -> np.ndarray:
+        """スリット方向の空間座標 [arcsec] (n_spatial,)."""
+        return self._axis(1)
+
+    @property
+    def slit_offsets(self) -> np.ndarray:
+        """スリットの垂直方向オフセット [arcsec] (n_slits,)."""
+        return self._axis(2)
+
+    def slit(self, index: int) -> SpectrumBase:
+        """1スリットのスペクトルデータを返す.
+
+        各面は (波長, 空間位置) に転置したメモリマップのビューで、
+        `ImageModel` のスペクトルデータと同じ並びとなる。
+
+        Parameters
+        ----------
+        index : int
+            スリットインデックス
+
+        Returns
+        -------
+        SpectrumBase
+            スリットのスペクトルデータ
+        """
+        return SpectrumBase(
+            data=self.data[index].T,
+            error=self.error[index].T,
+            quality=self.quality[index].T,
+        )
+
+    @classmethod
+    def _write(
+        cls,
+        images: Iterable[ImageModel],
+        n_slits: int,
+        directory: str | Path,
+        slit_step: float,
+        pixel_scale: float,
+        overwrite: bool,
+    ) -> Self:
+        """スリットを1本ずつメモリマップに書き込み、キューブを構築する."""
+        directory = Path(directory)
+        meta_path = directory / _META_NAME
+        if not overwrite and any(
+            (directory / f"{name}.npy").exists() for name in _PLANES
+        ):
+            raise FileExistsError(f"キューブが既に存在します: {directory}")
+        directory.mkdir(parents=True, exist_ok=True)
+        meta_path.unlink(missing_ok=True)
+
+        planes: dict[str, np.memmap] = {}
+        wcs: WCS | None = None
+        n_written = 0
+        for index, image in enumerate(images):
+            spectrum = image.spectrum
+            if wcs is None:
+                n_wave, n_spatial = spectrum.data.shape
+                wavelengths = image.header.spectrogram.wavelength_array
+                wcs = _cube_wcs(wavelengths, pixel_scale, slit_step)
+                for name in _PLANES:
+                    dtype = getattr(spectrum, name).dtype.newbyteorder("=")
+                    planes[name] = np.lib.format.open_memmap(
+                        directory / f"{name}.npy",
+                        mode="w+",
+                        dtype=dtype,
+                        shape=(n_slits, n_spatial, n_wave),
+                    )
+            _check_slit(index, image, (n_wave, n_spatial), wavelengths)
+            for name, plane in planes.items():
+                plane[index] = getattr(spectrum, name).T
+                plane.flush()
+            n_written += 1
+
+        if wcs is None or n_written != n_slits:
+            raise ValueError(
+                f"スリット数が一致しません: 指定 {n_slits}, 書き込み {n_written}"
+            )
+        wcs.pixel_shape = (n_wave, n_spatial, n_slits)  # type: ignore
+        del planes
+
+        meta = {"version": _META_VERSION, "wcs": wcs.to_header_string()}  # type: ignore
+        tmp_path = meta_path.with_name(f"{_META_NAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_path, meta_path)
+        return cls.open(directory)
+
+    @classmethod
+    def from_image_collection(
+        cls,
+        image_collection: ImageCollection,
+        directory: str | Path,
+        slit_step: float = 0.2,
+        pixel_scale: float = 0.05,
+        overwrite: bool = False,
+    ) -> Self:
+        """ImageCollection からキューブを構築する.
+
+        スリットの順序はコレクションの順序とし、i 番目のスリットの
+        オフセットを ``i * slit_step`` とする（`VelocityMap` と同じ）。
+
+        Parameters
+        ----------
+        image_collection : ImageCollection
+            画像コレクション（全スリットの波長グリッドが一致すること）
+        directory : str or Path
+            キューブを書き込むディレクトリ
+        slit_step : float, optional
+            スリット間のオフセットステップ [arcsec]（デフォルト: 0.2）
+        pixel_scale : float, optional
+            空間方向の1ピクセルあたりのスケール [arcsec/pixel]
+            （STIS デフォルト: 0.05 arcsec/pixel）
+        overwrite : bool, optional
+            既存のキューブを上書きするかどうか（デフォルト: False）
+
+        Returns
+        -------
+        DataCube
+            読み取り専用で開いたキューブ
+
+        Raises
+        ------
+        FileExistsError
+            ``overwrite=False`` で、ディレクトリにキューブが既に存在する場合
+        ValueError
+            スリット間でデータ形状・波長グリッドが一致しない場合、
+            または波長軸が線形でない場合
+        """
+        return cls._write(
+            image_collection, len(image_collection), directory,
+            slit_step, pixel_scale, overwrite,
+        )
+
+    @classmethod
+    def from_readers(
+        cls,
+        reader_collection: ReaderCollection,
+        directory: str | Path,
+        slit_step: float = 0.2,
+        pixel_scale: float = 0.05,
+        wavelength_range: tuple[float, float] | None = None,
+        overwrite: bool = False,
+    ) -> Self:
+        """ReaderCollection から、スリットを1本ずつ読み込んでキューブを構築する.
+
+        `ImageCollection` を作らずに1ファイルずつ `ImageModel` を生成して
+        書き込むため、全スリットのデータを同時にメモリに保持しない。
+
+        Parameters
+        ----------
+        reader_collection : ReaderCollection
+            Reader コレクション（遅延モードを推奨）
+        directory : str or Path
+            キューブを書き込むディレクトリ
+        slit_step : float, optional
+            スリット間のオフセットステップ [arcsec]（デフォルト: 0.2）
+        pixel_scale : float, optional
+            空間方向の1ピクセルあたりのスケール [arcsec/pixel]
+            （STIS デフォルト: 0.05 arcsec/pixel）
+        wavelength_range : tuple[float, float] or None, optional
+            切り出す波長範囲 (下限, 上限) [m]（`ImageModel.from_reader` を参照）
+        overwrite : bool, optional
+            既存のキューブを上書きするかどうか（デフォルト: False）
+
+        Returns
+        -------
+        DataCube
+            読み取り専用で開いたキューブ
+
+        Raises
+        ------
+        FileExistsError
+            ``overwrite=False`` で、ディレクトリにキューブが既に存在する場合
+        ValueError
+            スリット間でデータ形状・波長グリッドが一致しない場合、
+            または波長軸が線形でない場合
+        """
+        images = (
+            ImageModel.from_reader(reader, wavelength_range=wavelength_range)
+            for reader in reader_collection
+        )
+        return cls._write(
+            images, len(reader_collection), directory, slit_step, pixel_scale, overwrite
+        )
+
+    @classmethod
+    def open(cls, directory: str | Path, mode: str = "r") -> Self:
+        """構築済みのキューブを開く.
+
+        Parameters
+        ----------
+        directory : str or Path
+            キューブのディレクトリ
+        mode : str, optional
+            メモリマップのモード（"r", "r+", "c"）。デフォルト: "r"
+
+        Returns
+        -------
+        DataCube
+            メモリマップで開いたキューブ
+
+        Raises
+        ------
+        FileNotFoundError
+            メタデータが存在しない（構築が完了していない）場合
+        ValueError
+            未対応のフォーマットバージョンの場合
+        """
+        directory = Path(directory)
+        meta = json.loads((directory / _META_NAME).read_text(encoding="utf-8"))
+        if meta.get("version") != _META_VERSION:
+            raise ValueError(
+                f"未対応のキューブのバージョン: '{meta.get('version')}'. "
+                f"利用可能: [{_META_VERSION}]"
+            )
+        planes = {
+            name: np.load(directory / f"{name}.npy", mmap_mode=mode) for name in _PLANES
+        }
+        wcs = WCS(fits.Header.fromstring(meta["wcs"]))
+        wcs.pixel_shape = planes["data"].shape[::-1]  # type: ignore
+        return cls(directory=directory, wcs=wcs, **planes)
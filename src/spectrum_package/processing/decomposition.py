@@ -0,0 +1,268 @@
+"""多成分ガウス分解モデル.
+
+アウトフロー領域のように1本の輝線が複数の速度成分を持つ場合に、
+1〜``max_components`` 成分のガウス関数モデルを全空間ピクセルについて
+一括でフィットし、空間ピクセルごとに情報量規準で成分数を選択する。
+
+成分数 n のモデルは、同じ静止波長を持つ n 本の輝線として
+`_MultiGaussianProblem` で表す（運動学は共有しない）。
+n 成分の初期値は n-1 成分の収束解から作るため、成分数ごとの
+フィットはすべて同じバッチ LM で行われる。
+
+成分数の選択規準:
+
+- ``"bic"``: ベイズ情報量規準 BIC = N ln(RSS/N) + p ln N が最小のモデル
+- ``"ftest"``: 入れ子モデルの F 検定で、有意水準 ``alpha`` で残差が
+  有意に減少する限り成分を追加する
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Self, TYPE_CHECKING
+
+import numpy as np
+from scipy.stats import f as f_distribution  # type: ignore
+
+from .multi_line import _MultiGaussianProblem
+from .velocity import VelocityModel
+from ..util.constants import SPEED_OF_LIGHT
+
+if TYPE_CHECKING:
+    from .image import ImageModel
+
+
+def _bic(rss: np.ndarray, n_points: int, n_params: int) -> np.ndarray:
+    """ベイズ情報量規準を計算する（フィット失敗は inf）."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bic = n_points * np.log(rss / n_points) + n_params * np.log(n_points)
+    return np.where(np.isfinite(bic), bic, np.inf)
+
+
+def _select_bic(
+    rss: np.ndarray, n_points: int, n_params: list[int], alpha: float
+) -> np.ndarray:
+    """BIC が最小となるモデルのインデックスを返す（全モデル失敗は -1）."""
+    bic = np.stack([_bic(r, n_points, p) for r, p in zip(rss, n_params)])
+    best = np.argmin(bic, axis=0)
+    return np.where(np.isfinite(bic.min(axis=0)), best, -1)
+
+
+def _select_ftest(
+    rss: np.ndarray, n_points: int, n_params: list[int], alpha: float
+) -> np.ndarray:
+    """F 検定で有意な限り成分を追加したモデルのインデックスを返す."""
+    selected = np.where(np.isfinite(rss[0]), 0, -1)
+    for j in range(1, len(rss)):
+        current = np.clip(selected, 0, None)
+        rss_cur = np.take_along_axis(rss, current[np.newaxis], axis=0)[0]
+        p_cur = np.asarray(n_params)[current]
+        dof = n_points - n_params[j]
+        if dof <= 0:
+            break
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f_stat = ((rss_cur - rss[j]) / (n_params[j] - p_cur)) / (rss[j] / dof)
+        threshold = f_distribution.ppf(1.0 - alpha, n_params[j] - p_cur, dof)
+        better = np.isfinite(rss[j]) & (
+            (selected < 0) | (np.nan_to_num(f_stat, nan=-np.inf) > threshold)
+        )
+        selected = np.where(better, j, selected)
+    return selected
+
+
+#: 成分数の選択規準名から選択関数へのマッピング
+SELECTION_CRITERIA: dict[str, Callable[[np.ndarray, int, list[int], float], np.ndarray]] = {
+    "bic": _select_bic,
+    "ftest": _select_ftest,
+}
+
+
+def _split_guess(params: np.ndarray, n_components: int) -> np.ndarray:
+    """(n-1) 成分の解から n 成分の初期値を作る.
+
+    最も強い成分を、同じ中心を持つ狭い成分と広い成分に分ける。
+
+    Parameters
+    ----------
+    params : np.ndarray
+        (n-1) 成分の無次元パラメータ
+        ``[amp_1..n-1, center_1..n-1, sigma_1..n-1, offset]`` (n_batch, 3(n-1)+1)
+    n_components : int
+        新しい成分数 n
+
+    Returns
+    -------
+    np.ndarray
+        n 成分の初期パラメータ (n_batch, 3n+1)
+    """
+    k = n_components - 1
+    amp, center, sigma = params[:, :k], params[:, k:2 * k], np.abs(params[:, 2 * k:3 * k])
+    offset = params[:, 3 * k:]
+    rows = np.arange(len(params))
+    strongest = np.argmax(np.abs(amp), axis=1)
+
+    a, c, s = amp[rows, strongest], center[rows, strongest], sigma[rows, strongest]
+    amp = amp.copy()
+    sigma = sigma.copy()
+    amp[rows, strongest] = 0.7 * a
+    sigma[rows, strongest] = 0.6 * s
+    return np.column_stack([
+        amp, 0.3 * a,
+        center, c,
+        sigma, np.minimum(2.0 * s, 1.0),
+        offset,
+    ])
+
+
+@dataclass(frozen=True)
+class ComponentVelocityModel:
+    """多成分ガウス分解による成分別の後退速度モデル.
+
+    各空間ピクセルの成分は速度分散の小さい順（狭い成分が先頭）に並べる。
+    選択された成分数より後ろの成分は NaN となる。
+
+    Attributes
+    ----------
+    rest_wavelength : float
+        輝線の静止波長 [m]
+    components : list[VelocityModel]
+        成分別の後退速度モデル（長さ ``max_components``）。
+        各要素は `VelocityMap` にそのまま渡すことができる。
+    component_params : np.ndarray
+        各成分の [amp, center, sigma, offset] [m] (max_components, n_spatial, 4)
+    n_components : np.ndarray
+        各空間ピクセルで選択された成分数 (n_spatial,)。全モデルの
+        フィットに失敗したピクセルは 0。
+    bic : np.ndarray
+        成分数 1..max_components の各モデルの BIC (max_components, n_spatial)。
+        フィットに失敗したモデルは inf。
+    criterion : str
+        成分数の選択に使用した規準名
+    """
+
+    rest_wavelength: float
+    components: list[VelocityModel]
+    component_params: np.ndarray
+    n_components: np.ndarray
+    bic: np.ndarray
+    criterion: str
+
+    def __repr__(self) -> str:
+        counts = np.bincount(self.n_components, minlength=len(self.components) + 1)
+        return (
+            f"ComponentVelocityModel(rest_wavelength={self.rest_wavelength:.4e} m, "
+            f"max_components={len(self.components)}, "
+            f"n_components={counts.tolist()}, criterion='{self.criterion}')"
+        )
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def __getitem__(self, index: int) -> VelocityModel:
+        return self.components[index]
+
+    @property
+    def sigma_velocities(self) -> np.ndarray:
+        """各成分の速度分散 [m/s] (max_components, n_spatial)."""
+        return SPEED_OF_LIGHT * self.component_params[:, :, 2] / self.rest_wavelength
+
+    @classmethod
+    def from_image(
+        cls,
+        image: ImageModel,
+        rest_wavelength: float,
+        window_width: float,
+        max_components: int = 3,
+        criterion: str = "bic",
+        alpha: float = 0.01,
+        slit_offset: float = 0.0,
+        pixel_scale: float = 0.05,
+    ) -> Self:
+        """ImageModel の輝線を多成分ガウス関数に分解する.
+
+        Parameters
+        ----------
+        image : ImageModel
+            スペクトルデータを持つ ImageModel
+        rest_wavelength : float
+            輝線の静止波長 [m]
+        window_width : float
+            フィッティングウィンドウの半幅 [m]
+        max_components : int, optional
+            最大成分数（デフォルト: 3）
+        criterion : str, optional
+            成分数の選択規準（"bic", "ftest"）。デフォルト: "bic"
+        alpha : float, optional
+            "ftest" の有意水準（デフォルト: 0.01）
+        slit_offset : float, optional
+            スリットの垂直方向オフセット [arcsec]（デフォルト: 0.0）
+        pixel_scale : float, optional
+            空間方向の1ピクセルあたりのスケール [arcsec/pixel]
+            （STIS デフォルト: 0.05 arcsec/pixel）
+
+        Returns
+        -------
+        ComponentVelocityModel
+            成分別の後退速度モデル
+
+        Raises
+        ------
+        ValueError
+            未知の選択規準名、``max_components`` が 1 未満の場合、
+            またはウィンドウ内に波長ピクセルがない場合
+        """
+        if criterion not in SELECTION_CRITERIA:
+            raise ValueError(
+                f"未知の選択規準: '{criterion}'. "
+                f"利用可能: {list(SELECTION_CRITERIA.keys())}"
+            )
+        if max_components < 1:
+            raise ValueError("max_components は 1 以上を指定してください")
+
+        wavelengths = image.header.spectrogram.wavelength_array
+        problems = [
+            _MultiGaussianProblem.from_wavelengths(
+                wavelengths, [rest_wavelength] * n, window_width, tied=False
+            )
+            for n in range(1, max_components + 1)
+        ]
+        # 全成分数で使用ピクセルは共通なので、データは1回だけ読み出す
+        flux = problems[0].extract(image.spectrum.data)
+        n_spatial, n_points = flux.shape
+
+        all_params = np.full((max_components, max_components, n_spatial, 4), np.nan)
+        rss = np.full((max_components, n_spatial), np.inf)
+        p0: np.ndarray | None = None
+        for j, problem in enumerate(problems):
+            line_params, result = problem.fit_flux(flux, p0)
+            if result is None:
+                break
+            valid = result.converged & np.all(np.isfinite(line_params[:, :, 1]), axis=0)
+            rss[j] = np.where(valid, result.chi2, np.inf)
+            all_params[j, :j + 1] = np.where(valid[np.newaxis, :, np.newaxis], line_params, np.nan)
+            if j + 1 < max_components:
+                p0 = _split_guess(result.params, j + 2)
+
+        n_params = [p.n_params for p in problems]
+        selected = SELECTION_CRITERIA[criterion](rss, n_points, n_params, alpha)
+
+        # 選択されたモデルの成分を速度分散の小さい順に並べる
+        chosen = np.take_along_axis(
+            all_params, np.clip(selected, 0, None)[np.newaxis, np.newaxis, :, np.newaxis], axis=0
+        )[0]
+        chosen[:, selected < 0] = np.nan
+        order = np.argsort(np.where(np.isnan(chosen[:, :, 2]), np.inf, chosen[:, :, 2]), axis=0)
+        component_params = np.take_along_axis(chosen, order[:, :, np.newaxis], axis=0)
+
+        components = [
+            VelocityModel._from_params(params, image, rest_wavelength, slit_offset, pixel_scale)
+            for params in component_params
+        ]
+        return cls(
+            rest_wavelength=rest_wavelength,
+            components=components,
+            component_params=component_params,
+            n_components=selected + 1,
+            bic=np.stack([_bic(r, n_points, p) for r, p in zip(rss, n_params)]),
+            criterion=criterion,
+        )
@@ -7,7 +7,9 @@ Primary HDU（HDU 0）と Spectrogram HDU（HDU 1）のメタデータを
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import cached_property
 from typing import Self, cast, Any, TYPE_CHECKING
 from pathlib import Path
 
@@ -19,6 +21,40 @@ if TYPE_CHECKING:
     from ..util.fits_reader import STISFitsReader
 
 
+#: 波長配列のキャッシュに保持する件数
+_WAVELENGTH_CACHE_SIZE: int = 32
+
+#: スペクトル WCS の設定をキーとする波長配列のキャッシュ（LRU）。
+#: 同じグレーティング設定の露出間で同一の（読み取り専用の）配列を共有する。
+_WAVELENGTH_CACHE: OrderedDict[tuple[object, ...], np.ndarray] = OrderedDict()
+
+
+def _linear_dispersion(wcs: WCS, axis: int) -> tuple[float, float, float] | None:
+    """波長軸が線形な場合に (CRVAL, CRPIX, 1ピクセルあたりの波長増分) を返す.
+
+    CTYPE が ``WAVE``（対数・テーブル形式でない）で、歪み補正がなく、
+    波長軸が空間軸と結合していない場合のみ線形とみなす。
+    値は WCS が SI 単位に正規化した後のもの（波長 [m]）を用いる。
+
+    Returns
+    -------
+    tuple[float, float, float] or None
+        線形の場合は (crval, crpix, delta)、それ以外は None
+    """
+    w = cast(Any, wcs)
+    if w.wcs.ctype[axis] != "WAVE":
+        return None
+    if any(
+        getattr(w, name, None) is not None
+        for name in ("sip", "cpdis1", "cpdis2", "det2im1", "det2im2")
+    ):
+        return None
+    matrix = w.wcs.get_cdelt()[:, np.newaxis] * w.wcs.get_pc()
+    if np.any(np.delete(matrix[axis], axis) != 0):
+        return None
+    return float(w.wcs.crval[axis]), float(w.wcs.crpix[axis]), float(matrix[axis, axis])
+
+
 @dataclass(frozen=True)
 class HeaderSpectrogram:
     """スペクトログラム HDU（HDU 1）のヘッダー情報.
@@ -65,31 +101,126 @@ class HeaderSpectrogram:
         )
 
     @property
+    def _spectral_axis(self) -> int:
+        """WAVE 軸の WCS 軸インデックス（0 または 1）を返す.
+
+        Raises
+        ------
+        ValueError
+            WCS の CTYPE に WAVE 軸が見つからない場合
+        """
+        if self.wcs.wcs.ctype[0] == "WAVE":  # type: ignore
+            return 0
+        if self.wcs.wcs.ctype[1] == "WAVE":  # type: ignore
+            return 1
+        raise ValueError(f"CTYPE is not WAVE {self.wcs.wcs.ctype}")  # type: ignore
+
+    @cached_property
     def wavelength_array(self) -> np.ndarray:
         """WCS から波長配列を計算する.
 
-        WCS の spectral サブシステムを使用して、ピクセルインデックスから
-        波長値 [m] への変換を行う。
+        波長軸が線形の場合は CRVAL/CRPIX/CDELT から直接計算し、
+        それ以外は WCS の spectral サブシステムを使用して、ピクセル
+        インデックスから波長値 [m] への変換を行う。
+
+        結果はインスタンスごとにキャッシュされ、さらにスペクトル WCS の
+        設定が一致するヘッダー間では同一の配列が共有される（直近の
+        ``_WAVELENGTH_CACHE_SIZE`` 種類の設定まで）。共有配列は読み取り専用である。
 
         Returns
         -------
         np.ndarray
-            波長配列 [m]
+            波長配列 [m]（読み取り専用）
 
         Raises
         ------
         ValueError
             WCS の CTYPE に WAVE 軸が見つからない場合
         """
-        if self.wcs.wcs.ctype[0] == "WAVE":  # type: ignore
-            nx = self.shape[1]
-        elif self.wcs.wcs.ctype[1] == "WAVE":  # type: ignore
-            nx = self.shape[0]
+        axis = self._spectral_axis
+        nx = self.shape[1 - axis]
+        linear = _linear_dispersion(self.wcs, axis)
+        if linear is not None:
+            key: tuple[object, ...] = ("linear", *linear, nx)
         else:
-            raise ValueError(f"CTYPE is not WAVE {self.wcs.wcs.ctype}")  # type: ignore
+            spec_wcs = self.wcs.sub(["spectral"])  # type: ignore
+            key = ("wcs", spec_wcs.to_header_string(), nx)  # type: ignore
+
+        cached = _WAVELENGTH_CACHE.get(key)
+        if cached is not None:
+            _WAVELENGTH_CACHE.move_to_end(key)
+            return cached
+
         pixel_indices = np.arange(nx)
-        spec_wcs = self.wcs.sub(["spectral"])  # type: ignore
-        return spec_wcs.pixel_to_world_values(pixel_indices)  # type: ignore
+        if linear is not None:
+            crval, crpix, delta = linear
+            wavelengths = crval + delta * (pixel_indices + 1 - crpix)
+        else:
+            wavelengths = np.asarray(spec_wcs.pixel_to_world_values(pixel_indices))  # type: ignore
+        wavelengths.setflags(write=False)
+        _WAVELENGTH_CACHE[key] = wavelengths
+        while len(_WAVELENGTH_CACHE) > _WAVELENGTH_CACHE_SIZE:
+            _WAVELENGTH_CACHE.popitem(last=False)
+        return wavelengths
+
+    def wavelength_rows(self, wave_min: float, wave_max: float) -> slice:
+        """波長範囲に対応する波長方向ピクセルの範囲を返す.
+
+        ``wave_min <= λ <= wave_max`` を満たすピクセルをすべて含む
+        最小の連続範囲を返す。データ配列の波長軸（axis 0）の切り出しに使用する。
+
+        Parameters
+        ----------
+        wave_min : float
+            波長範囲の下限 [m]
+        wave_max : float
+            波長範囲の上限 [m]
+
+        Returns
+        -------
+        slice
+            波長方向ピクセルの範囲
+
+        Raises
+        ------
+        ValueError
+            波長範囲内にピクセルが存在しない場合
+        """
+        wavelengths = self.wavelength_array
+        rows = np.flatnonzero((wavelengths >= wave_min) & (wavelengths <= wave_max))
+        if len(rows) == 0:
+            raise ValueError(
+                f"波長範囲 [{wave_min:.4e}, {wave_max:.4e}] m 内にピクセルがありません"
+            )
+        return slice(int(rows[0]), int(rows[-1]) + 1)
+
+    def crop(self, rows: slice) -> Self:
+        """波長方向ピクセル範囲で切り出したスペクトログラム情報を返す.
+
+        WCS の参照ピクセルをずらし、切り出し後のピクセル 0 が
+        元のピクセル ``rows.start`` に対応するようにする。
+
+        Parameters
+        ----------
+        rows : slice
+            波長方向ピクセルの範囲（ステップなし）
+
+        Returns
+        -------
+        HeaderSpectrogram
+            切り出し後のスペクトログラム情報
+        """
+        axis = self._spectral_axis
+        start, stop, _ = rows.indices(self.shape[1 - axis])
+        view = [slice(None), slice(None)]
+        view[axis] = slice(start, stop)
+        shape = list(self.shape)
+        shape[1 - axis] = stop - start
+        return replace(
+            self,
+            wcs=self.wcs.slice(tuple(view), numpy_order=False),  # type: ignore
+            shape=(shape[0], shape[1]),
+        )
 
     @property
     def spatial_array(self) -> np.ndarray:
@@ -190,4 +321,19 @@ class HeaderProfile:
         return cls(
             primary=HeaderPrimary.parse_header(reader.header(0)),
             spectrogram=HeaderSpectrogram.parse_header(reader.header(1)),
-        )
\ No newline at end of file
+        )
+
+    def crop(self, rows: slice) -> Self:
+        """波長方向ピクセル範囲で切り出したヘッダー情報を返す.
+
+        Parameters
+        ----------
+        rows : slice
+            波長方向ピクセルの範囲
+
+        Returns
+        -------
+        HeaderProfile
+            Spectrogram の WCS を切り出したヘッダー情報
+        """
+        return replace(self, spectrogram=self.spectrogram.crop(rows))
@@ -7,6 +7,7 @@ FITS ファイルのヘッダー情報とスペクトルデータを統合し、
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Self, Iterator, TYPE_CHECKING
 
 
@@ -33,31 +34,56 @@ class ImageModel:
         FITS ヘッダー情報（Primary + Spectrogram）
     spectrum : SpectrumBase
         2次元スペクトルデータ
+    source : Path or None
+        読み込み元の FITS ファイルのパス。ファイルから生成していない
+        場合は None。
     """
 
     header: HeaderProfile
     spectrum: SpectrumBase
+    source: Path | None = None
 
     def __repr__(self) -> str:
         return f"ImageModel( \n header={self.header}, \n spectrum={self.spectrum} \n )"
 
     @classmethod
-    def from_reader(cls, reader: STISFitsReader) -> Self:
+    def from_reader(
+        cls,
+        reader: STISFitsReader,
+        wavelength_range: tuple[float, float] | None = None,
+    ) -> Self:
         """STISFitsReader からスペクトル画像モデルを生成する.
 
+        ``wavelength_range`` を指定すると、その波長範囲に対応する
+        波長方向ピクセルのみを HDU 1/2/3 から切り出し、WCS も合わせて
+        切り出す。遅延モードの Reader と組み合わせると、輝線フィッティングに
+        必要な範囲のみがディスクから読み込まれる。
+
         Parameters
         ----------
         reader : STISFitsReader
             読み込み済みの Reader インスタンス
+        wavelength_range : tuple[float, float] or None, optional
+            切り出す波長範囲 (下限, 上限) [m]。None の場合は全体
+            （デフォルト: None）
 
         Returns
         -------
         ImageModel
             生成されたスペクトル画像モデル
         """
+        header = HeaderProfile.from_reader(reader)
+        if wavelength_range is None:
+            return cls(
+                header=header,
+                spectrum=SpectrumBase.from_reader(reader),
+                source=Path(reader.filename),
+            )
+        rows = header.spectrogram.wavelength_rows(*wavelength_range)
         return cls(
-            header=HeaderProfile.from_reader(reader),
-            spectrum=SpectrumBase.from_reader(reader),
+            header=header.crop(rows),
+            spectrum=SpectrumBase.from_reader(reader, rows=rows),
+            source=Path(reader.filename),
         )
 
     def plot_spectrum(
@@ -111,13 +137,19 @@ class ImageCollection:
     images: list[ImageModel]
 
     @classmethod
-    def from_readers(cls, reader_collection: ReaderCollection) -> Self:
+    def from_readers(
+        cls,
+        reader_collection: ReaderCollection,
+        wavelength_range: tuple[float, float] | None = None,
+    ) -> Self:
         """ReaderCollection から全ファイルの ImageModel を一括生成する.
 
         Parameters
         ----------
         reader_collection : ReaderCollection
             読み込み済み Reader コレクション
+        wavelength_range : tuple[float, float] or None, optional
+            切り出す波長範囲 (下限, 上限) [m]（`ImageModel.from_reader` を参照）
 
         Returns
         -------
@@ -125,7 +157,10 @@ class ImageCollection:
             生成済みコレクション
         """
         return cls(
-            images=[ImageModel.from_reader(r) for r in reader_collection]
+            images=[
+                ImageModel.from_reader(r, wavelength_range=wavelength_range)
+                for r in reader_collection
+            ]
         )
 
     def __len__(self) -> int:
@@ -3,12 +3,17 @@
 観測データの FITS ファイルをディレクトリ構造から検索するためのモデル。
 ディレクトリ、ファイル接尾辞、拡張子、およびディレクトリ深度を指定して
 glob パターンによるファイル探索を行う。
+探索結果のヘッダー情報は `HeaderIndex` にキャッシュでき、光学素子などの
+条件によるファイルの絞り込みを FITS ファイルを開き直さずに行える。
+パスの一覧も索引に保存し、ディレクトリが変更されていない間は
+ディレクトリを走査せずに返す。
 """
 
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Self
-from ..util.fits_reader import STISFitsReader
+from ..util.fits_reader import STISFitsReader, ReaderCollection
+from ..util.header_index import HeaderIndex, default_index_path
 
 
 @dataclass(frozen=True)
@@ -32,6 +37,9 @@ class InstrumentModel:
         除外するファイル名のタプル。
         ファイルのステム名（拡張子なし）またはフルネーム（拡張子あり）で
         マッチしたファイルをリストから除外する。（デフォルト: ()）
+    index_path : str or None
+        ヘッダー索引ファイルのパス。None の場合はキャッシュディレクトリの
+        `default_index_path` を使用する。（デフォルト: None）
     """
 
     file_directory: str
@@ -39,6 +47,7 @@ class InstrumentModel:
     extension: str
     depth: int = 1
     exclude_files: tuple[str, ...] = ()
+    index_path: str | None = None
 
     @classmethod
     def load(
@@ -48,6 +57,7 @@ class InstrumentModel:
         extension: str = "",
         depth: int = 1,
         exclude_files: tuple[str, ...] = (),
+        index_path: str | None = None,
     ) -> Self:
         """InstrumentModel を生成する.
 
@@ -63,6 +73,8 @@ class InstrumentModel:
             ディレクトリ探索の深度（デフォルト: 1）
         exclude_files : tuple[str, ...], optional
             除外するファイル名のタプル（デフォルト: ()）
+        index_path : str or None, optional
+            ヘッダー索引ファイルのパス（デフォルト: None）
 
         Returns
         -------
@@ -75,20 +87,31 @@ class InstrumentModel:
             extension=extension,
             depth=depth,
             exclude_files=exclude_files,
+            index_path=index_path,
         )
 
     @property
     def path_list(self) -> list[Path]:
         """現在の設定に基づいてファイルパスの一覧を取得する.
 
+        ヘッダー索引に保存した探索結果が有効な場合（探索したディレクトリが
+        変更されていない場合）はディレクトリを走査しない。走査し直した
+        結果は索引に保存する（保存できない場合も一覧は返す）。
+
         Returns
         -------
         list[Path]
             パターンに一致するファイルパスのソート済みリスト
         """
-        path = Path(self.file_directory)
-        pattern = "*/" * self.depth + f"*{self.suffix}{self.extension}"
-        path_list = list(path.glob(pattern))
+        index = HeaderIndex.load(self._index_path(None))
+        path_list, rescanned = index.glob(
+            self.file_directory, self.depth, f"*{self.suffix}{self.extension}"
+        )
+        if rescanned:
+            try:
+                index.save()
+            except OSError:
+                pass
         if self.exclude_files:
             exclude_set = set(self.exclude_files)
             path_list = [
@@ -100,11 +123,114 @@ class InstrumentModel:
 
     @property
     def reader_list(self) -> list[STISFitsReader]:
-        """現在の設定に基づいてファイルパスの一覧を取得する.
+        """現在の設定に基づいて全ファイルの Reader を逐次に生成する.
+
+        Returns
+        -------
+        list[STISFitsReader]
+            パスのソート順に並んだ読み込み済み Reader のリスト
+        """
+        return self.reader_collection().readers
+
+    def reader_collection(
+        self,
+        lazy: bool = False,
+        max_workers: int | None = None,
+        executor: str = "thread",
+        skip_errors: bool = False,
+    ) -> ReaderCollection:
+        """現在の設定に基づいて ReaderCollection を生成する.
+
+        Parameters
+        ----------
+        lazy : bool, optional
+            各 Reader を遅延モードで開くかどうか（デフォルト: False）
+        max_workers : int or None, optional
+            並列ワーカー数。None の場合は逐次に読み込む（デフォルト: None）
+        executor : str, optional
+            並列実行方式（"thread", "process"）。デフォルト: "thread"
+        skip_errors : bool, optional
+            読み込みに失敗したファイルを除外して記録するかどうか
+            （デフォルト: False）
+
+        Returns
+        -------
+        ReaderCollection
+            パスのソート順に並んだ読み込み済みコレクション
+        """
+        return ReaderCollection.from_paths(
+            self.path_list,
+            lazy=lazy,
+            max_workers=max_workers,
+            executor=executor,
+            skip_errors=skip_errors,
+        )
+
+    def header_index(self, index_path: str | Path | None = None) -> HeaderIndex:
+        """探索結果のファイルを登録したヘッダー索引を返す.
+
+        既存の索引ファイルを読み込み、新規・変更ファイルのヘッダーのみを
+        読み込んで差分更新する。変更があった場合は索引ファイルを保存する。
+
+        Parameters
+        ----------
+        index_path : str, Path or None, optional
+            索引ファイルのパス。None の場合は ``index_path`` 属性、それも
+            None の場合はキャッシュディレクトリの `default_index_path` を使用する。
+
+        Returns
+        -------
+        HeaderIndex
+            更新済みのヘッダー索引
+        """
+        return self._updated_index(self.path_list, index_path)
+
+    def query(
+        self,
+        optical_element: str | None = None,
+        rootname: str | None = None,
+        index_path: str | Path | None = None,
+    ) -> list[Path]:
+        """ヘッダー索引を用いて条件に一致するファイルパスを返す.
+
+        ``exclude_files`` などの探索条件は `path_list` と同様に適用される。
+
+        Parameters
+        ----------
+        optical_element : str or None, optional
+            光学素子名（例: "G430L"）
+        rootname : str or None, optional
+            ルート名
+        index_path : str, Path or None, optional
+            索引ファイルのパス（`header_index` を参照）
 
         Returns
         -------
         list[Path]
-            パターンに一致するファイルパスのソート済みリスト
+            条件に一致するファイルパスのソート済みリスト
         """
-        return [STISFitsReader.open(p) for p in self.path_list]
+        path_list = self.path_list
+        index = self._updated_index(path_list, index_path)
+        return index.query(
+            path_list, optical_element=optical_element, rootname=rootname
+        )
+
+    def _index_path(self, index_path: str | Path | None) -> Path:
+        """使用する索引ファイルのパスを返す."""
+        if index_path is None:
+            index_path = self.index_path
+        if index_path is None:
+            return default_index_path(self.file_directory)
+        return Path(index_path)
+
+    def _updated_index(
+        self, path_list: list[Path], index_path: str | Path | None
+    ) -> HeaderIndex:
+        """索引を読み込み、``path_list`` で差分更新して保存する（保存できない場合も索引は返す）."""
+        index = HeaderIndex.load(self._index_path(index_path))
+        if index.update(path_list):
+            try:
+                index.save()
+            except OSError:
+                pass
+        return index
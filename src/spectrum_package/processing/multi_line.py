@@ -0,0 +1,472 @@
+"""複数輝線の同時フィッティングモデル.
+
+[OIII] 4959/5007、Hα+[NII] 6548/6583 のように同じ露出に含まれる
+複数の輝線を、1回のデータ走査で全空間ピクセルについて同時にフィットする。
+運動学（後退速度と速度分散）を全輝線で共有する拘束付きフィットにも対応する。
+
+各輝線のフィッティングウィンドウの和集合を連続区間（セグメント）に分け、
+セグメントごとに一定の連続光を持つガウス関数の和としてモデル化する。
+ウィンドウが重なる輝線（Hα と [NII] など）は同じセグメントに含まれ、
+ブレンドした輪郭として同時にフィットされる。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Self, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from .velocity import VelocityModel
+from ..util.batch_fit import BatchFitResult, levenberg_marquardt
+
+if TYPE_CHECKING:
+    from .image import ImageModel
+
+
+@dataclass(frozen=True)
+class _MultiGaussianProblem:
+    """複数ガウス関数 + セグメント別連続光のバッチモデル.
+
+    波長は基準輝線の静止波長 ``reference`` とウィンドウ半幅 ``scale`` で
+    無次元化した座標 u = (λ - reference) / scale で扱う。
+
+    パラメータの並びは、運動学を共有しない場合
+    ``[amp_1..K, center_1..K, sigma_1..K, offset_1..S]``、
+    共有する場合 ``[amp_1..K, shift, width, offset_1..S]`` である。
+    共有時の輝線 k の中心と幅は
+    ``center_k = d_k + r_k * shift``、``sigma_k = r_k * width``
+    （r_k = λ_k / reference, d_k = (λ_k - reference) / scale）となり、
+    ``shift * scale / reference`` が赤方偏移 z に等しい。
+
+    Attributes
+    ----------
+    rest_wavelengths : np.ndarray
+        各輝線の静止波長 [m] (K,)
+    reference : float
+        基準静止波長 [m]（``rest_wavelengths[0]``）
+    scale : float
+        無次元化のスケール [m]（ウィンドウ半幅）
+    rows : np.ndarray
+        フィットに使用する波長方向ピクセル (n_x,)
+    u : np.ndarray
+        使用ピクセルの無次元化波長 (n_x,)
+    segment : np.ndarray
+        各使用ピクセルのセグメント番号 (n_x,)
+    line_masks : np.ndarray
+        各輝線のウィンドウに含まれるかどうか (K, n_x)
+    tied : bool
+        運動学を共有するかどうか
+    """
+
+    rest_wavelengths: np.ndarray
+    reference: float
+    scale: float
+    rows: np.ndarray
+    u: np.ndarray
+    segment: np.ndarray
+    line_masks: np.ndarray
+    tied: bool
+
+    @classmethod
+    def from_wavelengths(
+        cls,
+        wavelengths: np.ndarray,
+        rest_wavelengths: Sequence[float],
+        window_width: float,
+        tied: bool,
+    ) -> Self:
+        """波長配列から各輝線のウィンドウとセグメントを求める.
+
+        Raises
+        ------
+        ValueError
+            ウィンドウ内に波長ピクセルが1つもない輝線がある場合
+        """
+        rest = np.asarray(rest_wavelengths, dtype=float)
+        line_masks_full = np.abs(wavelengths[np.newaxis, :] - rest[:, np.newaxis]) <= window_width
+        empty = rest[~np.any(line_masks_full, axis=1)]
+        if len(empty):
+            raise ValueError(
+                f"ウィンドウ内に波長ピクセルがない輝線があります: {empty.tolist()} m. "
+                f"波長範囲: [{wavelengths.min():.6e}, {wavelengths.max():.6e}] m"
+            )
+        rows = np.flatnonzero(np.any(line_masks_full, axis=0))
+        segment = np.concatenate([[0], np.cumsum(np.diff(rows) > 1)]) if len(rows) else rows
+        reference = float(rest[0])
+        return cls(
+            rest_wavelengths=rest,
+            reference=reference,
+            scale=window_width,
+            rows=rows,
+            u=(wavelengths[rows] - reference) / window_width,
+            segment=segment,
+            line_masks=line_masks_full[:, rows],
+            tied=tied,
+        )
+
+    @property
+    def n_lines(self) -> int:
+        """輝線数 K."""
+        return len(self.rest_wavelengths)
+
+    @property
+    def n_segments(self) -> int:
+        """連続光セグメント数 S."""
+        return int(self.segment[-1]) + 1 if len(self.segment) else 0
+
+    @property
+    def _ratio(self) -> np.ndarray:
+        return self.rest_wavelengths / self.reference
+
+    @property
+    def _shift(self) -> np.ndarray:
+        return (self.rest_wavelengths - self.reference) / self.scale
+
+    @property
+    def _line_segment(self) -> np.ndarray:
+        """各輝線の静止波長に最も近い使用ピクセルのセグメント番号 (K,)."""
+        return self.segment[
+            np.argmin(np.abs(self.u[np.newaxis, :] - self._shift[:, np.newaxis]), axis=1)
+        ]
+
+    def unpack(self, params: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """パラメータ配列を (amp, center, sigma, offset) に分解する.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            各 (n_batch, K) の amp, center, sigma（無次元）と
+            (n_batch, S) の offset
+        """
+        k = self.n_lines
+        amp = params[:, :k]
+        if self.tied:
+            center = self._shift + self._ratio * params[:, [k]]
+            sigma = self._ratio * params[:, [k + 1]]
+            offset = params[:, k + 2:]
+        else:
+            center = params[:, k:2 * k]
+            sigma = params[:, 2 * k:3 * k]
+            offset = params[:, 3 * k:]
+        return amp, center, sigma, offset
+
+    def model(self, u: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """バッチモデル関数 (n_batch, n_x)."""
+        amp, center, sigma, offset = self.unpack(params)
+        z = (u[np.newaxis, np.newaxis, :] - center[:, :, np.newaxis]) / sigma[:, :, np.newaxis]
+        lines = amp[:, :, np.newaxis] * np.exp(-0.5 * z**2)
+        return lines.sum(axis=1) + offset[:, self.segment]
+
+    def jacobian(self, u: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """バッチモデルの解析的ヤコビアン (n_batch, n_x, n_params)."""
+        k = self.n_lines
+        amp, center, sigma, _ = self.unpack(params)
+        z = (u[np.newaxis, np.newaxis, :] - center[:, :, np.newaxis]) / sigma[:, :, np.newaxis]
+        g = np.exp(-0.5 * z**2)
+        d_amp = g
+        d_center = amp[:, :, np.newaxis] * g * z / sigma[:, :, np.newaxis]
+        d_sigma = amp[:, :, np.newaxis] * g * z**2 / sigma[:, :, np.newaxis]
+
+        jac = np.zeros((params.shape[0], len(u), params.shape[1]))
+        jac[:, :, :k] = d_amp.transpose(0, 2, 1)
+        if self.tied:
+            ratio = self._ratio[np.newaxis, :, np.newaxis]
+            jac[:, :, k] = np.sum(d_center * ratio, axis=1)
+            jac[:, :, k + 1] = np.sum(d_sigma * ratio, axis=1)
+            first_offset = k + 2
+        else:
+            jac[:, :, k:2 * k] = d_center.transpose(0, 2, 1)
+            jac[:, :, 2 * k:3 * k] = d_sigma.transpose(0, 2, 1)
+            first_offset = 3 * k
+        jac[:, np.arange(len(u)), first_offset + self.segment] = 1.0
+        return jac
+
+    def initial_guess(self, flux: np.ndarray) -> np.ndarray:
+        """全列の初期パラメータを推定する.
+
+        各輝線のウィンドウ内ピークから赤方偏移の候補を求め、その赤方偏移で
+        予測される全輝線中心のフラックスの和が最大となる候補を採用する。
+        他の輝線の中心はその赤方偏移から予測する（ブレンドした輝線で
+        同じピークを重複して拾わないようにするため）。
+
+        Parameters
+        ----------
+        flux : np.ndarray
+            使用ピクセルのフラックス (n_batch, n_x)
+
+        Returns
+        -------
+        np.ndarray
+            初期パラメータ (n_batch, n_params)
+        """
+        n_batch = flux.shape[0]
+        k = self.n_lines
+        offset = np.column_stack([
+            np.median(flux[:, self.segment == s], axis=1) for s in range(self.n_segments)
+        ])
+        line_flux = flux - offset[:, self.segment]
+
+        peaks = np.where(self.line_masks[np.newaxis], line_flux[:, np.newaxis, :], -np.inf)
+        peak_idx = np.argmax(peaks, axis=2)  # (n_batch, K)
+        peak_val = np.take_along_axis(line_flux, peak_idx, axis=1)
+        # 候補 j: 輝線 j のピークから求めた基準輝線の無次元シフト (n_batch, K)
+        candidates = (self.u[peak_idx] - self._shift) / self._ratio
+
+        step = np.median(np.diff(self.u)) if len(self.u) > 1 else 1.0
+        scores = np.zeros((n_batch, k))
+        for j in range(k):
+            center_j = self._shift + self._ratio * candidates[:, [j]]
+            flux_j, inside = self._flux_at(line_flux, center_j, step)
+            scores[:, j] = np.sum(np.where(inside, np.clip(flux_j, 0, None), 0.0), axis=1)
+        shift = np.take_along_axis(candidates, np.argmax(scores, axis=1)[:, np.newaxis], axis=1)[:, 0]
+
+        center = self._shift + self._ratio * shift[:, np.newaxis]
+        flux_at_center, _ = self._flux_at(line_flux, center, step)
+        amp = np.maximum(flux_at_center, 1e-3 * np.abs(peak_val).max(axis=1, keepdims=True))
+        width = np.full(n_batch, 0.25)
+
+        if self.tied:
+            return np.column_stack([amp, shift, width, offset])
+        sigma = self._ratio * width[:, np.newaxis]
+        return np.column_stack([amp, center, sigma, offset])
+
+    def _flux_at(
+        self, line_flux: np.ndarray, center: np.ndarray, step: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """各列の指定位置に最も近い使用ピクセルのフラックスを返す.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            (フラックス (n_batch, K), 最近傍ピクセルが 1.5 ピクセル以内にあるか)
+        """
+        distance = np.abs(self.u[np.newaxis, np.newaxis, :] - center[:, :, np.newaxis])
+        nearest = np.argmin(distance, axis=2)
+        inside = np.take_along_axis(distance, nearest[:, :, np.newaxis], axis=2)[:, :, 0] <= 1.5 * step
+        return np.take_along_axis(line_flux, nearest, axis=1), inside
+
+    @property
+    def n_params(self) -> int:
+        """パラメータ数."""
+        return (self.n_lines + 2 if self.tied else 3 * self.n_lines) + self.n_segments
+
+    def extract(self, data: np.ndarray) -> np.ndarray:
+        """使用ピクセルのフラックスを1回の読み出しで取り出す.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            スペクトルデータ（2D: [波長, 空間位置]）
+
+        Returns
+        -------
+        np.ndarray
+            使用ピクセルのフラックス (n_spatial, n_x)
+        """
+        return np.asarray(data[self.rows], dtype=float).T
+
+    def fit(self, data: np.ndarray) -> tuple[np.ndarray, BatchFitResult | None]:
+        """全空間ピクセルを一括フィットする.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            スペクトルデータ（2D: [波長, 空間位置]）。使用ピクセルのみを
+            1回の読み出しで取り出す。
+
+        Returns
+        -------
+        tuple[np.ndarray, BatchFitResult | None]
+            (各輝線の [amp, center, sigma, offset] [m] (K, n_spatial, 4),
+             バッチフィットの生の結果)。`fit_flux` を参照。
+        """
+        return self.fit_flux(self.extract(data))
+
+    def fit_flux(
+        self, flux: np.ndarray, p0: np.ndarray | None = None
+    ) -> tuple[np.ndarray, BatchFitResult | None]:
+        """取り出し済みのフラックスを一括フィットする.
+
+        Parameters
+        ----------
+        flux : np.ndarray
+            使用ピクセルのフラックス (n_spatial, n_x)
+        p0 : np.ndarray or None, optional
+            初期パラメータ (n_spatial, n_params)。None の場合は
+            `initial_guess` で推定する（デフォルト: None）
+
+        Returns
+        -------
+        tuple[np.ndarray, BatchFitResult | None]
+            (各輝線の [amp, center, sigma, offset] [m] (K, n_spatial, 4),
+             無次元パラメータでのバッチフィット結果)。
+            収束しなかったピクセル、および中心がウィンドウ外にある輝線は NaN。
+            データ点がパラメータ数に満たない場合、フィット結果は None。
+        """
+        n_spatial = flux.shape[0]
+        k = self.n_lines
+        line_params = np.full((k, n_spatial, 4), np.nan)
+        if len(self.rows) < self.n_params:
+            return line_params, None
+
+        if p0 is None:
+            p0 = self.initial_guess(flux)
+        result = levenberg_marquardt(self.model, self.jacobian, self.u, flux, p0)
+        raw = np.where(result.converged[:, np.newaxis], result.params, np.nan)
+        amp, center, sigma, offset = self.unpack(raw)
+
+        # 中心が自身のウィンドウ外、または幅が不正な輝線は無効とする
+        # （ブレンド中の弱い輝線で振幅が 0 に縮退した場合など）
+        implausible = (np.abs(center - self._shift) > 1.0) | ~(
+            (np.abs(sigma) > 0) & (np.abs(sigma) <= 2.0)
+        )
+        amp = np.where(implausible, np.nan, amp)
+        center = np.where(implausible, np.nan, center)
+
+        # 各輝線の連続光は、その輝線中心に最も近いピクセルのセグメントの値とする
+        line_params[:, :, 0] = amp.T
+        line_params[:, :, 1] = (self.reference + center * self.scale).T
+        line_params[:, :, 2] = (np.abs(sigma) * self.scale).T
+        line_params[:, :, 3] = offset[:, self._line_segment].T
+        return line_params, result
+
+    def shared_params(self, result: BatchFitResult | None, n_spatial: int) -> np.ndarray:
+        """運動学を共有したフィットの共通パラメータを基準輝線の単位で返す.
+
+        共通の ``shift`` と ``width`` から基準輝線の中心と幅を求める。
+        振幅と連続光は基準輝線のものとする。個々の輝線の妥当性判定とは
+        独立で、基準輝線が弱く振幅が縮退した列でも共通の運動学は残る。
+
+        Parameters
+        ----------
+        result : BatchFitResult or None
+            `fit_flux` が返したバッチフィット結果
+        n_spatial : int
+            空間ピクセル数（``result`` が None の場合に使用）
+
+        Returns
+        -------
+        np.ndarray
+            [amp, center, sigma, offset] [m] (n_spatial, 4)。収束しなかった列、
+            共通の中心がウィンドウ外の列、幅が不正な列は NaN。
+
+        Raises
+        ------
+        ValueError
+            運動学を共有しないモデルの場合
+        """
+        if not self.tied:
+            raise ValueError("運動学を共有しないモデルには共通パラメータがありません")
+        params = np.full((n_spatial, 4), np.nan)
+        if result is None:
+            return params
+        k = self.n_lines
+        raw = np.where(result.converged[:, np.newaxis], result.params, np.nan)
+        shift, width = raw[:, k], raw[:, k + 1]
+        plausible = (np.abs(shift) <= 1.0) & (np.abs(width) > 0) & (np.abs(width) <= 2.0)
+        params[:, 0] = raw[:, 0]
+        params[:, 1] = np.where(plausible, self.reference + shift * self.scale, np.nan)
+        params[:, 2] = np.where(plausible, np.abs(width) * self.scale, np.nan)
+        params[:, 3] = raw[:, k + 2 + self._line_segment[0]]
+        return params
+
+
+@dataclass(frozen=True)
+class MultiLineVelocityModel:
+    """複数輝線の同時フィッティング結果.
+
+    Attributes
+    ----------
+    rest_wavelengths : tuple[float, ...]
+        各輝線の静止波長 [m]
+    line_models : list[VelocityModel]
+        各輝線の後退速度モデル（``rest_wavelengths`` と同じ順序）
+    joint : VelocityModel or None
+        運動学を共有してフィットした場合の共通後退速度モデル。
+        共有した後退速度パラメータから、基準輝線 ``rest_wavelengths[0]`` の
+        観測波長として表す。運動学を共有しない場合は None。
+    tied : bool
+        運動学を共有してフィットしたかどうか
+    """
+
+    rest_wavelengths: tuple[float, ...]
+    line_models: list[VelocityModel]
+    joint: VelocityModel | None
+    tied: bool
+
+    def __repr__(self) -> str:
+        lines = ", ".join(f"{w:.4e}" for w in self.rest_wavelengths)
+        return f"MultiLineVelocityModel(rest_wavelengths=[{lines}] m, tied={self.tied})"
+
+    def __len__(self) -> int:
+        return len(self.line_models)
+
+    def __getitem__(self, index: int) -> VelocityModel:
+        return self.line_models[index]
+
+    @classmethod
+    def from_image(
+        cls,
+        image: ImageModel,
+        rest_wavelengths: Sequence[float],
+        window_width: float,
+        tie_kinematics: bool = True,
+        slit_offset: float = 0.0,
+        pixel_scale: float = 0.05,
+    ) -> Self:
+        """ImageModel の全輝線を1回の走査で同時にフィットする.
+
+        Parameters
+        ----------
+        image : ImageModel
+            スペクトルデータを持つ ImageModel
+        rest_wavelengths : Sequence[float]
+            各輝線の静止波長 [m]。先頭を基準輝線とする。
+        window_width : float
+            各輝線のフィッティングウィンドウの半幅 [m]
+        tie_kinematics : bool, optional
+            全輝線で後退速度と速度分散を共有するかどうか（デフォルト: True）
+        slit_offset : float, optional
+            スリットの垂直方向オフセット [arcsec]（デフォルト: 0.0）
+        pixel_scale : float, optional
+            空間方向の1ピクセルあたりのスケール [arcsec/pixel]
+            （STIS デフォルト: 0.05 arcsec/pixel）
+
+        Returns
+        -------
+        MultiLineVelocityModel
+            各輝線および共通の後退速度モデル
+
+        Raises
+        ------
+        ValueError
+            輝線が指定されていない場合、またはウィンドウ内に波長ピクセルが
+            1つもない輝線がある場合
+        """
+        if len(rest_wavelengths) == 0:
+            raise ValueError("rest_wavelengths に少なくとも1本の輝線を指定してください")
+        problem = _MultiGaussianProblem.from_wavelengths(
+            image.header.spectrogram.wavelength_array,
+            rest_wavelengths,
+            window_width,
+            tied=tie_kinematics,
+        )
+        line_params, result = problem.fit(image.spectrum.data)
+
+        line_models = [
+            VelocityModel._from_params(params, image, float(rest), slit_offset, pixel_scale)
+            for params, rest in zip(line_params, problem.rest_wavelengths)
+        ]
+        joint = None
+        if tie_kinematics:
+            joint = VelocityModel._from_params(
+                problem.shared_params(result, line_params.shape[1]),
+                image, problem.reference, slit_offset, pixel_scale,
+            )
+        return cls(
+            rest_wavelengths=tuple(float(w) for w in rest_wavelengths),
+            line_models=line_models,
+            joint=joint,
+            tied=tie_kinematics,
+        )
@@ -0,0 +1,243 @@
+"""多層の物理量マップモデル.
+
+複数のスリットの VelocityModel から、後退速度・速度分散・輝線フラックス・
+連続光などの物理量を同じグリッドへまとめて補間し、多層のマップを生成する。
+
+全物理量で標本点（後退速度が有効な空間位置 × スリットオフセット）と
+補間先グリッドが共通なので、各物理量を (N, 物理量数) の1つの配列に
+積み重ねて補間を1回だけ行う。"linear" では三角形分割と重心座標の重みを
+1回だけ求め、全層に同じ重みを適用する。``max_memory`` を指定すると
+`VelocityMap` と同様にグリッドを行方向のタイルに分けて補間する。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Callable, Mapping, Self, Sequence
+
+import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+import numpy as np
+
+from .velocity import VelocityModel
+from .velocity_map import _evaluate_tiled, _grid_coords, _map_axes, _scatter_points
+from ..util.interpolation import Interpolator, get_interpolator
+
+#: 物理量名から、VelocityModel の空間位置ごとの値を返す関数へのマッピング
+QUANTITIES: dict[str, Callable[[VelocityModel], np.ndarray]] = {
+    "velocity": attrgetter("velocities"),
+    "sigma": attrgetter("sigma_velocities"),
+    "flux": attrgetter("line_fluxes"),
+    "continuum": attrgetter("continua"),
+}
+
+#: 物理量名から描画時の (単位換算係数, カラーバーのラベル) へのマッピング
+_PLOT_UNITS: dict[str, tuple[float, str]] = {
+    "velocity": (1e-3, "Velocity [km/s]"),
+    "sigma": (1e-3, r"$\sigma$ [km/s]"),
+    "flux": (1.0, "Line flux"),
+    "continuum": (1.0, "Continuum"),
+}
+
+
+@dataclass(frozen=True)
+class QuantityMap:
+    """多層の物理量マップモデル.
+
+    Attributes
+    ----------
+    velocity_models : list[VelocityModel]
+        各スリットの VelocityModel リスト
+    names : tuple[str, ...]
+        各層の物理量名
+    layers : np.ndarray
+        補間された物理量 (n_layers, ny, nx)
+    x_coords : np.ndarray
+        グリッドの X 座標（スリット方向, arcsec）。2D meshgrid または 1D の軸
+    y_coords : np.ndarray
+        グリッドの Y 座標（スリット垂直方向, arcsec）。2D meshgrid または 1D の軸
+    interpolation_method : str or Interpolator
+        使用した補間方法名（インスタンスを指定した場合はそのインスタンス）
+    grid_resolution : int or None
+        生成時に指定したスリット垂直方向のグリッド解像度
+    grid_spacing : float or None
+        生成時に指定したグリッドの間隔 [arcsec]
+    """
+
+    velocity_models: list[VelocityModel]
+    names: tuple[str, ...]
+    layers: np.ndarray
+    x_coords: np.ndarray
+    y_coords: np.ndarray
+    interpolation_method: str | Interpolator
+    grid_resolution: int | None = None
+    grid_spacing: float | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"QuantityMap(n_slits={len(self.velocity_models)}, "
+            f"layers={list(self.names)}, "
+            f"grid_shape={self.layers.shape[1:]}, "
+            f"method={self.interpolation_method!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """物理量名に対応する層 (ny, nx) を返す.
+
+        Raises
+        ------
+        KeyError
+            存在しない物理量名が指定された場合
+        """
+        if name not in self.names:
+            raise KeyError(f"未知の物理量: '{name}'. 利用可能: {list(self.names)}")
+        return self.layers[self.names.index(name)]
+
+    @classmethod
+    def from_velocity_models(
+        cls,
+        models: list[VelocityModel],
+        quantities: Sequence[str] | Mapping[str, Sequence[np.ndarray]] = (
+            "velocity", "sigma", "flux", "continuum",
+        ),
+        method: str | Interpolator = "linear",
+        grid_resolution: int | None = None,
+        grid_spacing: float | None = None,
+        max_memory: int | None = None,
+        store_axes: bool = False,
+    ) -> Self:
+        """VelocityModel リストから多層の物理量マップを生成する.
+
+        標本点は後退速度が有効な空間位置とし（`VelocityMap` と同じ）、
+        その点で NaN となる物理量はその付近の補間結果が NaN となる。
+
+        Parameters
+        ----------
+        models : list[VelocityModel]
+            各スリットの VelocityModel リスト
+        quantities : Sequence[str] or Mapping[str, Sequence[np.ndarray]], optional
+            補間する物理量。`QUANTITIES` の物理量名の列、または物理量名から
+            各スリットの空間位置ごとの値の配列（``models`` と同じ順序）への
+            マッピング。デフォルト: ("velocity", "sigma", "flux", "continuum")
+        method : str or Interpolator, optional
+            補間メソッド名（"linear", "nearest", "cubic", "rectilinear",
+            "idw", "natural"）、または Interpolator のインスタンス
+            （`get_interpolator` を参照）。デフォルト: "linear"
+        grid_resolution : int, optional
+            スリット垂直方向のグリッドの解像度（`VelocityMap` を参照）
+        grid_spacing : float or None, optional
+            グリッドの間隔 [arcsec]（`VelocityMap` を参照）
+        max_memory : int or None, optional
+            補間の中間配列に使用するメモリの目安 [byte]。全層の分を含む
+            （`VelocityMap` を参照）
+        store_axes : bool, optional
+            1D の軸のみを保持するかどうか（`VelocityMap` を参照）
+
+        Returns
+        -------
+        QuantityMap
+            補間された多層の物理量マップ
+
+        Raises
+        ------
+        ValueError
+            未知の物理量名、または物理量が指定されていない場合
+        """
+        if isinstance(quantities, Mapping):
+            stacks = {name: list(per_slit) for name, per_slit in quantities.items()}
+        else:
+            unknown = [name for name in quantities if name not in QUANTITIES]
+            if unknown:
+                raise ValueError(
+                    f"未知の物理量: {unknown}. 利用可能: {list(QUANTITIES.keys())}"
+                )
+            stacks = {
+                name: [QUANTITIES[name](model) for model in models] for name in quantities
+            }
+        if not stacks:
+            raise ValueError("quantities に少なくとも1つの物理量を指定してください")
+
+        interpolator = get_interpolator(method)
+        points, _ = _scatter_points(models)
+        valid = [~np.isnan(model.velocities) for model in models]
+        values = np.column_stack([
+            np.concatenate([np.asarray(v, dtype=float)[m] for v, m in zip(per_slit, valid)])
+            for per_slit in stacks.values()
+        ])
+        x_axis, y_axis = _map_axes(points, models, grid_resolution, grid_spacing)
+
+        # 全物理量を1回の補間で求める: (ny, nx, n_layers)
+        interpolated = _evaluate_tiled(
+            interpolator, points, values, x_axis, y_axis, max_memory
+        )
+        x_coords, y_coords = _grid_coords(x_axis, y_axis, store_axes)
+
+        return cls(
+            velocity_models=models,
+            names=tuple(stacks.keys()),
+            layers=np.moveaxis(interpolated, -1, 0),
+            x_coords=x_coords,
+            y_coords=y_coords,
+            interpolation_method=method,
+            grid_resolution=grid_resolution,
+            grid_spacing=grid_spacing,
+        )
+
+    def plot(
+        self,
+        name: str,
+        ax: Axes | None = None,
+        cmap: str = "viridis",
+        **kwargs: object,
+    ) -> Axes:
+        """指定した物理量の層をカラーマップとして描画する.
+
+        Parameters
+        ----------
+        name : str
+            描画する物理量名
+        ax : Axes or None, optional
+            描画先の matplotlib Axes。None の場合は新規作成。
+        cmap : str, optional
+            カラーマップ名（デフォルト: "viridis"）
+        **kwargs : object
+            `pcolormesh` に渡す追加キーワード引数
+
+        Returns
+        -------
+        Axes
+            物理量マップが描画された Axes オブジェクト
+
+        Raises
+        ------
+        KeyError
+            存在しない物理量名が指定された場合
+        """
+        layer = self[name]
+        scale, label = _PLOT_UNITS.get(name, (1.0, name))
+
+        if ax is None:
+            _, ax = plt.subplots()
+
+        im = ax.pcolormesh(
+            self.x_coords,
+            self.y_coords,
+            layer * scale,
+            cmap=cmap,
+            shading="auto",
+            **kwargs,  # type: ignore
+        )
+        plt.colorbar(im, ax=ax, label=label)
+
+        ax.set_xlabel("Slit position [arcsec]")
+        ax.set_ylabel("Slit offset [arcsec]")
+        ax.set_title(f"2D Map — {name}", fontsize=10)
+        ax.set_aspect("equal")
+        return ax
@@ -41,18 +41,20 @@ class SpectrumBase:
         return f"SpectrumBase(data={self.data.shape}, error={self.error.shape}, quality={self.quality.shape})"
 
     @classmethod
-    def from_reader(cls, reader: STISFitsReader) -> Self:
+    def from_reader(cls, reader: STISFitsReader, rows: slice | None = None) -> Self:
         """STISFitsReader からスペクトルデータを生成する.
 
         Parameters
         ----------
         reader : STISFitsReader
             読み込み済みの Reader インスタンス
+        rows : slice or None, optional
+            読み込む波長方向ピクセルの範囲。None の場合は全体（デフォルト: None）
 
         Returns
         -------
         SpectrumBase
             ロードされたスペクトルデータ
         """
-        data, error, quality = reader.spectrum_data()
+        data, error, quality = reader.spectrum_data(rows)
         return cls(data=data, error=error, quality=quality)
@@ -2,23 +2,101 @@
 
 スペクトルデータから輝線のガウスフィッティングを行い、
 赤方偏移と後退速度を計算する。
+
+フィッティングエンジンは `VelocityModel.from_image` の ``method`` で選択する。
+
+- ``"gaussian"``: 空間ピクセルごとに `scipy.optimize.curve_fit` を実行する
+- ``"gaussian_batch"``: 全空間ピクセルを Levenberg–Marquardt 法で一括フィットする
+- ``"moment"``: 連続光を差し引いたフラックスの重み付き1次モーメント（重心）
+- ``"caruana"``: ピーク近傍3点の対数放物線による頂点推定（Caruana 法）
+- ``"log_gaussian"``: 対数フラックスへの2次多項式の重み付き線形最小二乗
+
+後半の3つは反復を伴わない閉形式の推定量で、全空間ピクセルを一括で計算する。
+
+``use_error`` / ``dq_mask`` を指定すると、統計的誤差（HDU 2）による重み
+1/σ² と品質フラグ（HDU 3）による除外を、ウィンドウ内のデータ全体に対して
+一括で求めた重み配列として各エンジンに渡す。
+
+``max_workers`` を指定すると、空間ピクセルを列チャンクに分割して
+プロセスプールで並列にフィットする（`VelocityModel.from_images` では
+複数スリットのチャンクを1つのプールにまとめて投入する）。
+
+各エンジンは空間ピクセルごとのフィット時間・関数評価回数・収束状態・
+失敗の分類を `DIAGNOSTICS_DTYPE` の構造化配列に記録し、
+`VelocityModel.diagnostics` として返す（集計は `VelocityModel.diagnostics_summary`）。
 """
 
 from __future__ import annotations
 
+import hashlib
+import inspect
+import os
+import time
+import warnings
 from dataclasses import dataclass
-from typing import Self, TYPE_CHECKING
+from pathlib import Path
+from typing import Any, Callable, Self, TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
 import numpy as np
 from scipy.optimize import curve_fit  # type: ignore
 
+from .binning import SpatialBinning
+from ..util.batch_fit import levenberg_marquardt
 from ..util.constants import ANGSTROM_TO_METER, SPEED_OF_LIGHT
+from ..util.parallel import parallel_map
+from ..util.result_cache import ResultCache, cache_key
 
 if TYPE_CHECKING:
     from .image import ImageModel
 
+#: フィット診断情報の構造化配列の dtype（空間ピクセルごとに1レコード）。
+#: ``time`` はフィットに要した時間 [s]（一括で計算するエンジンでは全体の
+#: 時間を列数で割った値）、``nfev`` はモデル関数の評価回数、``converged`` は
+#: 収束したかどうか、``failure`` は失敗の分類（成功は空文字列）。
+DIAGNOSTICS_DTYPE: np.dtype = np.dtype([
+    ("time", "f8"),
+    ("nfev", "i8"),
+    ("converged", "?"),
+    ("failure", "U16"),
+])
+
+#: 失敗の分類。
+#:
+#: - ``"too_few_points"``: ウィンドウ内の有効なデータ点がパラメータ数に満たない
+#: - ``"maxfev"``: 関数評価回数（反復回数）の上限に達しても収束しない
+#: - ``"bad_bounds"``: 収束したが、中心がウィンドウ外または幅が範囲外
+#:   （パラメータはそのまま返す）
+#: - ``"invalid"``: その他の理由で解が得られない（非有限値・特異な問題など）
+#: - ``"excluded"``: ビニングで除外されフィットしなかった
+FAILURE_CATEGORIES: tuple[str, ...] = (
+    "too_few_points", "maxfev", "bad_bounds", "invalid", "excluded",
+)
+
+#: "gaussian" の curve_fit における関数評価回数の上限
+_CURVE_FIT_MAXFEV: int = 5000
+
+#: "gaussian_batch" の Levenberg–Marquardt 法の反復回数の上限
+_BATCH_MAX_ITER: int = 200
+
+
+class _FitFailure(RuntimeError):
+    """失敗の分類と関数評価回数を持つフィッティングの失敗.
+
+    Attributes
+    ----------
+    category : str
+        失敗の分類（`FAILURE_CATEGORIES` のいずれか）
+    nfev : int
+        失敗までに要したモデル関数の評価回数
+    """
+
+    def __init__(self, message: str, category: str, nfev: int = 0) -> None:
+        super().__init__(message)
+        self.category = category
+        self.nfev = nfev
+
 
 def _gaussian(x: np.ndarray, amp: float, center: float, sigma: float, offset: float) -> np.ndarray:
     """ガウス関数モデル.
@@ -44,6 +122,273 @@ def _gaussian(x: np.ndarray, amp: float, center: float, sigma: float, offset: fl
     return amp * np.exp(-0.5 * ((x - center) / sigma) ** 2) + offset  # type: ignore
 
 
+def _gaussian_jacobian(
+    x: np.ndarray, amp: float, center: float, sigma: float, offset: float
+) -> np.ndarray:
+    """`_gaussian` のパラメータに関する解析的ヤコビアン.
+
+    `curve_fit` の ``jac`` 引数に渡すことで、数値微分のための
+    追加のモデル評価を省く。
+
+    Parameters
+    ----------
+    x : np.ndarray
+        入力値（波長配列）
+    amp, center, sigma, offset : float
+        `_gaussian` のパラメータ
+
+    Returns
+    -------
+    np.ndarray
+        ヤコビアン (len(x), 4)。列は (amp, center, sigma, offset) の順。
+    """
+    u = (x - center) / sigma
+    g = np.exp(-0.5 * u**2)
+    jac = np.empty((len(x), 4))
+    jac[:, 0] = g
+    jac[:, 1] = amp * g * u / sigma
+    jac[:, 2] = amp * g * u**2 / sigma
+    jac[:, 3] = 1.0
+    return jac
+
+
+@dataclass(frozen=True)
+class _GaussianFitContext:
+    """1組の (画像, 輝線) に対するガウスフィッティングの前計算結果.
+
+    波長軸は画像内の全空間ピクセルで共通なので、フィッティング
+    ウィンドウのピクセル範囲と波長配列を一度だけ求めて再利用する。
+
+    Attributes
+    ----------
+    rest_wavelength : float
+        輝線の静止波長 [m]
+    window_width : float
+        フィッティングウィンドウの半幅 [m]
+    window : slice | np.ndarray
+        ウィンドウ内の波長方向ピクセル。連続している場合は slice
+        （データのコピーを伴わない）、それ以外はインデックス配列。
+    wave_window : np.ndarray
+        ウィンドウ内の波長配列 [m]
+    """
+
+    rest_wavelength: float
+    window_width: float
+    window: slice | np.ndarray
+    wave_window: np.ndarray
+
+    @classmethod
+    def from_wavelengths(
+        cls,
+        wavelengths: np.ndarray,
+        rest_wavelength: float,
+        window_width: float,
+    ) -> Self:
+        """波長配列からフィッティングウィンドウを求める.
+
+        Parameters
+        ----------
+        wavelengths : np.ndarray
+            波長配列 [m]
+        rest_wavelength : float
+            輝線の静止波長 [m]
+        window_width : float
+            フィッティングウィンドウの半幅 [m]
+
+        Returns
+        -------
+        _GaussianFitContext
+            前計算済みのフィッティング条件
+        """
+        mask = (wavelengths >= rest_wavelength - window_width) & (
+            wavelengths <= rest_wavelength + window_width
+        )
+        rows = np.flatnonzero(mask)
+        window: slice | np.ndarray = rows
+        if len(rows) > 0 and rows[-1] - rows[0] + 1 == len(rows):
+            window = slice(int(rows[0]), int(rows[-1]) + 1)
+        return cls(
+            rest_wavelength=rest_wavelength,
+            window_width=window_width,
+            window=window,
+            wave_window=wavelengths[window],
+        )
+
+    @property
+    def n_points(self) -> int:
+        """ウィンドウ内のデータ点数."""
+        return len(self.wave_window)
+
+    def initial_guess(self, flux_window: np.ndarray) -> list[float]:
+        """ウィンドウ内のフラックスから初期パラメータを推定する.
+
+        Parameters
+        ----------
+        flux_window : np.ndarray
+            ウィンドウ内のフラックス配列
+
+        Returns
+        -------
+        list[float]
+            [amp, center, sigma, offset] の初期値
+        """
+        offset_guess = float(np.median(flux_window))
+        amp_guess = float(np.max(flux_window) - offset_guess)
+        center_guess = float(self.wave_window[np.argmax(flux_window)])
+        sigma_guess = self.window_width / 4.0
+        return [amp_guess, center_guess, sigma_guess, offset_guess]
+
+    def is_plausible(self, popt: np.ndarray) -> bool:
+        """フィット結果がウィンドウ内の輝線として妥当かどうかを返す.
+
+        中心がウィンドウ内にあり、幅が正かつウィンドウ幅以下であることを確認する。
+        """
+        if not np.all(np.isfinite(popt)):
+            return False
+        _, center, sigma, _ = popt
+        return bool(
+            abs(center - self.rest_wavelength) <= self.window_width
+            and 0 < abs(sigma) <= 2 * self.window_width
+        )
+
+    def plausible_rows(self, params: np.ndarray) -> np.ndarray:
+        """`is_plausible` を (n_spatial, 4) のパラメータの各行に適用する."""
+        center, sigma = params[:, 1], np.abs(params[:, 2])
+        with np.errstate(invalid="ignore"):
+            return (
+                (np.abs(center - self.rest_wavelength) <= self.window_width)
+                & (sigma > 0)
+                & (sigma <= 2 * self.window_width)
+            )
+
+    def valid_counts(self, n_spatial: int, weights: np.ndarray | None) -> np.ndarray:
+        """各空間ピクセルのウィンドウ内の有効なデータ点数 (n_spatial,)."""
+        if weights is None:
+            return np.full(n_spatial, self.n_points)
+        return np.count_nonzero(np.asarray(weights[self.window]) > 0, axis=0)
+
+    def fit(
+        self, flux: np.ndarray, p0: list[float] | np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """1本のスペクトルにガウスフィッティングを行う.
+
+        Parameters
+        ----------
+        flux : np.ndarray
+            フラックス配列（1D, 波長方向, ウィンドウ切り出し前）
+        p0 : list[float], np.ndarray or None, optional
+            初期パラメータ [amp, center, sigma, offset]。
+            None の場合は `initial_guess` で推定する（デフォルト: None）
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            (フィッティングパラメータ popt,
+             ウィンドウ内の波長配列, ウィンドウ内のフラックス配列)
+
+        Raises
+        ------
+        RuntimeError
+            データ点が不足している場合、またはフィッティングが収束しなかった場合
+        """
+        flux_window = flux[self.window]
+        return self.fit_window(flux_window, p0), self.wave_window, flux_window
+
+    def fit_window(
+        self,
+        flux_window: np.ndarray,
+        p0: list[float] | np.ndarray | None = None,
+        sigma: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """ウィンドウ内のフラックスにガウスフィッティングを行う.
+
+        Parameters
+        ----------
+        flux_window : np.ndarray
+            ウィンドウ内のフラックス配列
+        p0 : list[float], np.ndarray or None, optional
+            初期パラメータ [amp, center, sigma, offset]。
+            None の場合は `initial_guess` で推定する（デフォルト: None）
+        sigma : np.ndarray or None, optional
+            各点の誤差。inf の点はフィッティングに寄与しない。
+            None の場合は重みなし（デフォルト: None）
+
+        Returns
+        -------
+        np.ndarray
+            フィッティングパラメータ popt
+
+        Raises
+        ------
+        RuntimeError
+            有効なデータ点が不足している場合、またはフィッティングが
+            収束しなかった場合
+        """
+        popt, _ = self.fit_window_nfev(flux_window, p0, sigma)
+        return popt
+
+    def fit_window_nfev(
+        self,
+        flux_window: np.ndarray,
+        p0: list[float] | np.ndarray | None = None,
+        sigma: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, int]:
+        """`fit_window` と同じフィットを行い、関数評価回数とともに返す.
+
+        フラックスが非有限の点は誤差 inf の点と同様にフィットから除外する。
+
+        Returns
+        -------
+        tuple[np.ndarray, int]
+            (フィッティングパラメータ popt, モデル関数の評価回数)
+
+        Raises
+        ------
+        _FitFailure
+            有効なデータ点が不足している場合（"too_few_points"）、
+            評価回数の上限に達した場合（"maxfev"）、またはその他の理由で
+            収束しなかった場合（"invalid"）
+        """
+        bad = ~np.isfinite(flux_window)
+        if np.any(bad):
+            sigma = np.where(bad, np.inf, 1.0 if sigma is None else sigma)
+            fill = np.median(flux_window[~bad]) if not np.all(bad) else 0.0
+            flux_window = np.where(bad, fill, flux_window)
+        n_valid = self.n_points if sigma is None else int(np.count_nonzero(np.isfinite(sigma)))
+        if n_valid < 4:
+            raise _FitFailure(
+                f"フィッティングウィンドウ内のデータ点が不足しています "
+                f"({n_valid} 点, 最低 4 点必要)",
+                "too_few_points",
+            )
+
+        if p0 is None:
+            p0 = self.initial_guess(flux_window)
+
+        try:
+            popt, _, info, _, _ = curve_fit(
+                _gaussian,
+                self.wave_window,
+                flux_window,
+                p0=p0,
+                sigma=sigma,
+                jac=_gaussian_jacobian,
+                maxfev=_CURVE_FIT_MAXFEV,
+                full_output=True,
+            )
+        except RuntimeError as e:
+            exhausted = "maxfev" in str(e)
+            raise _FitFailure(
+                f"ガウスフィッティングが収束しませんでした: {e}",
+                "maxfev" if exhausted else "invalid",
+                _CURVE_FIT_MAXFEV if exhausted else 0,
+            ) from e
+        except ValueError as e:
+            # 初期値や誤差が非有限の場合など
+            raise _FitFailure(f"ガウスフィッティングの入力が不正です: {e}", "invalid") from e
+        return popt, int(info["nfev"])
+
+
 def _fit_gaussian(
     wavelengths: np.ndarray,
     flux: np.ndarray,
@@ -52,6 +397,9 @@ def _fit_gaussian(
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """指定した静止波長付近の輝線にガウスフィッティングを行う.
 
+    複数のスペクトルを同じ波長軸でフィットする場合は
+    `_GaussianFitContext` を直接使用してウィンドウ計算を共有する。
+
     Parameters
     ----------
     wavelengths : np.ndarray
@@ -74,37 +422,10 @@ def _fit_gaussian(
     RuntimeError
         フィッティングが収束しなかった場合
     """
-    mask = (wavelengths >= rest_wavelength - window_width) & (
-        wavelengths <= rest_wavelength + window_width
+    context = _GaussianFitContext.from_wavelengths(
+        wavelengths, rest_wavelength, window_width
     )
-    wave_window = wavelengths[mask]
-    flux_window = flux[mask]
-
-    if len(wave_window) < 4:
-        raise RuntimeError(
-            f"フィッティングウィンドウ内のデータ点が不足しています "
-            f"({len(wave_window)} 点, 最低 4 点必要)"
-        )
-
-    offset_guess = float(np.median(flux_window))
-    amp_guess = float(np.max(flux_window) - offset_guess)
-    center_guess = float(wave_window[np.argmax(flux_window)])
-    sigma_guess = window_width / 4.0
-
-    p0 = [amp_guess, center_guess, sigma_guess, offset_guess]
-
-    try:
-        popt, _ = curve_fit(
-            _gaussian,
-            wave_window,
-            flux_window,
-            p0=p0,
-            maxfev=5000,
-        )
-    except RuntimeError as e:
-        raise RuntimeError(f"ガウスフィッティングが収束しませんでした: {e}") from e
-
-    return popt, wave_window, flux_window
+    return context.fit(flux)
 
 
 def _fit_emission_line(
@@ -140,6 +461,1067 @@ def _fit_emission_line(
     return float(popt[1])
 
 
+def _gaussian_batch(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """ガウス関数モデルのバッチ版.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        入力値（全系列共通, (n_x,)）
+    params : np.ndarray
+        各系列のパラメータ [amp, center, sigma, offset] (n_batch, 4)
+
+    Returns
+    -------
+    np.ndarray
+        ガウス関数の値 (n_batch, n_x)
+    """
+    amp, center, sigma, offset = (params[:, k, np.newaxis] for k in range(4))
+    return amp * np.exp(-0.5 * ((x - center) / sigma) ** 2) + offset
+
+
+def _gaussian_batch_jacobian(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """`_gaussian_batch` のパラメータに関する解析的ヤコビアン.
+
+    Returns
+    -------
+    np.ndarray
+        ヤコビアン (n_batch, n_x, 4)
+    """
+    amp, center, sigma, _ = (params[:, k, np.newaxis] for k in range(4))
+    u = (x - center) / sigma
+    g = np.exp(-0.5 * u**2)
+    jac = np.empty((params.shape[0], len(x), 4))
+    jac[:, :, 0] = g
+    jac[:, :, 1] = amp * g * u / sigma
+    jac[:, :, 2] = amp * g * u**2 / sigma
+    jac[:, :, 3] = 1.0
+    return jac
+
+
+def _spectrum_weights(
+    data: np.ndarray,
+    error: np.ndarray,
+    quality: np.ndarray,
+    use_error: bool,
+    dq_mask: int | None,
+) -> np.ndarray | None:
+    """誤差と品質フラグからフィッティングの重みを一括で求める.
+
+    品質フラグが ``dq_mask`` のいずれかのビットを持つ点、誤差が正の
+    有限値でない点、データが非有限の点の重みを 0 とする。
+
+    Parameters
+    ----------
+    data : np.ndarray
+        スペクトルデータ（2D: [波長, 空間位置]）
+    error : np.ndarray
+        統計的誤差（data と同形状）
+    quality : np.ndarray
+        品質フラグ（data と同形状）
+    use_error : bool
+        重みを 1/error² とするかどうか。False の場合は有効点の重みを 1 とする。
+    dq_mask : int or None
+        除外する品質フラグのビットマスク。None または 0 の場合は除外しない。
+
+    Returns
+    -------
+    np.ndarray or None
+        重み（data と同形状）。重み付けを行わない場合は None。
+    """
+    if not use_error and not dq_mask:
+        return None
+    good = np.isfinite(data)
+    if dq_mask:
+        good &= (np.asarray(quality).astype(np.int64) & dq_mask) == 0
+    if not use_error:
+        return good.astype(float)
+    error = np.asarray(error, dtype=float)
+    good &= np.isfinite(error) & (error > 0)
+    return np.where(good, 1.0 / np.where(good, error, 1.0) ** 2, 0.0)
+
+
+def _window_flux(
+    context: _GaussianFitContext,
+    data: np.ndarray,
+    weights: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """ウィンドウ内のフラックスと重みを (n_spatial, n_window) で取り出す.
+
+    重み 0 の点のフラックスは、その列の有効点の中央値で置き換える。
+    これにより、列ごとに有効点を抜き出した配列を作らずに、
+    初期値推定や閉形式の推定量から除外点の影響を取り除ける。
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray | None]
+        (フラックス (n_spatial, n_window), 重み (n_spatial, n_window) または None)
+    """
+    flux = np.asarray(data[context.window], dtype=float).T
+    if weights is None:
+        return flux, None
+    w = np.asarray(weights[context.window], dtype=float).T
+    good = w > 0
+    masked = np.where(good, flux, np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # 全点が除外された列
+        fill = np.nan_to_num(np.nanmedian(masked, axis=1))
+    return np.where(good, flux, fill[:, np.newaxis]), w
+
+
+def _failure_categories(
+    context: _GaussianFitContext,
+    params: np.ndarray,
+    n_valid: np.ndarray,
+    min_points: int,
+    converged: np.ndarray,
+    exhausted: np.ndarray | None = None,
+) -> np.ndarray:
+    """各空間ピクセルの失敗の分類を返す（成功は空文字列）.
+
+    Parameters
+    ----------
+    context : _GaussianFitContext
+        フィッティング条件
+    params : np.ndarray
+        各空間ピクセルの [amp, center, sigma, offset] (n_spatial, 4)
+    n_valid : np.ndarray
+        ウィンドウ内の有効なデータ点数 (n_spatial,)
+    min_points : int
+        推定に必要な最小のデータ点数
+    converged : np.ndarray
+        解が得られたかどうか (n_spatial,)
+    exhausted : np.ndarray or None, optional
+        反復回数の上限に達したかどうか (n_spatial,)（デフォルト: None）
+
+    Returns
+    -------
+    np.ndarray
+        失敗の分類 (n_spatial,)
+    """
+    failure = np.full(len(params), "", dtype=DIAGNOSTICS_DTYPE["failure"])
+    failure[~context.plausible_rows(params)] = "bad_bounds"
+    failure[~converged] = "invalid"
+    if exhausted is not None:
+        failure[~converged & exhausted] = "maxfev"
+    failure[n_valid < min_points] = "too_few_points"
+    return failure
+
+
+def _record_estimates(
+    diagnostics: np.ndarray | None,
+    context: _GaussianFitContext,
+    params: np.ndarray,
+    weights: np.ndarray | None,
+    min_points: int,
+    started: float,
+) -> None:
+    """閉形式の推定量の診断情報を記録する（``diagnostics`` が None なら何もしない）.
+
+    時間は全列の計算時間を列数で割った値、関数評価回数は 0 とし、
+    非有限値を含む推定を未収束とする。
+    """
+    if diagnostics is None:
+        return
+    n_spatial = len(params)
+    converged = np.all(np.isfinite(params), axis=1)
+    diagnostics["time"] = (time.perf_counter() - started) / max(n_spatial, 1)
+    diagnostics["nfev"] = 0
+    diagnostics["converged"] = converged
+    diagnostics["failure"] = _failure_categories(
+        context, params, context.valid_counts(n_spatial, weights), min_points, converged
+    )
+
+
+def _attempt_fit(
+    context: _GaussianFitContext,
+    flux_window: np.ndarray,
+    p0: np.ndarray | None,
+    sigma: np.ndarray | None,
+    record: np.void,
+) -> np.ndarray | None:
+    """curve_fit を1回試み、評価回数・収束状態・失敗の分類を ``record`` に記録する.
+
+    Returns
+    -------
+    np.ndarray or None
+        フィッティングパラメータ。収束しなかった場合は None。
+    """
+    try:
+        popt, nfev = context.fit_window_nfev(flux_window, p0=p0, sigma=sigma)
+    except _FitFailure as e:
+        record["nfev"] += e.nfev
+        record["converged"] = False
+        record["failure"] = e.category
+        return None
+    record["nfev"] += nfev
+    record["converged"] = True
+    record["failure"] = "" if context.is_plausible(popt) else "bad_bounds"
+    return popt
+
+
+def _fit_columns_curve_fit(
+    wavelengths: np.ndarray,
+    data: np.ndarray,
+    rest_wavelength: float,
+    window_width: float,
+    warm_start: bool = False,
+    weights: np.ndarray | None = None,
+    diagnostics: np.ndarray | None = None,
+) -> np.ndarray:
+    """空間ピクセルごとに curve_fit によるガウスフィッティングを実行する.
+
+    フィッティングウィンドウは `_GaussianFitContext` で一度だけ求める。
+
+    ``warm_start=True`` の場合、輝線ピークが最も明るい列から両端へ向かって
+    順にフィットし、各列の初期値に隣接列の収束パラメータを用いる。
+    隣接列からの初期値で収束しない、または結果が妥当でない場合は
+    通常の初期値推定でやり直す。
+
+    Parameters
+    ----------
+    wavelengths : np.ndarray
+        波長配列 [m]
+    data : np.ndarray
+        スペクトルデータ（2D: [波長, 空間位置]）
+    rest_wavelength : float
+        輝線の静止波長 [m]
+    window_width : float
+        フィッティングウィンドウの半幅 [m]
+    warm_start : bool, optional
+        隣接列の収束パラメータを初期値に使うかどうか（デフォルト: False）
+    weights : np.ndarray or None, optional
+        各点の重み 1/σ²（data と同形状）。重み 0 の点は誤差 inf として
+        扱い、フィッティングに寄与させない（デフォルト: None）
+    diagnostics : np.ndarray or None, optional
+        診断情報の出力先（`DIAGNOSTICS_DTYPE`, (n_spatial,)）。列ごとの
+        時間・評価回数は、ウォームスタートのやり直しを含めた合計。
+        None の場合は記録しない（デフォルト: None）
+
+    Returns
+    -------
+    np.ndarray
+        各空間ピクセルのパラメータ [amp, center, sigma, offset] (n_spatial, 4)。
+        フィッティングに失敗したピクセルは NaN。
+    """
+    context = _GaussianFitContext.from_wavelengths(
+        wavelengths, rest_wavelength, window_width
+    )
+    n_spatial = data.shape[1]
+    params = np.full((n_spatial, 4), np.nan)
+    if diagnostics is None:
+        diagnostics = np.zeros(n_spatial, dtype=DIAGNOSTICS_DTYPE)
+    if context.n_points < 4:
+        diagnostics["failure"] = "too_few_points"
+        return params
+
+    flux, w = _window_flux(context, data, weights)
+    sigma: np.ndarray | list[None] = [None] * n_spatial
+    if w is not None:
+        with np.errstate(divide="ignore"):
+            sigma = 1.0 / np.sqrt(w)
+
+    if not warm_start:
+        for i in range(n_spatial):
+            started = time.perf_counter()
+            popt = _attempt_fit(context, flux[i], None, sigma[i], diagnostics[i])
+            if popt is not None:
+                params[i] = popt
+            diagnostics["time"][i] = time.perf_counter() - started
+        return params
+
+    start = int(np.nanargmax(np.max(flux, axis=1))) if n_spatial > 0 else 0
+    for order in (range(start, n_spatial), range(start - 1, -1, -1)):
+        seed: np.ndarray | None = params[start] if order.start != start else None
+        for i in order:
+            started = time.perf_counter()
+            record = diagnostics[i]
+            popt: np.ndarray | None = None
+            if seed is not None and np.all(np.isfinite(seed)):
+                popt = _attempt_fit(context, flux[i], seed, sigma[i], record)
+                if popt is not None and not context.is_plausible(popt):
+                    popt = None
+            if popt is None:
+                popt = _attempt_fit(context, flux[i], None, sigma[i], record)
+            diagnostics["time"][i] = time.perf_counter() - started
+            if popt is None:
+                continue
+            params[i] = popt
+            seed = popt
+    return params
+
+
+def _fit_columns_batch(
+    wavelengths: np.ndarray,
+    data: np.ndarray,
+    rest_wavelength: float,
+    window_width: float,
+    weights: np.ndarray | None = None,
+    diagnostics: np.ndarray | None = None,
+) -> np.ndarray:
+    """全空間ピクセルを Levenberg–Marquardt 法で一括ガウスフィットする.
+
+    初期値は `_fit_gaussian` と同じ規則で全列同時に求める。
+    数値的な条件を良くするため、波長はウィンドウ中心・半幅で
+    無次元化してからフィットする。
+
+    Parameters
+    ----------
+    wavelengths : np.ndarray
+        波長配列 [m]
+    data : np.ndarray
+        スペクトルデータ（2D: [波長, 空間位置]）
+    rest_wavelength : float
+        輝線の静止波長 [m]
+    window_width : float
+        フィッティングウィンドウの半幅 [m]
+    weights : np.ndarray or None, optional
+        各点の重み 1/σ²（data と同形状）。重み 0 の点はフィッティングに
+        寄与しない（デフォルト: None）
+    diagnostics : np.ndarray or None, optional
+        診断情報の出力先（`DIAGNOSTICS_DTYPE`, (n_spatial,)）。時間は
+        一括フィット全体の時間を列数で割った値（デフォルト: None）
+
+    Returns
+    -------
+    np.ndarray
+        各空間ピクセルのパラメータ [amp, center, sigma, offset] (n_spatial, 4)。
+        収束しなかったピクセルは NaN。
+    """
+    started = time.perf_counter()
+    n_spatial = data.shape[1]
+    params = np.full((n_spatial, 4), np.nan)
+
+    context = _GaussianFitContext.from_wavelengths(
+        wavelengths, rest_wavelength, window_width
+    )
+    if context.n_points < 4:
+        if diagnostics is not None:
+            diagnostics["failure"] = "too_few_points"
+        return params
+    wave_window = context.wave_window
+    flux, w = _window_flux(context, data, weights)  # (n_spatial, n_window)
+
+    u = (wave_window - rest_wavelength) / window_width
+    offset_guess = np.median(flux, axis=1)
+    p0 = np.column_stack([
+        np.max(flux, axis=1) - offset_guess,
+        u[np.argmax(flux, axis=1)],
+        np.full(n_spatial, 0.25),
+        offset_guess,
+    ])
+
+    result = levenberg_marquardt(
+        _gaussian_batch, _gaussian_batch_jacobian, u, flux, p0, weights=w,
+        max_iter=_BATCH_MAX_ITER,
+    )
+    ok = result.converged
+    params[ok, 0] = result.params[ok, 0]
+    params[ok, 1] = rest_wavelength + result.params[ok, 1] * window_width
+    params[ok, 2] = np.abs(result.params[ok, 2]) * window_width
+    params[ok, 3] = result.params[ok, 3]
+
+    if diagnostics is not None:
+        diagnostics["time"] = (time.perf_counter() - started) / max(n_spatial, 1)
+        diagnostics["nfev"] = result.nfev
+        diagnostics["converged"] = ok
+        diagnostics["failure"] = _failure_categories(
+            context, params, context.valid_counts(n_spatial, weights), 4, ok,
+            exhausted=result.n_iter >= _BATCH_MAX_ITER,
+        )
+    return params
+
+
+def _window_line_flux(
+    context: _GaussianFitContext,
+    data: np.ndarray,
+    weights: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ウィンドウ内のフラックスから連続光を差し引いた輝線成分を返す.
+
+    連続光はウィンドウ内の中央値で推定する（`_fit_gaussian` の
+    offset 初期値と同じ規則）。重み 0 の点の輝線成分は 0 となる。
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        (無次元化波長 u (n_window,), 輝線フラックス (n_spatial, n_window),
+         連続光 (n_spatial,))。
+        u はウィンドウ中心を 0、半幅を 1 とする座標。
+    """
+    flux, _ = _window_flux(context, data, weights)
+    continuum = np.median(flux, axis=1)
+    u = (context.wave_window - context.rest_wavelength) / context.window_width
+    return u, flux - continuum[:, np.newaxis], continuum
+
+
+def _params_from_normalized(
+    context: _GaussianFitContext,
+    amp: np.ndarray,
+    center_u: np.ndarray,
+    sigma_u: np.ndarray,
+    offset: np.ndarray,
+) -> np.ndarray:
+    """無次元化座標での推定値を [amp, center, sigma, offset] [m] に変換する.
+
+    非有限値や非正の幅を含むピクセルはすべて NaN とする。
+    """
+    params = np.column_stack([
+        amp,
+        context.rest_wavelength + center_u * context.window_width,
+        sigma_u * context.window_width,
+        offset,
+    ])
+    invalid = ~np.all(np.isfinite(params), axis=1) | ~(sigma_u > 0)
+    params[invalid] = np.nan
+    return params
+
+
+def _estimate_moment(
+    wavelengths: np.ndarray,
+    data: np.ndarray,
+    rest_wavelength: float,
+    window_width: float,
+    weights: np.ndarray | None = None,
+    diagnostics: np.ndarray | None = None,
+) -> np.ndarray:
+    """フラックス重み付き1次モーメントで輝線中心を推定する.
+
+    連続光を差し引いた正のフラックスを重みとし、重心を中心、
+    2次モーメントの平方根を幅、積分フラックスから振幅を求める。
+    ``weights`` は点の除外（重み 0）のみに使用する。
+
+    Returns
+    -------
+    np.ndarray
+        各空間ピクセルの [amp, center, sigma, offset] (n_spatial, 4)
+    """
+    started = time.perf_counter()
+    context = _GaussianFitContext.from_wavelengths(
+        wavelengths, rest_wavelength, window_width
+    )
+    if context.n_points < 3:
+        if diagnostics is not None:
+            diagnostics["failure"] = "too_few_points"
+        return np.full((data.shape[1], 4), np.nan)
+    u, line, continuum = _window_line_flux(context, data, weights)
+
+    weight = np.clip(line, 0.0, None)
+    total = weight.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        center = (weight @ u) / total
+        variance = np.einsum("bx,bx->b", weight, (u - center[:, np.newaxis]) ** 2) / total
+        sigma = np.sqrt(variance)
+        step = np.median(np.diff(u))
+        amp = total * step / (np.sqrt(2.0 * np.pi) * sigma)
+    params = _params_from_normalized(context, amp, center, sigma, continuum)
+    _record_estimates(diagnostics, context, params, weights, 3, started)
+    return params
+
+
+def _estimate_caruana(
+    wavelengths: np.ndarray,
+    data: np.ndarray,
+    rest_wavelength: float,
+    window_width: float,
+    weights: np.ndarray | None = None,
+    diagnostics: np.ndarray | None = None,
+) -> np.ndarray:
+    """ピーク近傍3点の対数放物線で輝線中心を推定する（Caruana 法）.
+
+    ピークとその両隣の連続光差し引き後フラックスの対数に放物線を当て、
+    その頂点をガウス中心とする。ピークがウィンドウ端にある場合や、
+    3点のいずれかが正でない場合（除外点を含む場合を含む）は NaN となる。
+
+    Returns
+    -------
+    np.ndarray
+        各空間ピクセルの [amp, center, sigma, offset] (n_spatial, 4)
+    """
+    started = time.perf_counter()
+    context = _GaussianFitContext.from_wavelengths(
+        wavelengths, rest_wavelength, window_width
+    )
+    n_spatial = data.shape[1]
+    if context.n_points < 3:
+        if diagnostics is not None:
+            diagnostics["failure"] = "too_few_points"
+        return np.full((n_spatial, 4), np.nan)
+    u, line, continuum = _window_line_flux(context, data, weights)
+
+    peak = np.clip(np.argmax(line, axis=1), 1, len(u) - 2)
+    cols = np.arange(n_spatial)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y0, y1, y2 = (np.log(line[cols, peak + k]) for k in (-1, 0, 1))
+        step = (u[peak + 1] - u[peak - 1]) / 2.0
+        curvature = y0 - 2.0 * y1 + y2
+        shift = 0.5 * step * (y0 - y2) / curvature
+        sigma = np.sqrt(-(step**2) / curvature)
+        amp = np.exp(y1 + shift**2 / (2.0 * sigma**2))
+    center = u[peak] + shift
+    center[np.abs(shift) > step] = np.nan
+    params = _params_from_normalized(context, amp, center, sigma, continuum)
+    _record_estimates(diagnostics, context, params, weights, 3, started)
+    return params
+
+
+def _estimate_log_gaussian(
+    wavelengths: np.ndarray,
+    data: np.ndarray,
+    rest_wavelength: float,
+    window_width: float,
+    weights: np.ndarray | None = None,
+    diagnostics: np.ndarray | None = None,
+) -> np.ndarray:
+    """対数フラックスへの2次多項式フィットでガウスパラメータを推定する.
+
+    ln f = a + b u + c u² をウィンドウ内の正のフラックス点に対して
+    重み f² の線形最小二乗で解く（対数化によるノイズ増幅を抑える
+    Guo の重み付け）。``weights`` (1/σ²) を指定した場合は ln f の分散
+    σ²/f² に合わせて重みを f²/σ² とする。正規方程式は全空間ピクセルで
+    一括に解く。
+
+    Returns
+    -------
+    np.ndarray
+        各空間ピクセルの [amp, center, sigma, offset] (n_spatial, 4)
+    """
+    started = time.perf_counter()
+    context = _GaussianFitContext.from_wavelengths(
+        wavelengths, rest_wavelength, window_width
+    )
+    n_spatial = data.shape[1]
+    if context.n_points < 3:
+        if diagnostics is not None:
+            diagnostics["failure"] = "too_few_points"
+        return np.full((n_spatial, 4), np.nan)
+    u, line, continuum = _window_line_flux(context, data, weights)
+
+    positive = line > 0
+    weight = np.where(positive, line**2, 0.0)
+    if weights is not None:
+        weight *= np.asarray(weights[context.window], dtype=float).T
+        positive &= weight > 0
+    log_flux = np.log(np.where(positive, line, 1.0))
+
+    powers = u[np.newaxis, :] ** np.arange(5)[:, np.newaxis]  # (5, n_window)
+    moments = weight @ powers.T  # (n_spatial, 5)
+    normal = moments[:, [[0, 1, 2], [1, 2, 3], [2, 3, 4]]]
+    rhs = (weight * log_flux) @ powers[:3].T  # (n_spatial, 3)
+
+    solvable = (np.count_nonzero(positive, axis=1) >= 3) & (
+        np.abs(np.linalg.det(normal)) > 0
+    )
+    coef = np.full((n_spatial, 3), np.nan)
+    if np.any(solvable):
+        coef[solvable] = np.linalg.solve(normal[solvable], rhs[solvable, :, np.newaxis])[:, :, 0]
+    a, b, c = coef.T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        center = -b / (2.0 * c)
+        sigma = np.sqrt(-1.0 / (2.0 * c))
+        amp = np.exp(a - b**2 / (4.0 * c))
+    params = _params_from_normalized(context, amp, center, sigma, continuum)
+    _record_estimates(diagnostics, context, params, weights, 3, started)
+    return params
+
+
+#: フィッティングエンジン名から列一括フィット関数へのマッピング。
+#: 各関数は (波長配列, 2D データ, 静止波長, ウィンドウ半幅) と、データと同形状の
+#: 重み ``weights``（1/σ², 0 は除外）、診断情報の出力先 ``diagnostics``
+#: （`DIAGNOSTICS_DTYPE`）およびエンジン固有のキーワード引数を受け取り、
+#: 空間ピクセルごとの [amp, center, sigma, offset] (n_spatial, 4) を返す。
+FIT_METHODS: dict[str, Callable[..., np.ndarray]] = {
+    "gaussian": _fit_columns_curve_fit,
+    "gaussian_batch": _fit_columns_batch,
+    "moment": _estimate_moment,
+    "caruana": _estimate_caruana,
+    "log_gaussian": _estimate_log_gaussian,
+}
+
+
+def _check_fit_method(method: str, options: dict[str, Any]) -> None:
+    """フィッティングエンジン名と、エンジンに渡すオプションを検証する.
+
+    Raises
+    ------
+    ValueError
+        未知のフィッティングエンジン名、またはエンジンが対応していない
+        オプションが指定された場合
+    """
+    if method not in FIT_METHODS:
+        raise ValueError(
+            f"未知のフィッティングエンジン: '{method}'. "
+            f"利用可能: {list(FIT_METHODS.keys())}"
+        )
+    supported = inspect.signature(FIT_METHODS[method]).parameters
+    unsupported = [name for name in options if name not in supported]
+    if unsupported:
+        raise ValueError(
+            f"フィッティングエンジン '{method}' は次のオプションに対応していません: "
+            f"{unsupported}"
+        )
+
+
+def _fit_options(**options: Any) -> dict[str, Any]:
+    """既定値（False / None）でないオプションのみを抽出する.
+
+    既定値のオプションはエンジンに渡さないため、そのオプションに
+    対応していないエンジンでもそのまま使用できる。
+    """
+    return {
+        name: value for name, value in options.items()
+        if value is not None and value is not False
+    }
+
+
+def _fit_chunk(
+    method: str,
+    wavelengths: np.ndarray,
+    data: np.ndarray,
+    weights: np.ndarray | None,
+    rest_wavelength: float,
+    window_width: float,
+    options: dict[str, Any],
+) -> tuple[np.ndarray, np.ndarray]:
+    """1チャンク分の列をフィットする（プロセスプールのワーカー関数）.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (各列の [amp, center, sigma, offset] (n_spatial, 4),
+         各列の診断情報 (n_spatial,) `DIAGNOSTICS_DTYPE`)
+    """
+    diagnostics = np.zeros(data.shape[1], dtype=DIAGNOSTICS_DTYPE)
+    options = {**options, "diagnostics": diagnostics}
+    if weights is not None:
+        options["weights"] = weights
+    params = FIT_METHODS[method](
+        wavelengths, data, rest_wavelength, window_width, **options
+    )
+    return params, diagnostics
+
+
+#: 誤差評価の各実現値のフィットに用いるエンジン。列ごとの curve_fit は
+#: 実現値の数だけ反復が増えるため、同じ最小二乗問題を一括で解くエンジンに置き換える。
+_MONTE_CARLO_METHODS: dict[str, str] = {
+    "gaussian": "gaussian_batch",
+}
+
+#: 誤差評価で1回のバッチフィットに含める系列数の上限（メモリ使用量の制限）
+_MONTE_CARLO_MAX_SERIES: int = 65536
+
+
+def _robust_std(samples: np.ndarray, min_valid: int) -> np.ndarray:
+    """16–84 パーセンタイル幅の半分による頑健な標準偏差 (axis=0).
+
+    有限値の数が ``min_valid`` に満たない列は NaN とする。
+    """
+    valid = np.count_nonzero(np.isfinite(samples), axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # 全実現値が NaN の列
+        low, high = np.nanpercentile(samples, [15.865, 84.135], axis=0)
+    return np.where(valid >= min_valid, 0.5 * (high - low), np.nan)
+
+
+def _monte_carlo_chunk(
+    method: str,
+    wavelengths: np.ndarray,
+    data: np.ndarray,
+    error: np.ndarray,
+    weights: np.ndarray | None,
+    rest_wavelength: float,
+    window_width: float,
+    options: dict[str, Any],
+    n_realizations: int,
+    seed: np.random.SeedSequence | int | None,
+) -> np.ndarray:
+    """1チャンク分の列について、輝線中心の誤差をモンテカルロ法で求める.
+
+    統計的誤差に従う正規乱数を加えた ``n_realizations`` 個の実現値を
+    (n_window, n_realizations × n_spatial) の1つの配列として生成し、
+    フィッティングエンジンで一括にフィットする（プロセスプールのワーカー関数）。
+
+    Returns
+    -------
+    np.ndarray
+        各空間ピクセルの輝線中心の誤差 [m] (n_spatial,)。有効な実現値が
+        半数に満たないピクセルは NaN。
+    """
+    rng = np.random.default_rng(seed)
+    n_window, n_spatial = data.shape
+    noise_scale = np.where(np.isfinite(error), error, 0.0)
+    block = max(1, _MONTE_CARLO_MAX_SERIES // n_realizations)
+    center_errors = np.full(n_spatial, np.nan)
+    for i in range(0, n_spatial, block):
+        cols = slice(i, i + block)
+        n_cols = len(range(*cols.indices(n_spatial)))
+        noise = rng.standard_normal((n_window, n_realizations, n_cols))
+        realizations = data[:, np.newaxis, cols] + noise_scale[:, np.newaxis, cols] * noise
+        tiled = None
+        if weights is not None:
+            tiled = np.broadcast_to(
+                weights[:, np.newaxis, cols], realizations.shape
+            ).reshape(n_window, -1)
+        params, _ = _fit_chunk(
+            method, wavelengths, realizations.reshape(n_window, -1), tiled,
+            rest_wavelength, window_width, options,
+        )
+        centers = params[:, 1].reshape(n_realizations, n_cols)
+        center_errors[cols] = _robust_std(centers, (n_realizations + 1) // 2)
+    return center_errors
+
+
+def _window_slab(
+    image: ImageModel,
+    rest_wavelength: float,
+    window_width: float,
+    use_error: bool,
+    dq_mask: int | None,
+    with_error: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, np.ndarray | None]:
+    """フィッティングウィンドウで切り出した波長配列・データ・誤差・重みを返す.
+
+    波長方向はウィンドウ内のピクセルのみを読み出し、重みもその範囲だけで
+    計算する。切り出し後の波長配列に対してもウィンドウは同じピクセルを
+    選択するため、フィット結果は変わらない。``use_error`` / ``dq_mask`` を
+    指定しない場合も、データに非有限値があれば有限の点を重み 1 とする
+    重みを返し、非有限値をフィットから除外する。
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray | None, np.ndarray | None]
+        (ウィンドウ内の波長配列, データ (n_window, n_spatial),
+         誤差 (n_window, n_spatial) または None（``with_error=False`` の場合）,
+         重み (n_window, n_spatial) または None)
+    """
+    context = _GaussianFitContext.from_wavelengths(
+        image.header.spectrogram.wavelength_array, rest_wavelength, window_width
+    )
+    spectrum = image.spectrum
+    slab = np.asarray(spectrum.data[context.window])
+    error = None
+    if with_error or use_error:
+        error = np.asarray(spectrum.error[context.window], dtype=float)
+    weights = None
+    if use_error or dq_mask:
+        weights = _spectrum_weights(
+            slab,
+            spectrum.error[context.window] if error is None else error,
+            spectrum.quality[context.window],
+            use_error,
+            dq_mask,
+        )
+    elif not np.all(np.isfinite(slab)):
+        weights = np.isfinite(slab).astype(float)
+    return context.wave_window, slab, error if with_error else None, weights
+
+
+def _bin_slab(
+    slab: np.ndarray,
+    error: np.ndarray | None,
+    weights: np.ndarray | None,
+    use_error: bool,
+    bin_factor: int | None,
+    target_snr: float | None,
+    max_bin_size: int | None,
+) -> tuple[SpatialBinning | None, np.ndarray, np.ndarray | None, np.ndarray | None]:
+    """ウィンドウ内のデータを空間方向にビニングする.
+
+    適応的ビニングの S/N は、ウィンドウ内の中央値を連続光として差し引いた
+    積分フラックスと、統計的誤差の二乗和から列ごとに求める。
+
+    Returns
+    -------
+    tuple[SpatialBinning | None, np.ndarray, np.ndarray | None, np.ndarray | None]
+        (ビニング, ビン平均したデータ・誤差・重み)。ビニングしない場合は
+        (None, 入力のデータ・誤差・重み)。
+    """
+    if bin_factor is None and target_snr is None:
+        return None, slab, error, weights
+    if target_snr is None:
+        binning = SpatialBinning.fixed(slab.shape[1], int(bin_factor))  # type: ignore[arg-type]
+    else:
+        assert error is not None
+        good = np.isfinite(slab) if weights is None else weights > 0
+        masked = np.where(good, np.asarray(slab, dtype=float), np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # 全点が除外された列
+            continuum = np.nanmedian(masked, axis=0)
+        signal = np.nansum(masked - continuum, axis=0)
+        noise = np.sqrt(np.sum(np.where(good, error, 0.0) ** 2, axis=0))
+        binning = SpatialBinning.adaptive(signal, noise, target_snr, max_bin_size)
+    return (binning, *binning.coadd(slab, error, weights, use_error))
+
+
+@dataclass(frozen=True)
+class _ImageFit:
+    """1画像分のフィット結果.
+
+    Attributes
+    ----------
+    params : np.ndarray
+        各空間ピクセルの [amp, center, sigma, offset] (n_spatial, 4)
+    center_errors : np.ndarray or None
+        各空間ピクセルの輝線中心の誤差 [m] (n_spatial,)
+    bin_labels : np.ndarray or None
+        各空間ピクセルのビン番号 (n_spatial,)。ビニングしない場合は None。
+    diagnostics : np.ndarray or None
+        各空間ピクセルの診断情報 (n_spatial,) `DIAGNOSTICS_DTYPE`
+    """
+
+    params: np.ndarray
+    center_errors: np.ndarray | None = None
+    bin_labels: np.ndarray | None = None
+    diagnostics: np.ndarray | None = None
+
+
+def _fit_images(
+    images: list[ImageModel],
+    rest_wavelength: float,
+    window_width: float,
+    method: str,
+    max_workers: int | None,
+    chunk_size: int,
+    executor: str,
+    options: dict[str, Any],
+    use_error: bool = False,
+    dq_mask: int | None = None,
+    n_realizations: int = 0,
+    seed: int | None = None,
+    bin_factor: int | None = None,
+    target_snr: float | None = None,
+    max_bin_size: int | None = None,
+) -> list[_ImageFit]:
+    """複数画像の全空間ピクセルをフィットし、画像ごとの結果を返す.
+
+    各画像はフィッティングウィンドウの範囲だけを切り出してからフィットする。
+    ``max_workers`` が None の場合は画像ごとに逐次フィットする。
+    指定された場合は全画像の列チャンクを1つのプールに投入し、
+    入力順に結果を結合する。``options`` はエンジン固有のキーワード引数。
+    ``use_error`` と ``dq_mask`` については `_spectrum_weights` を参照。
+
+    ``n_realizations`` が正の場合、`_monte_carlo_chunk` で輝線中心の誤差も
+    求める。乱数列はチャンクごとに ``seed`` から派生させるため、同じ
+    ``seed``・``max_workers``・``chunk_size`` の組み合わせで再現できる。
+
+    ``bin_factor`` または ``target_snr`` を指定すると、`_bin_slab` で
+    空間方向にビニングしてからフィットし、ビンの結果を元の列に戻す。
+
+    Returns
+    -------
+    list[_ImageFit]
+        画像ごとのフィット結果
+    """
+    _check_fit_method(method, options)
+    if n_realizations < 0:
+        raise ValueError("n_realizations は 0 以上を指定してください")
+    if chunk_size < 1:
+        raise ValueError("chunk_size は 1 以上を指定してください")
+    if bin_factor is not None and target_snr is not None:
+        raise ValueError("bin_factor と target_snr は同時に指定できません")
+    binnings: list[SpatialBinning | None] = []
+    slabs = []
+    for image in images:
+        wave, slab, error, weights = _window_slab(
+            image, rest_wavelength, window_width, use_error, dq_mask,
+            with_error=n_realizations > 0 or target_snr is not None,
+        )
+        binning, slab, error, weights = _bin_slab(
+            slab, error, weights, use_error, bin_factor, target_snr, max_bin_size
+        )
+        binnings.append(binning)
+        slabs.append((wave, slab, error, weights))
+
+    # 逐次実行では画像全体を1チャンクとする
+    waves: list[np.ndarray] = []
+    chunks: list[np.ndarray] = []
+    error_chunks: list[np.ndarray | None] = []
+    weight_chunks: list[np.ndarray | None] = []
+    n_chunks: list[int] = []
+    for wave, slab, error, weights in slabs:
+        n_spatial = slab.shape[1]
+        step = max(1, n_spatial) if max_workers is None else chunk_size
+        starts = range(0, n_spatial, step)
+        waves.extend([wave] * len(starts))
+        chunks.extend(slab[:, i:i + step] for i in starts)
+        error_chunks.extend(
+            None if error is None else error[:, i:i + step] for i in starts
+        )
+        weight_chunks.extend(
+            None if weights is None else weights[:, i:i + step] for i in starts
+        )
+        n_chunks.append(len(starts))
+
+    n_tasks = len(chunks)
+    results = parallel_map(
+        _fit_chunk,
+        [method] * n_tasks,
+        waves,
+        chunks,
+        weight_chunks,
+        [rest_wavelength] * n_tasks,
+        [window_width] * n_tasks,
+        [options] * n_tasks,
+        max_workers=max_workers,
+        executor=executor,
+    )
+    params_list = _split_results(
+        [params for params, _ in results], n_chunks, np.empty((0, 4))
+    )
+    diagnostics_list = _split_results(
+        [diagnostics for _, diagnostics in results], n_chunks,
+        np.empty(0, dtype=DIAGNOSTICS_DTYPE),
+    )
+    errors_list: list[np.ndarray | None] = [None] * len(images)
+    if n_realizations > 0:
+        errors_list = list(_monte_carlo_images(
+            method, waves, chunks, error_chunks, weight_chunks, n_chunks,
+            rest_wavelength, window_width, options,
+            n_realizations, seed, max_workers, executor,
+        ))
+
+    fits: list[_ImageFit] = []
+    for params, errors, diagnostics, binning in zip(
+        params_list, errors_list, diagnostics_list, binnings
+    ):
+        if binning is None:
+            fits.append(_ImageFit(params, errors, diagnostics=diagnostics))
+            continue
+        fits.append(_ImageFit(
+            params=binning.expand(params),
+            center_errors=None if errors is None else binning.expand(errors),
+            bin_labels=binning.labels,
+            diagnostics=_expand_diagnostics(binning, diagnostics),
+        ))
+    return fits
+
+
+def _expand_diagnostics(binning: SpatialBinning, diagnostics: np.ndarray) -> np.ndarray:
+    """ビンごとの診断情報を元の列に戻す.
+
+    各列にはそのビンの記録を割り当て、時間はビン内の列数で等分する
+    （列の合計がフィット全体の時間と一致する）。どのビンにも属さない列は
+    ``failure="excluded"`` とする。
+    """
+    labels = binning.labels
+    expanded = np.zeros(len(labels), dtype=DIAGNOSTICS_DTYPE)
+    expanded["failure"] = "excluded"
+    binned = labels >= 0
+    expanded[binned] = diagnostics[labels[binned]]
+    sizes = np.bincount(labels[binned], minlength=binning.n_bins)
+    expanded["time"][binned] /= sizes[labels[binned]]
+    return expanded
+
+
+def _monte_carlo_images(
+    method: str,
+    waves: list[np.ndarray],
+    chunks: list[np.ndarray],
+    error_chunks: list[np.ndarray | None],
+    weight_chunks: list[np.ndarray | None],
+    n_chunks: list[int],
+    rest_wavelength: float,
+    window_width: float,
+    options: dict[str, Any],
+    n_realizations: int,
+    seed: int | None,
+    max_workers: int | None,
+    executor: str,
+) -> list[np.ndarray]:
+    """全チャンクの輝線中心の誤差を求め、画像ごとに結合して返す."""
+    n_tasks = len(chunks)
+    mc_method = _MONTE_CARLO_METHODS.get(method, method)
+    mc_options = options if mc_method == method else {}
+    error_results = parallel_map(
+        _monte_carlo_chunk,
+        [mc_method] * n_tasks,
+        waves,
+        chunks,
+        error_chunks,
+        weight_chunks,
+        [rest_wavelength] * n_tasks,
+        [window_width] * n_tasks,
+        [mc_options] * n_tasks,
+        [n_realizations] * n_tasks,
+        np.random.SeedSequence(seed).spawn(n_tasks),
+        max_workers=max_workers,
+        executor=executor,
+    )
+    return _split_results(error_results, n_chunks, np.empty(0))
+
+
+def _split_results(
+    results: list[np.ndarray], n_chunks: list[int], empty: np.ndarray
+) -> list[np.ndarray]:
+    """チャンクごとの結果を画像ごとに結合する."""
+    combined: list[np.ndarray] = []
+    start = 0
+    for n in n_chunks:
+        image_results = results[start:start + n]
+        combined.append(np.concatenate(image_results) if image_results else empty)
+        start += n
+    return combined
+
+
+def _image_identity(
+    image: ImageModel, rest_wavelength: float, window_width: float
+) -> dict[str, Any]:
+    """キャッシュキーに用いる画像の識別情報を返す.
+
+    読み込み元ファイルがある場合は絶対パス・更新時刻・サイズ（データは
+    読まない）、ない場合はウィンドウ内の data/error/quality の SHA-256 を用いる。
+    いずれの場合も波長配列の範囲を含める（波長範囲で切り出した画像を区別する）。
+    """
+    wavelengths = image.header.spectrogram.wavelength_array
+    identity: dict[str, Any] = {
+        "wavelengths": [float(wavelengths[0]), float(wavelengths[-1]), len(wavelengths)]
+        if len(wavelengths) else [],
+    }
+    if image.source is not None:
+        try:
+            stat = os.stat(image.source)
+        except OSError:
+            pass
+        else:
+            identity.update(
+                path=str(Path(image.source).resolve()),
+                mtime=stat.st_mtime,
+                size=stat.st_size,
+            )
+            return identity
+
+    context = _GaussianFitContext.from_wavelengths(
+        wavelengths, rest_wavelength, window_width
+    )
+    digest = hashlib.sha256()
+    spectrum = image.spectrum
+    for array in (spectrum.data, spectrum.error, spectrum.quality):
+        window = np.ascontiguousarray(array[context.window])
+        digest.update(str((window.dtype.str, window.shape)).encode())
+        digest.update(window.tobytes())
+    identity["digest"] = digest.hexdigest()
+    return identity
+
+
+def _result_key(
+    image: ImageModel,
+    rest_wavelength: float,
+    window_width: float,
+    pixel_scale: float,
+    method: str,
+    options: dict[str, Any],
+) -> str:
+    """フィット結果のキャッシュキーを返す."""
+    return cache_key(
+        image=_image_identity(image, rest_wavelength, window_width),
+        rest_wavelength=rest_wavelength,
+        window_width=window_width,
+        pixel_scale=pixel_scale,
+        method=method,
+        options=options,
+    )
+
+
 @dataclass(frozen=True)
 class VelocityModel:
     """輝線の後退速度モデル.
@@ -161,6 +1543,21 @@ class VelocityModel:
     slit_offset : float
         スリットの垂直方向オフセット [arcsec]。
         VelocityMap で2Dマップを構成する際に使用。
+    velocity_errors : np.ndarray or None
+        各空間位置での後退速度の誤差 [m/s] (1D)。モンテカルロ法による
+        誤差評価を行わなかった場合は None。
+    bin_labels : np.ndarray or None
+        各空間位置のビン番号 (1D)。同じビンの空間位置は同じフィット結果を
+        共有する（-1 はフィットしなかった位置）。ビニングしなかった場合は None。
+    diagnostics : np.ndarray or None
+        各空間位置のフィット診断情報 (1D, `DIAGNOSTICS_DTYPE`)。
+        フィット時間 ``time``、関数評価回数 ``nfev``、収束状態 ``converged``、
+        失敗の分類 ``failure``（`FAILURE_CATEGORIES`）を持つ。キャッシュから
+        読み込んだ場合は保存時のフィットの値。
+    line_params : np.ndarray or None
+        各空間位置のガウス関数パラメータ [amp, center, sigma, offset]
+        （center, sigma は [m]）(n_positions, 4)。速度分散・輝線フラックス・
+        連続光の計算に使用する。
     """
 
     rest_wavelength: float
@@ -169,18 +1566,91 @@ class VelocityModel:
     velocities: np.ndarray
     spatial_positions: np.ndarray
     slit_offset: float
+    velocity_errors: np.ndarray | None = None
+    bin_labels: np.ndarray | None = None
+    diagnostics: np.ndarray | None = None
+    line_params: np.ndarray | None = None
 
     def __repr__(self) -> str:
+        extra_lines = ""
+        if self.velocity_errors is not None:
+            extra_lines = f"  v_error_median={np.nanmedian(self.velocity_errors):.2f} m/s,\n"
+        if self.diagnostics is not None:
+            n_failed = int(np.count_nonzero(self.diagnostics["failure"]))
+            extra_lines += f"  n_failed={n_failed},\n"
         return (
             f"VelocityModel(\n"
             f"  rest_wavelength={self.rest_wavelength:.4e} m,\n"
             f"  n_positions={len(self.velocities)},\n"
             f"  slit_offset={self.slit_offset:.2f} arcsec,\n"
             f"  v_mean={np.nanmean(self.velocities):.2f} m/s,\n"
-            f"  v_range=[{np.nanmin(self.velocities):.2f}, {np.nanmax(self.velocities):.2f}] m/s\n"
+            f"  v_range=[{np.nanmin(self.velocities):.2f}, {np.nanmax(self.velocities):.2f}] m/s,\n"
+            f"{extra_lines}"
             f")"
         )
 
+    @classmethod
+    def _from_params(
+        cls,
+        params: np.ndarray,
+        image: ImageModel,
+        rest_wavelength: float,
+        slit_offset: float,
+        pixel_scale: float,
+        center_errors: np.ndarray | None = None,
+        bin_labels: np.ndarray | None = None,
+        diagnostics: np.ndarray | None = None,
+    ) -> Self:
+        """列ごとのフィットパラメータから後退速度モデルを生成する.
+
+        Parameters
+        ----------
+        params : np.ndarray
+            各空間ピクセルの [amp, center, sigma, offset] (n_spatial, 4)
+        image : ImageModel
+            フィット対象の ImageModel（空間座標の計算に使用）
+        rest_wavelength : float
+            輝線の静止波長 [m]
+        slit_offset : float
+            スリットの垂直方向オフセット [arcsec]
+        pixel_scale : float
+            空間方向の1ピクセルあたりのスケール [arcsec/pixel]
+        center_errors : np.ndarray or None, optional
+            各空間ピクセルの輝線中心の誤差 [m] (n_spatial,)（デフォルト: None）
+        bin_labels : np.ndarray or None, optional
+            各空間ピクセルのビン番号 (n_spatial,)（デフォルト: None）
+        diagnostics : np.ndarray or None, optional
+            各空間ピクセルの診断情報 (n_spatial,)（デフォルト: None）
+
+        Returns
+        -------
+        VelocityModel
+            後退速度モデル
+        """
+        observed = params[:, 1]
+        velocity_errors = None
+        if center_errors is not None:
+            velocity_errors = SPEED_OF_LIGHT * center_errors / rest_wavelength
+
+        redshifts = (observed - rest_wavelength) / rest_wavelength
+        velocities = SPEED_OF_LIGHT * redshifts
+
+        spatial_pixels = image.header.spectrogram.spatial_array
+        spatial_positions = spatial_pixels * pixel_scale
+
+        return cls(
+            rest_wavelength=rest_wavelength,
+            observed_wavelengths=observed,
+            redshifts=redshifts,
+            velocities=velocities,
+            spatial_positions=spatial_positions,
+            slit_offset=slit_offset,
+            velocity_errors=velocity_errors,
+            bin_labels=bin_labels,
+            diagnostics=diagnostics,
+            line_params=params,
+        )
+
     @classmethod
     def from_image(
         cls,
@@ -189,6 +1659,19 @@ class VelocityModel:
         window_width: float,
         slit_offset: float = 0.0,
         pixel_scale: float = 0.05,
+        method: str = "gaussian",
+        max_workers: int | None = None,
+        chunk_size: int = 128,
+        executor: str = "process",
+        warm_start: bool = False,
+        use_error: bool = False,
+        dq_mask: int | None = None,
+        n_realizations: int = 0,
+        seed: int | None = None,
+        bin_factor: int | None = None,
+        target_snr: float | None = None,
+        max_bin_size: int | None = None,
+        cache: ResultCache | None = None,
     ) -> Self:
         """ImageModel から後退速度モデルを生成する.
 
@@ -205,42 +1688,319 @@ class VelocityModel:
         pixel_scale : float, optional
             空間方向の1ピクセルあたりのスケール [arcsec/pixel]
             （STIS デフォルト: 0.05 arcsec/pixel）
+        method : str, optional
+            フィッティングエンジン名（"gaussian", "gaussian_batch",
+            "moment", "caruana", "log_gaussian"）。
+            デフォルト: "gaussian"（ピクセルごとの curve_fit）
+        max_workers : int or None, optional
+            並列ワーカー数。None の場合は逐次にフィットする（デフォルト: None）
+        chunk_size : int, optional
+            1タスクあたりの空間ピクセル数（デフォルト: 128）
+        executor : str, optional
+            並列実行方式（"thread", "process"）。デフォルト: "process"
+        warm_start : bool, optional
+            隣接する空間ピクセルの収束パラメータを初期値に使うかどうか
+            （"gaussian" のみ対応, デフォルト: False）。並列実行時は
+            列チャンクごとに独立にウォームスタートする。
+        use_error : bool, optional
+            統計的誤差（HDU 2）から重み 1/error² を付けてフィットするかどうか
+            （デフォルト: False）。閉形式の推定量では "log_gaussian" のみ
+            誤差を重みに使用し、他は除外点の判定にのみ使用する。
+        dq_mask : int or None, optional
+            フィットから除外する品質フラグ（HDU 3）のビットマスク。
+            STIS の既定値は `util.constants.STIS_SDQ_FLAGS`。None の場合は除外しない
+            （デフォルト: None）
+        n_realizations : int, optional
+            後退速度の誤差を評価するモンテカルロ実現値の数。正の場合、
+            統計的誤差（HDU 2）に従う乱数を加えた全実現値を1つの配列として
+            一括にフィットし、16–84 パーセンタイル幅の半分を
+            ``velocity_errors`` とする。"gaussian" の実現値は
+            "gaussian_batch" でフィットするため、``warm_start`` などの
+            エンジン固有のオプションは実現値のフィットには適用されない。
+            0 の場合は誤差を評価しない（デフォルト: 0）
+        seed : int or None, optional
+            モンテカルロ法の乱数シード（デフォルト: None）
+        bin_factor : int or None, optional
+            フィット前に空間方向の隣接列を ``bin_factor`` 列ずつ平均する
+            固定幅ビニング（デフォルト: None）
+        target_snr : float or None, optional
+            輝線の S/N（統計的誤差 HDU 2 から計算）がこの値に達するまで
+            スリット方向の隣接列を平均する適応的ビニング（デフォルト: None）。
+            ``bin_factor`` とは同時に指定できない。
+        max_bin_size : int or None, optional
+            適応的ビニングの1ビンあたりの最大列数。この列数で目標 S/N に
+            達しない列はフィットせず NaN とする（デフォルト: None）
+        cache : ResultCache or None, optional
+            フィット結果のディスクキャッシュ。読み込み元ファイル（パス・
+            更新時刻・サイズ）、波長範囲、静止波長、ウィンドウ幅、エンジン、
+            結果に影響するオプションが一致する結果があればフィットせずに返し、
+            なければフィット結果を保存する。保存に失敗した場合（キャッシュ
+            ディレクトリが読み取り専用・容量不足など）もフィット結果は返す。
+            並列実行の設定はキーに含めない（デフォルト: None）
 
         Returns
         -------
         VelocityModel
             後退速度モデル
+
+        Raises
+        ------
+        ValueError
+            未知のフィッティングエンジン名、エンジンが対応していない
+            オプションが指定された場合、``n_realizations`` が負の場合、
+            ``chunk_size`` が 1 未満の場合、または ``bin_factor`` と
+            ``target_snr`` が同時に指定された場合
         """
-        wavelengths = image.header.spectrogram.wavelength_array
-        data = image.spectrum.data
-        n_spatial = data.shape[1]
+        (model,) = cls.from_images(
+            [image], rest_wavelength, window_width,
+            slit_offsets=[slit_offset],
+            pixel_scale=pixel_scale,
+            method=method,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            executor=executor,
+            warm_start=warm_start,
+            use_error=use_error,
+            dq_mask=dq_mask,
+            n_realizations=n_realizations,
+            seed=seed,
+            bin_factor=bin_factor,
+            target_snr=target_snr,
+            max_bin_size=max_bin_size,
+            cache=cache,
+        )
+        return model
+
+    @classmethod
+    def from_images(
+        cls,
+        images: list[ImageModel],
+        rest_wavelength: float,
+        window_width: float,
+        slit_offsets: list[float] | None = None,
+        pixel_scale: float = 0.05,
+        method: str = "gaussian",
+        max_workers: int | None = None,
+        chunk_size: int = 128,
+        executor: str = "process",
+        warm_start: bool = False,
+        use_error: bool = False,
+        dq_mask: int | None = None,
+        n_realizations: int = 0,
+        seed: int | None = None,
+        bin_factor: int | None = None,
+        target_snr: float | None = None,
+        max_bin_size: int | None = None,
+        cache: ResultCache | None = None,
+    ) -> list[Self]:
+        """複数の ImageModel から後退速度モデルを一括生成する.
 
-        observed = np.full(n_spatial, np.nan)
+        ``max_workers`` を指定すると、全画像の列チャンクを1つの
+        プールで並列にフィットする。結果の順序は ``images`` と一致する。
+        列ごとに独立なエンジンの結果は逐次実行と同じになるが、
+        "gaussian_batch" は一括処理する列数が変わるため丸め誤差の範囲で
+        異なりうる。``warm_start`` はチャンクの境界で初期値が途切れる。
 
-        for i in range(n_spatial):
-            flux = data[:, i]
-            try:
-                observed[i] = _fit_emission_line(
-                    wavelengths, flux, rest_wavelength, window_width
+        Parameters
+        ----------
+        images : list[ImageModel]
+            スペクトルデータを持つ ImageModel のリスト
+        rest_wavelength : float
+            輝線の静止波長 [m]
+        window_width : float
+            フィッティングウィンドウの半幅 [m]
+        slit_offsets : list[float] or None, optional
+            各画像のスリットオフセット [arcsec]。None の場合はすべて 0.0
+        pixel_scale : float, optional
+            空間方向の1ピクセルあたりのスケール [arcsec/pixel]
+        method : str, optional
+            フィッティングエンジン名（`from_image` を参照）
+        max_workers : int or None, optional
+            並列ワーカー数。None の場合は逐次にフィットする（デフォルト: None）
+        chunk_size : int, optional
+            1タスクあたりの空間ピクセル数（デフォルト: 128）
+        executor : str, optional
+            並列実行方式（"thread", "process"）。デフォルト: "process"
+        warm_start : bool, optional
+            隣接する空間ピクセルの収束パラメータを初期値に使うかどうか
+            （`from_image` を参照）
+        use_error : bool, optional
+            統計的誤差で重み付けするかどうか（`from_image` を参照）
+        dq_mask : int or None, optional
+            除外する品質フラグのビットマスク（`from_image` を参照）
+        n_realizations : int, optional
+            誤差評価のモンテカルロ実現値の数（`from_image` を参照）
+        seed : int or None, optional
+            モンテカルロ法の乱数シード（デフォルト: None）
+        bin_factor : int or None, optional
+            固定幅ビニングの列数（`from_image` を参照）
+        target_snr : float or None, optional
+            適応的ビニングの目標 S/N（`from_image` を参照）
+        max_bin_size : int or None, optional
+            適応的ビニングの最大列数（`from_image` を参照）
+        cache : ResultCache or None, optional
+            フィット結果のディスクキャッシュ（`from_image` を参照）。
+            キャッシュにない画像のみをフィットする。
+
+        Returns
+        -------
+        list[VelocityModel]
+            各画像の後退速度モデル
+
+        Raises
+        ------
+        ValueError
+            ``slit_offsets`` の長さが ``images`` と一致しない場合
+        """
+        if slit_offsets is None:
+            slit_offsets = [0.0] * len(images)
+        if len(slit_offsets) != len(images):
+            raise ValueError(
+                f"slit_offsets の長さ ({len(slit_offsets)}) が"
+                f"画像数 ({len(images)}) と一致しません"
+            )
+        settings: dict[str, Any] = dict(
+            use_error=use_error,
+            dq_mask=dq_mask,
+            n_realizations=n_realizations,
+            seed=seed,
+            bin_factor=bin_factor,
+            target_snr=target_snr,
+            max_bin_size=max_bin_size,
+        )
+        options = _fit_options(warm_start=warm_start)
+
+        models: dict[int, Self] = {}
+        keys: dict[int, str] = {}
+        if cache is not None:
+            for i, (image, offset) in enumerate(zip(images, slit_offsets)):
+                keys[i] = _result_key(
+                    image, rest_wavelength, window_width, pixel_scale,
+                    method, {**options, **settings},
                 )
-            except RuntimeError:
-                continue
+                arrays = cache.get(keys[i])
+                if arrays is not None:
+                    models[i] = cls._from_arrays(arrays, rest_wavelength, offset)
 
-        redshifts = (observed - rest_wavelength) / rest_wavelength
-        velocities = SPEED_OF_LIGHT * redshifts
+        missing = [i for i in range(len(images)) if i not in models]
+        if missing:
+            fits = _fit_images(
+                [images[i] for i in missing], rest_wavelength, window_width,
+                method, max_workers, chunk_size, executor, options, **settings,
+            )
+            for i, fit in zip(missing, fits):
+                models[i] = cls._from_params(
+                    fit.params, images[i], rest_wavelength, slit_offsets[i],
+                    pixel_scale, fit.center_errors, fit.bin_labels, fit.diagnostics,
+                )
+                if cache is not None:
+                    try:
+                        cache.put(keys[i], models[i]._to_arrays())
+                    except OSError:
+                        pass  # キャッシュへの保存は必須ではない
+        return [models[i] for i in range(len(images))]
 
-        spatial_pixels = image.header.spectrogram.spatial_array
-        spatial_positions = spatial_pixels * pixel_scale
+    def _to_arrays(self) -> dict[str, np.ndarray]:
+        """キャッシュに保存する配列を返す（スリットオフセットは含めない）."""
+        arrays = {
+            "observed_wavelengths": self.observed_wavelengths,
+            "velocities": self.velocities,
+            "spatial_positions": self.spatial_positions,
+        }
+        if self.velocity_errors is not None:
+            arrays["velocity_errors"] = self.velocity_errors
+        if self.bin_labels is not None:
+            arrays["bin_labels"] = self.bin_labels
+        if self.diagnostics is not None:
+            arrays["diagnostics"] = self.diagnostics
+        if self.line_params is not None:
+            arrays["line_params"] = self.line_params
+        return arrays
 
+    @classmethod
+    def _from_arrays(
+        cls,
+        arrays: dict[str, np.ndarray],
+        rest_wavelength: float,
+        slit_offset: float,
+    ) -> Self:
+        """`_to_arrays` で保存した配列から後退速度モデルを復元する."""
+        observed = arrays["observed_wavelengths"]
         return cls(
             rest_wavelength=rest_wavelength,
             observed_wavelengths=observed,
-            redshifts=redshifts,
-            velocities=velocities,
-            spatial_positions=spatial_positions,
+            redshifts=(observed - rest_wavelength) / rest_wavelength,
+            velocities=arrays["velocities"],
+            spatial_positions=arrays["spatial_positions"],
             slit_offset=slit_offset,
+            velocity_errors=arrays.get("velocity_errors"),
+            bin_labels=arrays.get("bin_labels"),
+            diagnostics=arrays.get("diagnostics"),
+            line_params=arrays.get("line_params"),
         )
 
+    def _line_param(self, index: int) -> np.ndarray:
+        """``line_params`` の列を返す（持たない場合は NaN）."""
+        if self.line_params is None:
+            return np.full(len(self.velocities), np.nan)
+        return self.line_params[:, index]
+
+    @property
+    def sigma_velocities(self) -> np.ndarray:
+        """各空間位置の速度分散 [m/s] (1D)."""
+        return SPEED_OF_LIGHT * np.abs(self._line_param(2)) / self.rest_wavelength
+
+    @property
+    def line_fluxes(self) -> np.ndarray:
+        """各空間位置の輝線の積分フラックス amp·σ·√(2π) [データ単位 × m] (1D)."""
+        return self._line_param(0) * np.abs(self._line_param(2)) * np.sqrt(2.0 * np.pi)
+
+    @property
+    def continua(self) -> np.ndarray:
+        """各空間位置の連続光レベル [データ単位] (1D)."""
+        return self._line_param(3)
+
+    def diagnostics_summary(self) -> dict[str, Any]:
+        """フィット診断情報を集計する.
+
+        Returns
+        -------
+        dict[str, Any]
+            以下のキーを持つ辞書。
+
+            - ``n_positions``: 空間位置の数
+            - ``n_converged``: 収束した空間位置の数
+            - ``failures``: 失敗の分類ごとの空間位置の数（0 件の分類は含めない）
+            - ``total_time`` / ``median_time`` / ``max_time``: フィット時間 [s]
+            - ``slowest_position``: フィット時間が最大の空間位置のインデックス
+            - ``total_nfev`` / ``median_nfev`` / ``max_nfev``: 関数評価回数
+
+        Raises
+        ------
+        ValueError
+            診断情報を持たない場合
+        """
+        if self.diagnostics is None:
+            raise ValueError("このモデルはフィット診断情報を持っていません")
+        diagnostics = self.diagnostics
+        failures = {
+            category: int(np.count_nonzero(diagnostics["failure"] == category))
+            for category in FAILURE_CATEGORIES
+        }
+        empty = len(diagnostics) == 0
+        return {
+            "n_positions": len(diagnostics),
+            "n_converged": int(np.count_nonzero(diagnostics["converged"])),
+            "failures": {k: v for k, v in failures.items() if v > 0},
+            "total_time": float(np.sum(diagnostics["time"])),
+            "median_time": float("nan") if empty else float(np.median(diagnostics["time"])),
+            "max_time": float("nan") if empty else float(np.max(diagnostics["time"])),
+            "slowest_position": None if empty else int(np.argmax(diagnostics["time"])),
+            "total_nfev": int(np.sum(diagnostics["nfev"])),
+            "median_nfev": float("nan") if empty else float(np.median(diagnostics["nfev"])),
+            "max_nfev": 0 if empty else int(np.max(diagnostics["nfev"])),
+        }
+
     @staticmethod
     def plot_fit(
         image: ImageModel,
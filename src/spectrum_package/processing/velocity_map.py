@@ -2,14 +2,29 @@
 
 複数のスリットの VelocityModel を集約し、
 補間によって2次元速度マップを生成する。
+
+`VelocityMap.with_slit` / `without_slit` / `replace_slit` は既存の
+VelocityModel とグリッドを再利用する。補間値が隣り合うスリットだけで
+決まることが保証される場合（`has_local_support`）は、変更したスリットの
+両隣のスリットに挟まれた範囲のグリッド行のみを再補間し、そうでない場合は
+全行を再補間する。
+
+`VelocityMap.resampling_operator` は観測配置（全スリットの全空間ピクセル）
+から補間先グリッドへの補間を疎行列の演算子として構築し、物理量や
+波長チャンネルの補間を疎行列積で行えるようにする。
+
+``max_memory`` を指定すると、グリッドを行方向のタイルに分けて補間し、
+補間の中間配列のメモリ使用量をその範囲に抑える。``store_axes=True`` の
+場合は ``x_coords`` / ``y_coords`` に meshgrid ではなく 1D の軸を保持する。
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Self, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .decomposition import ComponentVelocityModel
     from .instrument import InstrumentModel
 
 import matplotlib.pyplot as plt
@@ -18,7 +33,167 @@ import numpy as np
 
 from .velocity import VelocityModel
 from .image import ImageCollection
-from ..util.interpolation import Interpolator, get_interpolator
+from ..util.interpolation import Interpolator, get_interpolator, has_local_support
+from ..util.resampling import ResamplingOperator
+from ..util.result_cache import ResultCache
+
+
+def _scatter_points(models: list[VelocityModel]) -> tuple[np.ndarray, np.ndarray]:
+    """全モデルの有効な後退速度を散布データとして集める.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (座標 (N, 2): [スリット方向, スリット垂直方向（slit_offset）],
+         後退速度 (N,))
+    """
+    all_x: list[np.ndarray] = []  # スリット方向
+    all_y: list[np.ndarray] = []  # スリット垂直方向（slit_offset）
+    all_v: list[np.ndarray] = []
+
+    for model in models:
+        valid = ~np.isnan(model.velocities)
+        all_x.append(model.spatial_positions[valid])
+        all_y.append(np.full(int(np.sum(valid)), model.slit_offset))
+        all_v.append(model.velocities[valid])
+
+    points = np.column_stack([np.concatenate(all_x), np.concatenate(all_y)])
+    return points, np.concatenate(all_v)
+
+
+def _neighbour_band(
+    offsets: np.ndarray, changed: list[float], reach: int
+) -> tuple[float, float]:
+    """変更されたスリット位置から ``reach`` 本隣のスリットまでの範囲を返す.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        変更後のスリットオフセット（昇順, 重複なし）
+    changed : list[float]
+        変更されたスリットのオフセット
+    reach : int
+        含める隣のスリットの本数（片側）
+
+    Returns
+    -------
+    tuple[float, float]
+        範囲の (下限, 上限)。隣のスリットが足りない側は ±inf。
+    """
+    lo, hi = np.inf, -np.inf
+    for c in changed:
+        below = offsets[offsets < c]
+        above = offsets[offsets > c]
+        lo = min(lo, below[-reach] if len(below) >= reach else -np.inf)
+        hi = max(hi, above[reach - 1] if len(above) >= reach else np.inf)
+    return lo, hi
+
+
+#: 補間の1グリッド点・1物理量あたりの中間配列のメモリ使用量の目安 [byte]
+#: （グリッド座標、三角形の探索結果、重心座標の重みなど）
+_BYTES_PER_GRID_POINT: int = 256
+
+
+def _spaced_axis(start: float, stop: float, spacing: float) -> np.ndarray:
+    """``start`` から ``spacing`` 間隔で ``stop`` を超えない範囲の軸を返す."""
+    n = int(np.floor((stop - start) / spacing + 1e-9)) + 1
+    return start + spacing * np.arange(n)
+
+
+def _map_axes(
+    points: np.ndarray,
+    models: list[VelocityModel],
+    grid_resolution: int | None,
+    grid_spacing: float | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """散布データの範囲を覆う補間先グリッドの軸を生成する.
+
+    ``grid_spacing`` を指定した場合は両軸をその間隔とする。指定しない場合、
+    スリット方向は1スリットの空間ピクセル数、スリット垂直方向は
+    ``grid_resolution``（None の場合はスリット数の4倍）の点数とする。
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (X 軸, Y 軸)（1D）
+    """
+    x_min, x_max = points[:, 0].min(), points[:, 0].max()
+    y_min, y_max = points[:, 1].min(), points[:, 1].max()
+
+    if grid_spacing is not None:
+        if grid_spacing <= 0:
+            raise ValueError("grid_spacing は正の値を指定してください")
+        return _spaced_axis(x_min, x_max, grid_spacing), _spaced_axis(y_min, y_max, grid_spacing)
+
+    n_rows = 4 * len(models) if grid_resolution is None else grid_resolution
+
+    grid_x_1d = np.linspace(x_min, x_max, len(models[0].velocities))
+    grid_y_1d = np.linspace(y_min, y_max, n_rows)
+    return grid_x_1d, grid_y_1d
+
+
+def _evaluate_tiled(
+    interpolator: Interpolator,
+    points: np.ndarray,
+    values: np.ndarray,
+    x_axis: np.ndarray,
+    y_axis: np.ndarray,
+    max_memory: int | None = None,
+) -> np.ndarray:
+    """グリッドを行方向のタイルに分けて補間する.
+
+    各タイルの meshgrid と補間の中間配列の大きさが ``max_memory`` に
+    収まるように、1タイルあたりの行数を決める（最低1行）。
+    結果の配列は全体を確保する。
+
+    Parameters
+    ----------
+    interpolator : Interpolator
+        補間アルゴリズム
+    points : np.ndarray
+        既知点の座標 (N, 2)
+    values : np.ndarray
+        既知点の値 (N,) または (N, k)
+    x_axis : np.ndarray
+        グリッドの X 軸 (nx,)
+    y_axis : np.ndarray
+        グリッドの Y 軸 (ny,)
+    max_memory : int or None, optional
+        補間の中間配列に使用するメモリの目安 [byte]。None の場合は
+        グリッド全体を一度に補間する（デフォルト: None）
+
+    Returns
+    -------
+    np.ndarray
+        補間された配列 (ny, nx) または (ny, nx, k)
+    """
+    ny, nx = len(y_axis), len(x_axis)
+    rows_per_tile = ny
+    if max_memory is not None:
+        n_values = 1 if values.ndim == 1 else values.shape[1]
+        per_row = nx * _BYTES_PER_GRID_POINT * n_values
+        rows_per_tile = max(1, int(max_memory // per_row))
+
+    if rows_per_tile >= ny:
+        grid_x, grid_y = np.meshgrid(x_axis, y_axis)
+        return interpolator.interpolate(points, values, grid_x, grid_y)
+
+    result = np.empty((ny, nx) + values.shape[1:])
+    for start in range(0, ny, rows_per_tile):
+        tile = slice(start, start + rows_per_tile)
+        grid_x, grid_y = np.meshgrid(x_axis, y_axis[tile])
+        result[tile] = interpolator.interpolate(points, values, grid_x, grid_y)
+    return result
+
+
+def _grid_coords(
+    x_axis: np.ndarray, y_axis: np.ndarray, store_axes: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """マップに保持するグリッド座標を返す（1D の軸、または 2D meshgrid）."""
+    if store_axes:
+        return x_axis, y_axis
+    grid_x, grid_y = np.meshgrid(x_axis, y_axis)
+    return grid_x, grid_y
 
 
 @dataclass(frozen=True)
@@ -34,25 +209,50 @@ class VelocityMap:
     velocity_2d : np.ndarray
         補間済み 2D 速度マップ [m/s]
     x_coords : np.ndarray
-        X 軸座標グリッド（スリット方向）[arcsec]
+        X 軸座標グリッド（スリット方向）[arcsec]。2D meshgrid、
+        または ``store_axes=True`` で生成した場合は 1D の軸 (nx,)
     y_coords : np.ndarray
-        Y 軸座標グリッド（スリット垂直方向）[arcsec]
-    interpolation_method : str
-        使用した補間方法名
+        Y 軸座標グリッド（スリット垂直方向）[arcsec]。2D meshgrid、
+        または ``store_axes=True`` で生成した場合は 1D の軸 (ny,)
+    interpolation_method : str or Interpolator
+        使用した補間方法名（インスタンスを指定した場合はそのインスタンス）
+    grid_resolution : int or None
+        生成時に指定したスリット垂直方向のグリッド解像度
+        （None の場合はスリット数から決めた既定値）
+    grid_spacing : float or None
+        生成時に指定したグリッドの間隔 [arcsec]
+    max_memory : int or None
+        補間の中間配列に使用するメモリの目安 [byte]（再補間でも使用する）
     """
 
     velocity_models: list[VelocityModel]
     velocity_2d: np.ndarray
     x_coords: np.ndarray
     y_coords: np.ndarray
-    interpolation_method: str
+    interpolation_method: str | Interpolator
+    grid_resolution: int | None = None
+    grid_spacing: float | None = None
+    max_memory: int | None = None
+
+    @property
+    def x_axis(self) -> np.ndarray:
+        """グリッドの X 軸 (nx,) [arcsec]."""
+        return self.x_coords if self.x_coords.ndim == 1 else self.x_coords[0]
+
+    @property
+    def y_axis(self) -> np.ndarray:
+        """グリッドの Y 軸 (ny,) [arcsec]."""
+        return self.y_coords if self.y_coords.ndim == 1 else self.y_coords[:, 0]
 
     @classmethod
     def _from_velocity_models(
         cls,
         models: list[VelocityModel],
-        method: str = "linear",
+        method: str | Interpolator = "linear",
         grid_resolution: int | None = None,
+        grid_spacing: float | None = None,
+        max_memory: int | None = None,
+        store_axes: bool = False,
     ) -> Self:
         """複数の VelocityModel から 2D 速度マップを生成する.
 
@@ -60,11 +260,21 @@ class VelocityMap:
         ----------
         models : list[VelocityModel]
             各スリットの VelocityModel リスト
-        method : str, optional
-            補間メソッド名（"linear", "nearest", "cubic"）。
-            デフォルト: "linear"
+        method : str or Interpolator, optional
+            補間メソッド名（"linear", "nearest", "cubic", "rectilinear",
+            "idw", "natural"）、または Interpolator のインスタンス
+            （`get_interpolator` を参照）。デフォルト: "linear"
         grid_resolution : int, optional
             グリッドの解像度（各軸のピクセル数）。
+        grid_spacing : float or None, optional
+            グリッドの間隔 [arcsec]（両軸共通）。指定した場合は
+            ``grid_resolution`` より優先する（デフォルト: None）
+        max_memory : int or None, optional
+            補間の中間配列に使用するメモリの目安 [byte]。指定した場合は
+            グリッドを行方向のタイルに分けて補間する（デフォルト: None）
+        store_axes : bool, optional
+            ``x_coords`` / ``y_coords`` に 2D meshgrid ではなく 1D の軸を
+            保持するかどうか（デフォルト: False）
 
         Returns
         -------
@@ -74,43 +284,211 @@ class VelocityMap:
         interpolator = get_interpolator(method)
 
         # 全モデルから散布データを収集
-        all_x: list[np.ndarray] = []  # スリット方向
-        all_y: list[np.ndarray] = []  # スリット垂直方向（slit_offset）
-        all_v: list[np.ndarray] = []
-
-        for model in models:
-            n = len(model.velocities)
-            valid = ~np.isnan(model.velocities)
-            all_x.append(model.spatial_positions[valid])
-            all_y.append(np.full(int(np.sum(valid)), model.slit_offset))
-            all_v.append(model.velocities[valid])
-
-        points_x = np.concatenate(all_x)
-        points_y = np.concatenate(all_y)
-        values = np.concatenate(all_v)
-        points = np.column_stack([points_x, points_y])
-
-        x_min, x_max = points_x.min(), points_x.max()
-        y_min, y_max = points_y.min(), points_y.max()
-
-        if grid_resolution is None:
-            grid_resolution = 4 * len(models)
-
-        grid_x_1d = np.linspace(x_min, x_max, len(models[0].velocities))
-        grid_y_1d = np.linspace(y_min, y_max, grid_resolution)
-        grid_x, grid_y = np.meshgrid(grid_x_1d, grid_y_1d)
+        points, values = _scatter_points(models)
+        x_axis, y_axis = _map_axes(points, models, grid_resolution, grid_spacing)
 
         # 補間実行
-        velocity_2d = interpolator.interpolate(points, values, grid_x, grid_y)
+        velocity_2d = _evaluate_tiled(interpolator, points, values, x_axis, y_axis, max_memory)
+        x_coords, y_coords = _grid_coords(x_axis, y_axis, store_axes)
 
         return cls(
             velocity_models=models,
             velocity_2d=velocity_2d,
-            x_coords=grid_x,
-            y_coords=grid_y,
+            x_coords=x_coords,
+            y_coords=y_coords,
             interpolation_method=method,
+            grid_resolution=grid_resolution,
+            grid_spacing=grid_spacing,
+            max_memory=max_memory,
+        )
+
+    @staticmethod
+    def resampling_operator(
+        models: list[VelocityModel],
+        method: str = "linear",
+        grid_resolution: int | None = None,
+        cache: ResultCache | None = None,
+        grid_spacing: float | None = None,
+    ) -> ResamplingOperator:
+        """観測配置からグリッドへの補間を疎行列の演算子として構築する.
+
+        標本点はフィットの成否によらず全スリットの全空間ピクセル
+        （``models`` の順に連結）とし、グリッドは `_from_velocity_models` と
+        同じ規則で全標本点の範囲から作る。観測配置が同じであれば、
+        輝線や物理量が変わっても同じ演算子を使用できる。
+
+        各スリットの値を ``models`` の順に連結した (N,) または (N, k) の配列
+        （例: 各スリットのスペクトルを転置して連結した (N, n_wave)）を
+        `ResamplingOperator.apply` に渡して補間する。フィットに失敗した
+        空間ピクセル（NaN）を避けるには ``renormalize=True`` を指定する。
+
+        Parameters
+        ----------
+        models : list[VelocityModel]
+            各スリットの VelocityModel リスト（空間位置とスリットオフセットのみ使用）
+        method : str, optional
+            補間メソッド名（"linear", "nearest", "rectilinear"）。
+            デフォルト: "linear"
+        grid_resolution : int, optional
+            スリット垂直方向のグリッドの解像度
+        cache : ResultCache or None, optional
+            演算子のディスクキャッシュ（デフォルト: None）
+        grid_spacing : float or None, optional
+            グリッドの間隔 [arcsec]（`_from_velocity_models` を参照）
+
+        Returns
+        -------
+        ResamplingOperator
+            補間演算子
+        """
+        points = np.column_stack([
+            np.concatenate([model.spatial_positions for model in models]),
+            np.concatenate([np.full(len(model.spatial_positions), model.slit_offset) for model in models]),
+        ])
+        grid_x, grid_y = np.meshgrid(*_map_axes(points, models, grid_resolution, grid_spacing))
+        return ResamplingOperator.build(points, grid_x, grid_y, method=method, cache=cache)
+
+    def with_slit(self, model: VelocityModel) -> Self:
+        """スリットを1本追加した速度マップを返す.
+
+        既存の VelocityModel はフィットし直さずに再利用する。追加する
+        スリットが現在のグリッドの範囲内にある場合はグリッドを維持し、
+        そのスリットの両隣のスリットに挟まれた行のみを再補間する
+        （局所的に更新できない配置では全行。`_updated` を参照）。
+        範囲外の場合は全体を作り直す。
+
+        Parameters
+        ----------
+        model : VelocityModel
+            追加するスリットの VelocityModel（リストの末尾に追加する）
+
+        Returns
+        -------
+        VelocityMap
+            更新された速度マップ
+        """
+        return self._updated(
+            [*self.velocity_models, model], changed=[model.slit_offset]
         )
 
+    def without_slit(self, index: int) -> Self:
+        """スリットを1本取り除いた速度マップを返す.
+
+        グリッドは維持し、取り除いたスリットの両隣のスリットに挟まれた
+        行のみを再補間する（局所的に更新できない配置では全行。端のスリットを
+        取り除いた場合、残りのスリットの範囲外となる行は NaN になる）。
+
+        Parameters
+        ----------
+        index : int
+            取り除くスリットの ``velocity_models`` のインデックス
+
+        Returns
+        -------
+        VelocityMap
+            更新された速度マップ
+
+        Raises
+        ------
+        IndexError
+            インデックスが範囲外の場合
+        """
+        removed = self.velocity_models[index]
+        models = list(self.velocity_models)
+        del models[index]
+        return self._updated(models, changed=[removed.slit_offset])
+
+    def replace_slit(self, index: int, model: VelocityModel) -> Self:
+        """スリットを1本置き換えた速度マップを返す.
+
+        置き換え前後のスリット位置それぞれについて、両隣のスリットに
+        挟まれた行のみを再補間する（局所的に更新できない配置では全行）。
+
+        Parameters
+        ----------
+        index : int
+            置き換えるスリットの ``velocity_models`` のインデックス
+        model : VelocityModel
+            新しい VelocityModel
+
+        Returns
+        -------
+        VelocityMap
+            更新された速度マップ
+
+        Raises
+        ------
+        IndexError
+            インデックスが範囲外の場合
+        """
+        old = self.velocity_models[index]
+        models = list(self.velocity_models)
+        models[index] = model
+        return self._updated(models, changed=[old.slit_offset, model.slit_offset])
+
+    def _updated(self, models: list[VelocityModel], changed: list[float]) -> Self:
+        """スリット構成を変更した速度マップを、影響範囲のみ再補間して返す.
+
+        変更前・変更後の配置と、再補間に使用する点のいずれについても
+        補間値が隣り合うスリットの標本点だけで決まる場合
+        （`has_local_support`）、スリット位置 c の変更が影響するのは c の
+        両隣のスリットの間に限られる。その範囲の行のみを、さらに1本外側の
+        スリットまでの点から再補間する。隣のスリットは有効な点を持つ
+        スリットから数える。
+
+        それ以外の場合（欠損のある配置での "linear" / "nearest"、
+        "cubic"、"idw"、"natural" など）は、欠損を挟んだ遠いスリットや
+        全体の点が補間値に寄与しうるため、グリッドを維持して全行を再補間する。
+
+        Parameters
+        ----------
+        models : list[VelocityModel]
+            変更後の VelocityModel リスト
+        changed : list[float]
+            追加・削除・置換されたスリットのオフセット [arcsec]
+
+        Returns
+        -------
+        VelocityMap
+            更新された速度マップ
+        """
+        points, values = _scatter_points(models)
+        x_grid = self.x_axis
+        y_grid = self.y_axis
+        inside = (
+            np.all(points[:, 0] >= x_grid[0]) and np.all(points[:, 0] <= x_grid[-1])
+            and np.all(points[:, 1] >= y_grid[0]) and np.all(points[:, 1] <= y_grid[-1])
+        )
+        if not inside:
+            return type(self)._from_velocity_models(
+                models, self.interpolation_method, self.grid_resolution,
+                grid_spacing=self.grid_spacing,
+                max_memory=self.max_memory,
+                store_axes=self.x_coords.ndim == 1,
+            )
+
+        interpolator = get_interpolator(self.interpolation_method)
+        offsets = np.unique(points[:, 1])
+        row_lo, row_hi = _neighbour_band(offsets, changed, 1)
+        point_lo, point_hi = _neighbour_band(offsets, changed, 2)
+        used = (points[:, 1] >= point_lo) & (points[:, 1] <= point_hi)
+        previous, _ = _scatter_points(self.velocity_models)
+        local = all(
+            has_local_support(interpolator, p) for p in (previous, points, points[used])
+        )
+        if not local:
+            row_lo, row_hi = -np.inf, np.inf
+            used = np.ones(len(points), dtype=bool)
+
+        rows = (y_grid >= row_lo) & (y_grid <= row_hi)
+        velocity_2d = self.velocity_2d.copy()
+        if np.any(rows):
+            velocity_2d[rows] = _evaluate_tiled(
+                interpolator, points[used], values[used], x_grid, y_grid[rows],
+                self.max_memory,
+            )
+        return replace(self, velocity_models=models, velocity_2d=velocity_2d)
+
     @classmethod
     def from_image_collection(
         cls,
@@ -118,8 +496,24 @@ class VelocityMap:
         rest_wavelength: float,
         window_width: float,
         slit_step: float = 0.2,
-        method: str = "linear",
+        method: str | Interpolator = "linear",
         grid_resolution: int | None = None,
+        fit_method: str = "gaussian",
+        max_workers: int | None = None,
+        chunk_size: int = 128,
+        executor: str = "process",
+        warm_start: bool = False,
+        use_error: bool = False,
+        dq_mask: int | None = None,
+        n_realizations: int = 0,
+        seed: int | None = None,
+        bin_factor: int | None = None,
+        target_snr: float | None = None,
+        max_bin_size: int | None = None,
+        cache: ResultCache | None = None,
+        grid_spacing: float | None = None,
+        max_memory: int | None = None,
+        store_axes: bool = False,
     ) -> Self:
         """ImageCollection から VelocityMap を直接生成する.
 
@@ -133,29 +527,132 @@ class VelocityMap:
             フィッティングウィンドウの半幅 [m]
         slit_step : float, optional
             スリット間のオフセットステップ [arcsec]（デフォルト: 0.2）
-        method : str, optional
-            補間メソッド名（"linear", "nearest", "cubic"）。
-            デフォルト: "linear"
+        method : str or Interpolator, optional
+            補間メソッド名（"linear", "nearest", "cubic", "rectilinear",
+            "idw", "natural"）、または Interpolator のインスタンス
+            （`get_interpolator` を参照）。デフォルト: "linear"
         grid_resolution : int, optional
             グリッドの解像度（各軸のピクセル数）。
+        fit_method : str, optional
+            輝線フィッティングエンジン名（`VelocityModel.from_image` を参照）。
+            デフォルト: "gaussian"
+        max_workers : int or None, optional
+            フィッティングの並列ワーカー数。指定すると全スリットの
+            列チャンクを1つのプールで並列に処理する（デフォルト: None）
+        chunk_size : int, optional
+            1タスクあたりの空間ピクセル数（デフォルト: 128）
+        executor : str, optional
+            並列実行方式（"thread", "process"）。デフォルト: "process"
+        warm_start : bool, optional
+            隣接する空間ピクセルの収束パラメータを初期値に使うかどうか
+            （`VelocityModel.from_image` を参照, デフォルト: False）
+        use_error : bool, optional
+            統計的誤差（HDU 2）で重み付けするかどうか（デフォルト: False）
+        dq_mask : int or None, optional
+            フィットから除外する品質フラグ（HDU 3）のビットマスク
+            （デフォルト: None）
+        n_realizations : int, optional
+            各スリットの後退速度の誤差を評価するモンテカルロ実現値の数
+            （`VelocityModel.from_image` を参照, デフォルト: 0）
+        seed : int or None, optional
+            モンテカルロ法の乱数シード（デフォルト: None）
+        bin_factor : int or None, optional
+            フィット前の固定幅ビニングの列数（デフォルト: None）
+        target_snr : float or None, optional
+            フィット前の適応的ビニングの目標 S/N（デフォルト: None）
+        max_bin_size : int or None, optional
+            適応的ビニングの最大列数（`VelocityModel.from_image` を参照）
+        cache : ResultCache or None, optional
+            各スリットのフィット結果のディスクキャッシュ
+            （`VelocityModel.from_image` を参照, デフォルト: None）
+        grid_spacing : float or None, optional
+            グリッドの間隔 [arcsec]（`_from_velocity_models` を参照）
+        max_memory : int or None, optional
+            補間の中間配列に使用するメモリの目安 [byte]
+            （`_from_velocity_models` を参照）
+        store_axes : bool, optional
+            1D の軸のみを保持するかどうか（`_from_velocity_models` を参照）
 
         Returns
         -------
         VelocityMap
             補間された 2D 速度マップ
         """
-        models = [
-            VelocityModel.from_image(
-                image,
-                rest_wavelength=rest_wavelength,
-                window_width=window_width,
-                slit_offset=i * slit_step,
-            )
-            for i, image in enumerate(image_collection)
-        ]
+        images = list(image_collection)
+        models = VelocityModel.from_images(
+            images,
+            rest_wavelength=rest_wavelength,
+            window_width=window_width,
+            slit_offsets=[i * slit_step for i in range(len(images))],
+            method=fit_method,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            executor=executor,
+            warm_start=warm_start,
+            use_error=use_error,
+            dq_mask=dq_mask,
+            n_realizations=n_realizations,
+            seed=seed,
+            bin_factor=bin_factor,
+            target_snr=target_snr,
+            max_bin_size=max_bin_size,
+            cache=cache,
+        )
 
         return cls._from_velocity_models(
-            models, method=method, grid_resolution=grid_resolution
+            models,
+            method=method,
+            grid_resolution=grid_resolution,
+            grid_spacing=grid_spacing,
+            max_memory=max_memory,
+            store_axes=store_axes,
+        )
+
+    @classmethod
+    def from_component_models(
+        cls,
+        component_models: list[ComponentVelocityModel],
+        component: int = 0,
+        method: str | Interpolator = "linear",
+        grid_resolution: int | None = None,
+        grid_spacing: float | None = None,
+        max_memory: int | None = None,
+        store_axes: bool = False,
+    ) -> Self:
+        """多成分分解の結果から、指定した成分の 2D 速度マップを生成する.
+
+        Parameters
+        ----------
+        component_models : list[ComponentVelocityModel]
+            各スリットの多成分分解結果
+        component : int, optional
+            成分インデックス（速度分散の小さい順, デフォルト: 0）
+        method : str or Interpolator, optional
+            補間メソッド名（"linear", "nearest", "cubic", "rectilinear",
+            "idw", "natural"）、または Interpolator のインスタンス
+            （`get_interpolator` を参照）。デフォルト: "linear"
+        grid_resolution : int, optional
+            グリッドの解像度（各軸のピクセル数）。
+        grid_spacing : float or None, optional
+            グリッドの間隔 [arcsec]（`_from_velocity_models` を参照）
+        max_memory : int or None, optional
+            補間の中間配列に使用するメモリの目安 [byte]
+            （`_from_velocity_models` を参照）
+        store_axes : bool, optional
+            1D の軸のみを保持するかどうか（`_from_velocity_models` を参照）
+
+        Returns
+        -------
+        VelocityMap
+            指定成分の補間された 2D 速度マップ
+        """
+        return cls._from_velocity_models(
+            [model[component] for model in component_models],
+            method=method,
+            grid_resolution=grid_resolution,
+            grid_spacing=grid_spacing,
+            max_memory=max_memory,
+            store_axes=store_axes,
         )
 
     def plot(
@@ -1,6 +1,13 @@
 from .fits_reader import STISFitsReader, ReaderCollection
+from .header_index import HeaderIndex, HeaderIndexEntry
+from .result_cache import ResultCache
+from .resampling import ResamplingOperator
 
 __all__ = [
     "STISFitsReader",
     "ReaderCollection",
+    "HeaderIndex",
+    "HeaderIndexEntry",
+    "ResultCache",
+    "ResamplingOperator",
 ]
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""バッチ非線形最小二乗モジュール.
+
+同じ独立変数（波長配列）を共有する多数のデータ系列に対して、
+Levenberg–Marquardt 法による非線形最小二乗フィッティングを
+NumPy の配列演算で一括に行う。
+
+各系列は独立に収束判定され、収束した系列は以降の反復から除外される。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+#: バッチモデル関数の型: (x, params[n_batch, n_params]) -> [n_batch, n_x]
+BatchModel = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+#: バッチヤコビアンの型: (x, params[n_batch, n_params]) -> [n_batch, n_x, n_params]
+BatchJacobian = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+@dataclass(frozen=True)
+class BatchFitResult:
+    """バッチフィッティングの結果.
+
+    Attributes
+    ----------
+    params : np.ndarray
+        最適化されたパラメータ (n_batch, n_params)
+    converged : np.ndarray
+        各系列が収束したかどうか (n_batch,)
+    n_iter : np.ndarray
+        各系列の反復回数 (n_batch,)
+    nfev : np.ndarray
+        各系列のモデル評価回数 (n_batch,)
+    chi2 : np.ndarray
+        最終的な重み付き残差二乗和 (n_batch,)
+    """
+
+    params: np.ndarray
+    converged: np.ndarray
+    n_iter: np.ndarray
+    nfev: np.ndarray
+    chi2: np.ndarray
+
+
+def _chi2(
+    model: BatchModel,
+    x: np.ndarray,
+    y: np.ndarray,
+    w: np.ndarray,
+    params: np.ndarray,
+) -> np.ndarray:
+    """重み付き残差二乗和を計算する."""
+    r = y - model(x, params)
+    return np.sum(w * r * r, axis=1)
+
+
+def levenberg_marquardt(
+    model: BatchModel,
+    jacobian: BatchJacobian,
+    x: np.ndarray,
+    y: np.ndarray,
+    p0: np.ndarray,
+    weights: np.ndarray | None = None,
+    max_iter: int = 200,
+    xtol: float = 1.49012e-8,
+    ftol: float = 1.49012e-8,
+    lam0: float = 1e-3,
+    lam_max: float = 1e12,
+) -> BatchFitResult:
+    """Levenberg–Marquardt 法で多数の系列を一括フィッティングする.
+
+    Marquardt のスケーリング（J^T W J の対角成分による減衰）を用いる。
+    ``weights`` が 0 の点はフィッティングに寄与しない。
+
+    Parameters
+    ----------
+    model : BatchModel
+        モデル関数 ``model(x, params) -> (n_batch, n_x)``
+    jacobian : BatchJacobian
+        ヤコビアン ``jacobian(x, params) -> (n_batch, n_x, n_params)``
+    x : np.ndarray
+        全系列で共通の独立変数 (n_x,)
+    y : np.ndarray
+        観測値 (n_batch, n_x)
+    p0 : np.ndarray
+        初期パラメータ (n_batch, n_params)
+    weights : np.ndarray or None, optional
+        各点の重み（通常 1/σ²）(n_batch, n_x)。None の場合はすべて 1。
+    max_iter : int, optional
+        最大反復回数（デフォルト: 200）
+    xtol : float, optional
+        パラメータ変化の相対許容誤差（デフォルト: curve_fit と同じ値）
+    ftol : float, optional
+        残差二乗和の相対変化の許容誤差（デフォルト: curve_fit と同じ値）
+    lam0 : float, optional
+        減衰係数の初期値（デフォルト: 1e-3）
+    lam_max : float, optional
+        減衰係数の上限。これを超えた系列は収束失敗とする（デフォルト: 1e12）
+
+    Returns
+    -------
+    BatchFitResult
+        フィッティング結果。収束しなかった系列のパラメータは
+        最後に受理された値のまま残る。
+    """
+    y = np.asarray(y, dtype=float)
+    params = np.array(p0, dtype=float)
+    n_batch, n_params = params.shape
+    w = np.ones_like(y) if weights is None else np.asarray(weights, dtype=float)
+
+    converged = np.zeros(n_batch, dtype=bool)
+    n_iter = np.zeros(n_batch, dtype=int)
+    nfev = np.ones(n_batch, dtype=int)
+    lam = np.full(n_batch, lam0)
+    nu = np.full(n_batch, 2.0)
+    chi2 = _chi2(model, x, y, w, params)
+
+    # 有効点がパラメータ数に満たない系列・初期値が非有限の系列は対象外
+    active = (np.count_nonzero(w > 0, axis=1) >= n_params) & np.isfinite(chi2)
+    active &= np.all(np.isfinite(params), axis=1)
+    eye = np.eye(n_params)
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        p = params[idx]
+        yi, wi = y[idx], w[idx]
+
+        r = yi - model(x, p)
+        jac = jacobian(x, p)
+        jw = jac * wi[:, :, np.newaxis]
+        jtj = np.einsum("bxi,bxj->bij", jw, jac)
+        grad = np.einsum("bxi,bx->bi", jw, r)
+
+        diag = np.diagonal(jtj, axis1=1, axis2=2)
+        scale = np.where(diag > 0, diag, 1.0)
+        a = jtj + lam[idx, np.newaxis, np.newaxis] * scale[:, np.newaxis, :] * eye
+        try:
+            delta = np.linalg.solve(a, grad[:, :, np.newaxis])[:, :, 0]
+        except np.linalg.LinAlgError:
+            delta = np.einsum("bij,bj->bi", np.linalg.pinv(a), grad)
+
+        p_new = p + delta
+        chi2_new = _chi2(model, x, yi, wi, p_new)
+        n_iter[idx] += 1
+        nfev[idx] += 1
+
+        accept = np.isfinite(chi2_new) & (chi2_new <= chi2[idx])
+        small_step = np.all(
+            np.abs(delta) <= xtol * (np.abs(p_new) + xtol), axis=1
+        )
+        # MINPACK と同様に、実際の減少量と線形モデルの予測減少量が
+        # ともに十分小さい場合も収束とみなす
+        predicted = 2.0 * np.einsum("bi,bi->b", delta, grad) - np.einsum(
+            "bi,bij,bj->b", delta, jtj, delta
+        )
+        small_gain = ((chi2[idx] - chi2_new) <= ftol * chi2[idx]) & (
+            predicted <= ftol * chi2[idx]
+        )
+
+        # Nielsen の減衰係数更新: 利得比 rho に応じて連続的に調整する
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rho = (chi2[idx] - chi2_new) / predicted
+        rho = np.where(np.isfinite(rho), rho, 0.0)
+        acc = idx[accept]
+        params[acc] = p_new[accept]
+        lam[acc] *= np.maximum(1.0 / 3.0, 1.0 - (2.0 * rho[accept] - 1.0) ** 3)
+        lam[acc] = np.maximum(lam[acc], 1e-15)
+        nu[acc] = 2.0
+        rej = idx[~accept]
+        lam[rej] *= nu[rej]
+        nu[rej] *= 2.0
+
+        done = accept & (small_step | small_gain)
+        chi2[acc] = chi2_new[accept]
+        converged[idx[done]] = True
+        active[idx[done]] = False
+        active[rej[lam[rej] > lam_max]] = False
+
+    return BatchFitResult(
+        params=params,
+        converged=converged,
+        n_iter=n_iter,
+        nfev=nfev,
+        chi2=chi2,
+    )
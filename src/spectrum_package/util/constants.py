@@ -8,3 +8,7 @@ SPEED_OF_LIGHT: float = 2.998e8
 
 #: オングストロームからメートルへの変換係数 (1 Å = 1e-10 m)
 ANGSTROM_TO_METER: float = 1e-10
+
+#: STIS パイプラインが既定で「重大」とみなす品質フラグのビットマスク
+#: （SDQFLAGS キーワードの既定値）
+STIS_SDQ_FLAGS: int = 31743
@@ -2,6 +2,8 @@
 
 STIS の FITS ファイルを1回のオープンで全データ（ヘッダー + 画像データ）を
 読み取り、各モデルへ供給する Reader クラスを提供する。
+``lazy=True`` を指定した場合はヘッダーのみを読み込み、データ配列は
+最初にアクセスされた時点でメモリマップとして開く。
 
 STIS の FITS ファイル構成:
 
@@ -20,6 +22,8 @@ from typing import Self, Iterator
 import numpy as np
 from astropy.io import fits  # type: ignore
 
+from .parallel import parallel_map
+
 
 @dataclass(frozen=True)
 class STISFitsReader:
@@ -28,6 +32,10 @@ class STISFitsReader:
     ファイルを1回だけ開いて全 HDU のヘッダーとデータをキャッシュし、
     各モデルに必要な情報を提供する。
 
+    遅延モード（``lazy=True``）ではヘッダーのみを保持し、データ配列は
+    `image_data` / `spectrum_data` の初回呼び出し時にメモリマップで開いて
+    ``data`` にキャッシュする。
+
     Attributes
     ----------
     filename : Path
@@ -35,24 +43,31 @@ class STISFitsReader:
     headers : dict[int, fits.Header]
         HDU 番号をキーとするヘッダー辞書
     data : dict[int, np.ndarray]
-        HDU 番号をキーとするデータ配列辞書
+        HDU 番号をキーとするデータ配列辞書。
+        遅延モードでは読み込み済みの HDU のみを含む。
+    lazy : bool
+        遅延モードで開かれたかどうか（デフォルト: False）
     """
 
     filename: Path
     headers: dict[int, fits.Header] = field(repr=False)
     data: dict[int, np.ndarray] = field(repr=False)
+    lazy: bool = False
 
     @classmethod
-    def open(cls, filename: Path) -> Self:
+    def open(cls, filename: Path, lazy: bool = False) -> Self:
         """FITS ファイルを開いて全データを読み込む.
 
         ファイルを1回だけ開き、全 HDU のヘッダーとデータを
-        メモリにキャッシュする。
+        メモリにキャッシュする。``lazy=True`` の場合はヘッダーのみを
+        読み込み、データの読み込みは初回アクセス時まで遅延する。
 
         Parameters
         ----------
         filename : Path
             FITS ファイルのパス
+        lazy : bool, optional
+            データ配列の読み込みを遅延させるかどうか（デフォルト: False）
 
         Returns
         -------
@@ -65,10 +80,48 @@ class STISFitsReader:
         with fits.open(filename) as hdul:  # type: ignore
             for i, hdu in enumerate(hdul):  # type: ignore
                 headers[i] = hdu.header  # type: ignore
+                if lazy:
+                    continue
                 if hasattr(hdu, "data") and isinstance(hdu.data, np.ndarray):  # type: ignore
                     data_dict[i] = hdu.data  # type: ignore
 
-        return cls(filename=filename, headers=headers, data=data_dict)
+        return cls(filename=filename, headers=headers, data=data_dict, lazy=lazy)
+
+    def _has_data(self, hdu_number: int) -> bool:
+        """指定した HDU がデータ配列を持つかどうかを返す.
+
+        遅延モードではヘッダーの NAXIS キーワードから判定する。
+        """
+        if hdu_number in self.data:
+            return True
+        if not self.lazy or hdu_number not in self.headers:
+            return False
+        return int(self.headers[hdu_number].get("NAXIS", 0)) > 0  # type: ignore
+
+    def _load(self, hdu_numbers: tuple[int, ...]) -> None:
+        """未読み込みの HDU のデータをメモリマップで開いてキャッシュする.
+
+        複数の HDU を要求された場合もファイルは1回だけ開く。
+        ファイルを閉じた後も、配列が参照されている間はメモリマップが維持される。
+        """
+        pending = [
+            i for i in hdu_numbers if i not in self.data and self._has_data(i)
+        ]
+        if not pending:
+            return
+        with fits.open(self.filename, memmap=True) as hdul:  # type: ignore
+            for i in pending:
+                self.data[i] = hdul[i].data  # type: ignore
+
+    def _data_shape(self, hdu_number: int) -> tuple[int, ...] | None:
+        """データを読み込まずに HDU のデータ形状を返す."""
+        if hdu_number in self.data:
+            return self.data[hdu_number].shape
+        if not self._has_data(hdu_number):
+            return None
+        h = self.headers[hdu_number]
+        naxis = int(h.get("NAXIS", 0))  # type: ignore
+        return tuple(int(h.get(f"NAXIS{k}", 0)) for k in range(naxis, 0, -1))  # type: ignore
 
     def header(self, hdu_number: int) -> fits.Header:
         """指定した HDU 番号のヘッダーを返す.
@@ -110,19 +163,36 @@ class STISFitsReader:
         KeyError
             指定した HDU 番号のデータが存在しない場合
         """
+        self._load((hdu_number,))
         if hdu_number not in self.data:
             raise KeyError(f"HDU {hdu_number} のデータが見つかりません")
         return self.data[hdu_number]
 
-    def spectrum_data(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def spectrum_data(
+        self, rows: slice | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """STIS のスペクトルデータ（科学データ、誤差、品質フラグ）を返す.
 
+        ``rows`` を指定すると波長方向（axis 0）の範囲のみを切り出して返す。
+        遅延モードではメモリマップのビューとなるため、実際に読み込まれるのは
+        切り出した範囲のみである。
+
+        Parameters
+        ----------
+        rows : slice or None, optional
+            波長方向ピクセルの範囲。None の場合は全体を返す（デフォルト: None）
+
         Returns
         -------
         tuple[np.ndarray, np.ndarray, np.ndarray]
             (HDU 1: 科学データ, HDU 2: 統計的誤差, HDU 3: 品質フラグ)
         """
-        return self.image_data(1), self.image_data(2), self.image_data(3)
+        self._load((1, 2, 3))
+        arrays = (self.image_data(1), self.image_data(2), self.image_data(3))
+        if rows is None:
+            return arrays
+        data, error, quality = (a[rows] for a in arrays)
+        return data, error, quality
 
     def info(self) -> str:
         """読み込んだ HDU の概要情報を返す.
@@ -130,15 +200,72 @@ class STISFitsReader:
         Returns
         -------
         str
-            HDU 番号、ヘッダーの有無、データ形状の一覧
+            HDU 番号、ヘッダーの有無、データ形状の一覧。
+            遅延モードではデータを読み込まずヘッダーから形状を求める。
         """
         lines = [f"STISFitsReader: {self.filename}"]
         for i in sorted(self.headers.keys()):
-            shape = self.data[i].shape if i in self.data else "No data"
+            shape = self._data_shape(i) or "No data"
             lines.append(f"  HDU {i}: shape={shape}")
         return "\n".join(lines)
 
 
+def _try_open(path: Path, lazy: bool) -> STISFitsReader | Exception:
+    """Reader を生成し、失敗した場合は例外オブジェクトを返す.
+
+    プロセスプールからも呼び出せるようモジュールレベルに定義する。
+    """
+    try:
+        return STISFitsReader.open(path, lazy=lazy)
+    except Exception as e:  # noqa: BLE001
+        return e
+
+
+def open_readers(
+    paths: list[Path],
+    lazy: bool = False,
+    max_workers: int | None = None,
+    executor: str = "thread",
+) -> list[STISFitsReader | Exception]:
+    """複数の FITS ファイルを（必要に応じて並列に）開く.
+
+    結果は ``paths`` と同じ順序で返す。読み込みに失敗したファイルは
+    例外を送出せず、該当位置に例外オブジェクトを格納する。
+
+    Parameters
+    ----------
+    paths : list[Path]
+        FITS ファイルパスのリスト
+    lazy : bool, optional
+        各 Reader を遅延モードで開くかどうか（デフォルト: False）
+    max_workers : int or None, optional
+        並列ワーカー数。None の場合は逐次に読み込む（デフォルト: None）
+    executor : str, optional
+        並列実行方式（"thread", "process"）。デフォルト: "thread"。
+        I/O 待ちが支配的な場合は "thread"、ヘッダー解析などの
+        CPU 処理が支配的な場合は "process" が有利。
+
+    Returns
+    -------
+    list[STISFitsReader | Exception]
+        各パスに対応する Reader、または読み込み時に発生した例外
+
+    Raises
+    ------
+    ValueError
+        未知のエグゼキュータ名が指定された場合
+    """
+    if len(paths) <= 1:
+        max_workers = None
+    return parallel_map(
+        _try_open,
+        paths,
+        [lazy] * len(paths),
+        max_workers=max_workers,
+        executor=executor,
+    )
+
+
 @dataclass(frozen=True)
 class ReaderCollection:
     """複数の STISFitsReader をまとめて管理するコレクション.
@@ -150,25 +277,65 @@ class ReaderCollection:
     ----------
     readers : list[STISFitsReader]
         読み込み済み Reader のリスト
+    errors : dict[Path, Exception]
+        読み込みに失敗したファイルのパスと例外の辞書（デフォルト: 空）
     """
 
     readers: list[STISFitsReader]
+    errors: dict[Path, Exception] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_paths(cls, paths: list[Path]) -> Self:
+    def from_paths(
+        cls,
+        paths: list[Path],
+        lazy: bool = False,
+        max_workers: int | None = None,
+        executor: str = "thread",
+        skip_errors: bool = False,
+    ) -> Self:
         """パスのリストから Reader を一括生成する.
 
+        ``max_workers`` を指定するとスレッド/プロセスプールで並列に
+        読み込む。Reader の順序は常に ``paths`` の順序と一致する。
+
         Parameters
         ----------
         paths : list[Path]
             FITS ファイルパスのリスト
+        lazy : bool, optional
+            各 Reader を遅延モードで開くかどうか（デフォルト: False）。
+            True の場合はヘッダーのみを読み込む。
+        max_workers : int or None, optional
+            並列ワーカー数。None の場合は逐次に読み込む（デフォルト: None）
+        executor : str, optional
+            並列実行方式（"thread", "process"）。デフォルト: "thread"
+        skip_errors : bool, optional
+            True の場合、読み込みに失敗したファイルを除外して
+            ``errors`` に記録する。False の場合は最初に失敗した
+            ファイルの例外を送出する（デフォルト: False）。
 
         Returns
         -------
         ReaderCollection
             読み込み済みコレクション
+
+        Raises
+        ------
+        Exception
+            ``skip_errors=False`` でいずれかのファイルの読み込みに失敗した場合
         """
-        return cls(readers=[STISFitsReader.open(p) for p in paths])
+        readers: list[STISFitsReader] = []
+        errors: dict[Path, Exception] = {}
+        for path, result in zip(
+            paths, open_readers(paths, lazy, max_workers, executor)
+        ):
+            if isinstance(result, Exception):
+                if not skip_errors:
+                    raise result
+                errors[Path(path)] = result
+            else:
+                readers.append(result)
+        return cls(readers=readers, errors=errors)
 
     def __len__(self) -> int:
         return len(self.readers)
@@ -185,7 +352,10 @@ class ReaderCollection:
         Returns
         -------
         str
-            各ファイルの HDU 概要を連結した文字列
+            各ファイルの HDU 概要（および読み込み失敗ファイル）を連結した文字列
         """
-        return "\n\n".join(reader.info() for reader in self.readers)
+        blocks = [reader.info() for reader in self.readers]
+        for path, error in self.errors.items():
+            blocks.append(f"Failed: {path}\n  {type(error).__name__}: {error}")
+        return "\n\n".join(blocks)
 
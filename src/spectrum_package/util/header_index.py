@@ -0,0 +1,371 @@
+"""FITS ヘッダー索引モジュール.
+
+ディレクトリ探索で見つかった FITS ファイルのメタデータ（ROOTNAME, OPT_ELEM,
+BANDWID, データ形状）を JSON カタログとしてディスクに保存する。
+索引はファイルパス・更新時刻・サイズをキーとして差分更新されるため、
+同じファイルのヘッダーを2回以上読むことはない。
+
+ディレクトリ探索の結果（パスの一覧）も、探索したディレクトリの更新時刻と
+ともに保存する。ディレクトリにファイルが追加・削除されるとその
+ディレクトリの更新時刻が変わるため、全ディレクトリの更新時刻が一致する
+間は、ディレクトリを走査せずに保存済みの一覧を使用できる。
+
+索引ファイルはデフォルトではデータディレクトリではなくキャッシュ
+ディレクトリ（`default_index_path`）に作成するため、読み取り専用の
+アーカイブにも使用できる。
+
+カタログの形式::
+
+    {"version": 2,
+     "entries": [{"path": ..., "mtime": ..., "size": ..., ...}, ...],
+     "scans": {"<root>|<pattern>": {"directories": {<dir>: <mtime>, ...},
+                                    "paths": [...]}, ...}}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Self, Any, Iterable, Iterator, cast
+
+import numpy as np
+from astropy.io import fits  # type: ignore
+
+#: 索引ファイルのフォーマットバージョン
+INDEX_VERSION: int = 2
+
+#: 索引ファイルを作成するディレクトリのデフォルト
+DEFAULT_INDEX_DIR: Path = Path.home() / ".cache" / "spectrum_package" / "header_index"
+
+
+def _index_key(path: Path) -> str:
+    """索引のキーとして使用する絶対パス文字列を返す."""
+    return str(Path(path).resolve())
+
+
+def default_index_path(file_directory: str | Path) -> Path:
+    """データディレクトリに対応する索引ファイルのデフォルトのパスを返す.
+
+    ``DEFAULT_INDEX_DIR`` の下に、データディレクトリの絶対パスの
+    SHA-256 から決めたファイル名で作成する。
+
+    Parameters
+    ----------
+    file_directory : str or Path
+        データファイルのルートディレクトリ
+
+    Returns
+    -------
+    Path
+        索引ファイルのパス
+    """
+    digest = hashlib.sha256(_index_key(Path(file_directory)).encode("utf-8")).hexdigest()
+    return DEFAULT_INDEX_DIR / f"{digest[:32]}.json"
+
+
+def _directory_mtimes(root: Path, depth: int) -> dict[str, float]:
+    """``root`` から深さ ``depth`` までの全ディレクトリの更新時刻を返す."""
+    mtimes: dict[str, float] = {}
+    for level in range(depth + 1):
+        for directory in root.glob("*/" * level) if level else [root]:
+            try:
+                mtimes[str(directory)] = os.stat(directory).st_mtime
+            except OSError:
+                continue
+    return mtimes
+
+
+@dataclass(frozen=True)
+class DirectoryScan:
+    """ディレクトリ探索の結果.
+
+    Attributes
+    ----------
+    directories : dict[str, float]
+        探索したディレクトリのパスと、探索時の更新時刻
+    paths : list[str]
+        探索で見つかったファイルのパス
+    """
+
+    directories: dict[str, float]
+    paths: list[str]
+
+    def is_current(self) -> bool:
+        """探索した全ディレクトリの更新時刻が探索時と一致するかを返す."""
+        for directory, mtime in self.directories.items():
+            try:
+                if os.stat(directory).st_mtime != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class HeaderIndexEntry:
+    """1ファイル分の索引エントリ.
+
+    Attributes
+    ----------
+    path : str
+        FITS ファイルの絶対パス
+    mtime : float
+        索引作成時のファイル更新時刻（UNIX 時刻）
+    size : int
+        索引作成時のファイルサイズ [byte]
+    rootname : str
+        観測のルート名（ROOTNAME キーワード）
+    optical_element : str
+        使用された光学素子（OPT_ELEM キーワード）
+    bandwidth : float
+        バンド幅（BANDWID キーワード）
+    shape : tuple[int, int]
+        HDU 1 のデータ形状 (NAXIS1, NAXIS2)
+    """
+
+    path: str
+    mtime: float
+    size: int
+    rootname: str
+    optical_element: str
+    bandwidth: float
+    shape: tuple[int, int]
+
+    @classmethod
+    def from_file(cls, path: Path) -> Self:
+        """FITS ファイルのヘッダーのみを読み込んでエントリを生成する.
+
+        HDU 0 と HDU 1 のヘッダーだけを解析し、データ配列は読み込まない。
+
+        Parameters
+        ----------
+        path : Path
+            FITS ファイルのパス
+
+        Returns
+        -------
+        HeaderIndexEntry
+            生成されたエントリ
+        """
+        stat = os.stat(path)
+        with fits.open(path, lazy_load_hdus=True) as hdul:  # type: ignore
+            h0 = cast(Any, hdul[0].header)  # type: ignore
+            h1 = cast(Any, hdul[1].header if len(hdul) > 1 else fits.Header())  # type: ignore
+            return cls(
+                path=_index_key(path),
+                mtime=stat.st_mtime,
+                size=stat.st_size,
+                rootname=str(h0.get("ROOTNAME", h1.get("ROOTNAME", ""))),
+                optical_element=str(h0.get("OPT_ELEM", h1.get("OPT_ELEM", ""))),
+                bandwidth=float(h0.get("BANDWID", np.nan)),
+                shape=(int(h1.get("NAXIS1", 0)), int(h1.get("NAXIS2", 0))),
+            )
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any]) -> Self:
+        """JSON から読み込んだ辞書をエントリに変換する."""
+        return cls(**{**item, "shape": tuple(item["shape"])})
+
+    def is_current(self, path: Path) -> bool:
+        """ファイルの更新時刻とサイズが索引作成時と一致するかを返す."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_mtime == self.mtime and stat.st_size == self.size
+
+
+@dataclass(frozen=True)
+class HeaderIndex:
+    """FITS ヘッダー索引.
+
+    JSON カタログから読み込み、`update` で新規・変更ファイルのみ
+    ヘッダーを読み直し、`save` でディスクに書き戻す。
+
+    Attributes
+    ----------
+    index_path : Path
+        索引ファイルのパス
+    entries : dict[str, HeaderIndexEntry]
+        絶対パスをキーとするエントリ辞書
+    scans : dict[str, DirectoryScan]
+        ``"<ルートディレクトリ>|<glob パターン>"`` をキーとする
+        ディレクトリ探索の結果
+    """
+
+    index_path: Path
+    entries: dict[str, HeaderIndexEntry] = field(default_factory=dict, repr=False)
+    scans: dict[str, DirectoryScan] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def load(cls, index_path: str | Path) -> Self:
+        """索引ファイルを読み込む.
+
+        ファイルが存在しない、読み込めない（書き込み途中で壊れた場合など）、
+        形式が不正、またはバージョンが異なる場合は空の索引を返す。
+
+        Parameters
+        ----------
+        index_path : str or Path
+            索引ファイルのパス
+
+        Returns
+        -------
+        HeaderIndex
+            読み込まれた索引
+        """
+        index_path = Path(index_path)
+        entries: dict[str, HeaderIndexEntry] = {}
+        scans: dict[str, DirectoryScan] = {}
+        if index_path.exists():
+            try:
+                with open(index_path, encoding="utf-8") as f:
+                    catalog = json.load(f)
+                if catalog.get("version") == INDEX_VERSION:
+                    for item in catalog.get("entries", []):
+                        entry = HeaderIndexEntry.from_dict(item)
+                        entries[entry.path] = entry
+                    for key, item in catalog.get("scans", {}).items():
+                        scans[key] = DirectoryScan(**item)
+            except (OSError, ValueError, TypeError, KeyError, AttributeError):
+                entries, scans = {}, {}
+        return cls(index_path=index_path, entries=entries, scans=scans)
+
+    def glob(self, root: str | Path, depth: int, pattern: str) -> tuple[list[Path], bool]:
+        """ディレクトリを探索してパスの一覧を返す（保存済みの結果が有効なら再利用する）.
+
+        ``root`` 直下から ``depth`` 階層下のディレクトリにある、``pattern`` に
+        一致するファイルを探索する（``Path(root).glob("*/" * depth + pattern)``
+        と同じ）。探索した全ディレクトリの更新時刻が保存時と一致する場合は
+        ディレクトリを走査しない。
+
+        Parameters
+        ----------
+        root : str or Path
+            探索のルートディレクトリ
+        depth : int
+            ファイルを探索するディレクトリの深さ
+        pattern : str
+            ファイル名の glob パターン
+
+        Returns
+        -------
+        tuple[list[Path], bool]
+            (パスの一覧（順序は不定）, 探索し直したかどうか)
+        """
+        root = Path(root)
+        key = f"{_index_key(root)}|{'*/' * depth}{pattern}"
+        scan = self.scans.get(key)
+        if scan is not None and scan.is_current():
+            return [Path(p) for p in scan.paths], False
+        directories = _directory_mtimes(root, depth)
+        paths = list(root.glob("*/" * depth + pattern))
+        self.scans[key] = DirectoryScan(
+            directories=directories, paths=[str(p) for p in paths]
+        )
+        return paths, True
+
+    def update(self, paths: Iterable[Path], prune: bool = False) -> int:
+        """新規または変更されたファイルのヘッダーを索引に登録する.
+
+        更新時刻とサイズが一致するファイルはヘッダーを読み直さない。
+
+        Parameters
+        ----------
+        paths : Iterable[Path]
+            登録対象の FITS ファイルパス
+        prune : bool, optional
+            True の場合、``paths`` に含まれないエントリを削除する
+            （デフォルト: False）
+
+        Returns
+        -------
+        int
+            追加・更新・削除されたエントリ数
+        """
+        n_changed = 0
+        seen: set[str] = set()
+        for path in paths:
+            key = _index_key(path)
+            seen.add(key)
+            entry = self.entries.get(key)
+            if entry is not None and entry.is_current(path):
+                continue
+            self.entries[key] = HeaderIndexEntry.from_file(path)
+            n_changed += 1
+        if prune:
+            for key in [k for k in self.entries if k not in seen]:
+                del self.entries[key]
+                n_changed += 1
+        return n_changed
+
+    def save(self) -> None:
+        """索引を JSON ファイルに書き出す.
+
+        プロセスごとに異なる一時ファイルに書き込んでから置き換えるため、
+        書き込み途中で中断されても、複数のプロセスが同時に書き込んでも
+        既存の索引は壊れない。
+        """
+        catalog = {
+            "version": INDEX_VERSION,
+            "entries": [asdict(e) for e in self.entries.values()],
+            "scans": {key: asdict(scan) for key, scan in self.scans.items()},
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def query(
+        self,
+        paths: Iterable[Path] | None = None,
+        optical_element: str | None = None,
+        rootname: str | None = None,
+        shape: tuple[int, int] | None = None,
+    ) -> list[Path]:
+        """条件に一致するファイルパスを返す.
+
+        Parameters
+        ----------
+        paths : Iterable[Path] or None, optional
+            検索対象のパス。None の場合は索引の全エントリを対象とする。
+            指定した場合は索引済みのパスのみを入力順に返す。
+        optical_element : str or None, optional
+            光学素子名（例: "G430L"）
+        rootname : str or None, optional
+            ルート名
+        shape : tuple[int, int] or None, optional
+            HDU 1 のデータ形状 (NAXIS1, NAXIS2)
+
+        Returns
+        -------
+        list[Path]
+            条件に一致するファイルパスのリスト
+        """
+        if paths is None:
+            candidates = [(Path(k), e) for k, e in self.entries.items()]
+        else:
+            candidates = [
+                (Path(p), self.entries[_index_key(p)])
+                for p in paths
+                if _index_key(p) in self.entries
+            ]
+        return [
+            p for p, e in candidates
+            if (optical_element is None or e.optical_element == optical_element)
+            and (rootname is None or e.rootname == rootname)
+            and (shape is None or e.shape == tuple(shape))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, path: Path) -> HeaderIndexEntry:
+        return self.entries[_index_key(path)]
+
+    def __iter__(self) -> Iterator[HeaderIndexEntry]:
+        return iter(self.entries.values())
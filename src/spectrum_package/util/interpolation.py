@@ -2,20 +2,241 @@
 
 2D 速度マップ生成時に使用する補間アルゴリズムを提供する。
 Protocol による抽象化により、補間方法の差し替えが容易に行える。
+
+スリットの標本点の配置（空間位置 × スリットオフセット）は輝線・物理量・
+再描画の間で共通なので、"linear" と "cubic" は Delaunay 三角形分割を
+`triangulate` で一度だけ作成して再利用する。"linear" はさらに、グリッド点を
+含む三角形と重心座標の重み（`BarycentricWeights`）を `barycentric_weights` で
+前計算し、値の配列ごとの補間を重み付き和だけで行う。どちらも直近に
+使用した配置を `_CACHE_SIZE` 件まで保持する（`clear_interpolation_cache` で破棄）。
+
+"rectilinear" は標本点が共通の空間位置 × スリットオフセットの矩形格子上に
+並ぶことを利用し、三角形分割を行わずにグリッドサイズに比例する時間で
+双線形補間する。
+
+"idw"（k 近傍の逆距離加重）は `kd_tree` で作成した KD 木を、"natural"
+（Sibson の自然近傍補間）は三角形分割を再利用し、どちらも "linear" と同様に
+グリッド点ごとの近傍点と重み（`GridWeights`）を前計算して保持する。
+
+補間値が隣り合うスリットの標本点だけで決まる配置かどうかは `has_local_support`
+で判定する（`VelocityMap` の部分的な再補間が全体の再補間と一致する条件）。
 """
 
 from __future__ import annotations
 
-from typing import Protocol
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Protocol, Self
 
 import numpy as np
-from scipy.interpolate import griddata  # type: ignore
+from scipy.interpolate import CloughTocher2DInterpolator, griddata  # type: ignore
+from scipy import sparse  # type: ignore
+from scipy.spatial import Delaunay, cKDTree  # type: ignore
+
+#: 三角形分割・KD 木・補間の重みをそれぞれ保持する件数
+_CACHE_SIZE: int = 4
+
+_triangulations: OrderedDict[str, Delaunay] = OrderedDict()
+_trees: OrderedDict[str, cKDTree] = OrderedDict()
+_weights: OrderedDict[str, GridWeights] = OrderedDict()
+
+
+def _array_key(*arrays: np.ndarray) -> str:
+    """配列の dtype・形状・内容からキャッシュキーを生成する."""
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.dtype.str, array.shape)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _cached(cache: OrderedDict[str, Any], key: str, build: Any) -> Any:
+    """``key`` の値をキャッシュから返す。なければ ``build()`` で作成して保持する."""
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    value = build()
+    cache[key] = value
+    while len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def clear_interpolation_cache() -> None:
+    """保持している三角形分割・KD 木・補間の重みを破棄する."""
+    _triangulations.clear()
+    _trees.clear()
+    _weights.clear()
+
+
+def triangulate(points: np.ndarray) -> Delaunay:
+    """既知点の Delaunay 三角形分割を返す（同じ点配置では作成済みのものを再利用）.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        既知点の座標 (N, 2)
+
+    Returns
+    -------
+    scipy.spatial.Delaunay
+        三角形分割
+    """
+    points = np.asarray(points, dtype=float)
+    return _cached(_triangulations, _array_key(points), lambda: Delaunay(points))
+
+
+def kd_tree(points: np.ndarray) -> cKDTree:
+    """既知点の KD 木を返す（同じ点配置では作成済みのものを再利用）.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        既知点の座標 (N, 2)
+
+    Returns
+    -------
+    scipy.spatial.cKDTree
+        KD 木
+    """
+    points = np.asarray(points, dtype=float)
+    return _cached(_trees, _array_key(points), lambda: cKDTree(points))
+
+
+def _grid_points(grid_x: np.ndarray, grid_y: np.ndarray) -> np.ndarray:
+    """グリッドの座標を (n_grid, 2) の配列にする."""
+    return np.column_stack([np.ravel(grid_x), np.ravel(grid_y)]).astype(float)
+
+
+def _grid_key(points: np.ndarray, grid_x: np.ndarray, grid_y: np.ndarray, *options: object) -> str:
+    """既知点・グリッド・補間の設定から重みのキャッシュキーを生成する."""
+    key = _array_key(np.asarray(points, dtype=float), np.asarray(grid_x), np.asarray(grid_y))
+    return ":".join([key, *map(str, options)])
+
+
+@dataclass(frozen=True)
+class GridWeights:
+    """既知点からグリッドへの線形な補間の前計算結果.
+
+    各グリッド点について、補間に使用する既知点のインデックスと重みを
+    保持する。値の配列を変えて何度でも `apply` できる。近傍点の数が
+    グリッド点ごとに異なる場合は、重み 0 の要素で幅を揃える。
+
+    Attributes
+    ----------
+    vertices : np.ndarray
+        各グリッド点の近傍点のインデックス (n_grid, m)
+    weights : np.ndarray
+        各近傍点の重み (n_grid, m)
+    inside : np.ndarray
+        グリッド点で補間値が定義されるかどうか (n_grid,)
+    shape : tuple[int, ...]
+        グリッドの形状
+    """
+
+    vertices: np.ndarray
+    weights: np.ndarray
+    inside: np.ndarray
+    shape: tuple[int, ...]
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        """既知点の値をグリッドに補間する.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            既知点の値 (N,) または (N, k)（k 個の値の配列をまとめて補間する）
+
+        Returns
+        -------
+        np.ndarray
+            補間された配列（グリッド形状、またはグリッド形状 + (k,)）。
+            補間値が定義されない点は NaN。
+        """
+        values = np.asarray(values, dtype=float)
+        result = np.einsum("gv,gv...->g...", self.weights, values[self.vertices])
+        result[~self.inside] = np.nan
+        return result.reshape(self.shape + values.shape[1:])
+
+
+@dataclass(frozen=True)
+class BarycentricWeights(GridWeights):
+    """三角形分割上の線形補間の前計算結果.
+
+    各グリッド点について、それを含む三角形の3頂点（既知点のインデックス）と
+    重心座標の重み（いずれも (n_grid, 3)）を保持する。``inside`` は
+    グリッド点が既知点の凸包内にあるかどうか。
+    """
+
+    @classmethod
+    def from_triangulation(
+        cls, triangulation: Delaunay, grid_x: np.ndarray, grid_y: np.ndarray
+    ) -> Self:
+        """三角形分割とグリッドから重心座標の重みを計算する.
+
+        Parameters
+        ----------
+        triangulation : scipy.spatial.Delaunay
+            既知点の三角形分割
+        grid_x : np.ndarray
+            補間先グリッドの X 座標
+        grid_y : np.ndarray
+            補間先グリッドの Y 座標（grid_x と同形状）
+
+        Returns
+        -------
+        BarycentricWeights
+            重心座標の重み
+        """
+        xi = _grid_points(grid_x, grid_y)
+        simplex = triangulation.find_simplex(xi)
+        inside = simplex >= 0
+        simplex = np.where(inside, simplex, 0)
+        transform = triangulation.transform[simplex]  # (n_grid, 3, 2)
+        bary = np.einsum("gij,gj->gi", transform[:, :2], xi - transform[:, 2])
+        weights = np.column_stack([bary, 1.0 - bary.sum(axis=1)])
+        weights[~inside] = 0.0
+        return cls(
+            vertices=triangulation.simplices[simplex],
+            weights=weights,
+            inside=inside,
+            shape=np.shape(grid_x),
+        )
+
+
+def barycentric_weights(
+    points: np.ndarray, grid_x: np.ndarray, grid_y: np.ndarray
+) -> BarycentricWeights:
+    """既知点からグリッドへの線形補間の重みを返す（同じ配置では再利用）.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        既知点の座標 (N, 2)
+    grid_x : np.ndarray
+        補間先グリッドの X 座標
+    grid_y : np.ndarray
+        補間先グリッドの Y 座標（grid_x と同形状）
+
+    Returns
+    -------
+    BarycentricWeights
+        重心座標の重み
+    """
+    return _cached(
+        _weights, _grid_key(points, grid_x, grid_y, "linear"),
+        lambda: BarycentricWeights.from_triangulation(triangulate(points), grid_x, grid_y),
+    )
 
 
 class Interpolator(Protocol):
     """補間アルゴリズムのプロトコル.
 
     `VelocityMap` で使用される補間メソッドが満たすべきインターフェース。
+    任意で ``is_local(points) -> bool`` を実装すると、その配置で補間値が
+    隣り合うスリットの標本点だけで決まることを `has_local_support` に示せる。
     """
 
     def interpolate(
@@ -49,7 +270,8 @@ class Interpolator(Protocol):
 class LinearInterpolator:
     """線形補間.
 
-    `scipy.interpolate.griddata` の `method='linear'` を使用する。
+    `scipy.interpolate.griddata` の `method='linear'` と同じ結果を、
+    前計算した `BarycentricWeights` の重み付き和で求める。
     """
 
     def interpolate(
@@ -77,7 +299,16 @@ class LinearInterpolator:
         np.ndarray
             線形補間された 2D 配列
         """
-        return griddata(points, values, (grid_x, grid_y), method="linear")  # type: ignore
+        return barycentric_weights(points, grid_x, grid_y).apply(values)
+
+    def is_local(self, points: np.ndarray) -> bool:
+        """三角形が隣り合うスリットの間にのみ張られる配置かどうか.
+
+        全スリットの標本点が同じ空間位置に欠損なく並ぶ場合に限り、
+        三角形は格子の1セルに収まる。欠損があると三角形が欠損を挟んだ
+        スリットどうしを結ぶことがある。
+        """
+        return _complete_lattice(points)
 
 
 class NearestInterpolator:
@@ -113,11 +344,20 @@ class NearestInterpolator:
         """
         return griddata(points, values, (grid_x, grid_y), method="nearest")  # type: ignore
 
+    def is_local(self, points: np.ndarray) -> bool:
+        """最近傍点が常に上下いずれかの隣のスリットにある配置かどうか.
+
+        欠損のない矩形格子の場合に限る（`LinearInterpolator.is_local` を参照）。
+        """
+        return _complete_lattice(points)
+
 
 class CubicInterpolator:
     """3次補間.
 
-    `scipy.interpolate.griddata` の `method='cubic'` を使用する。
+    `scipy.interpolate.griddata` の `method='cubic'` と同じ
+    Clough–Tocher 補間を、`triangulate` で再利用する三角形分割上で行う
+    （勾配の推定は値の配列ごとに行う）。
     """
 
     def interpolate(
@@ -145,7 +385,508 @@ class CubicInterpolator:
         np.ndarray
             3次補間された 2D 配列
         """
-        return griddata(points, values, (grid_x, grid_y), method="cubic")  # type: ignore
+        interpolator = CloughTocher2DInterpolator(triangulate(points), values)
+        return interpolator(grid_x, grid_y)  # type: ignore
+
+
+#: 矩形格子とみなす最小の充填率（標本点数 / 格子点数）
+_RECTILINEAR_MIN_FILL: float = 0.25
+
+
+def _rectilinear_layout(
+    points: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """既知点を矩形格子の格子点に対応付ける.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] or None
+        (X 軸 (nx,), Y 軸 (ny,), 各点の X 方向インデックス (N,),
+         各点の Y 方向インデックス (N,))。格子点のうち既知点がある割合が
+        `_RECTILINEAR_MIN_FILL` 未満の場合（矩形格子とみなせない場合）は None。
+    """
+    x_axis, ix = np.unique(points[:, 0], return_inverse=True)
+    y_axis, iy = np.unique(points[:, 1], return_inverse=True)
+    if len(points) == 0 or len(points) < _RECTILINEAR_MIN_FILL * len(x_axis) * len(y_axis):
+        return None
+    return x_axis, y_axis, ix, iy
+
+
+def _complete_lattice(points: np.ndarray) -> bool:
+    """既知点が欠損のない矩形格子の格子点にちょうど1つずつ並ぶかどうか."""
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        return False
+    n_x = len(np.unique(points[:, 0]))
+    n_y = len(np.unique(points[:, 1]))
+    return len(points) == n_x * n_y == len(np.unique(points, axis=0))
+
+
+def _fill_row_gaps(table: np.ndarray, x_axis: np.ndarray) -> np.ndarray:
+    """各行（スリット）の内部の欠損を、スリット方向の線形補間で埋める.
+
+    補間は格子の X 座標 ``x_axis`` に対して行う（全スリットの空間位置の
+    和集合であり、等間隔とは限らない）。行の最初と最後の有効点より
+    外側は NaN のまま残す（外挿しない）。
+    """
+    columns = np.arange(table.shape[1])
+    for row in table:  # (nx, k)
+        for k in range(row.shape[1]):
+            valid = np.isfinite(row[:, k])
+            if valid.all() or np.count_nonzero(valid) < 2:
+                continue
+            first, last = np.flatnonzero(valid)[[0, -1]]
+            gaps = ~valid & (columns > first) & (columns < last)
+            row[gaps, k] = np.interp(x_axis[gaps], x_axis[valid], row[valid, k])
+    return table
+
+
+def _axis_cells(
+    axis: np.ndarray, coords: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """座標を含む軸上の区間と、区間内の位置を求める.
+
+    軸が等間隔の場合は除算で、そうでない場合は二分探索で区間を求める。
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        (区間の左端のインデックス, 右端のインデックス, 区間内の位置 [0, 1],
+         軸の範囲外かどうか)
+    """
+    n = len(axis)
+    outside = (coords < axis[0]) | (coords > axis[-1])
+    if n == 1:
+        zeros = np.zeros(coords.shape, dtype=int)
+        return zeros, zeros, np.zeros(coords.shape), coords != axis[0]
+    steps = np.diff(axis)
+    if np.allclose(steps, steps[0], rtol=1e-9, atol=0.0):
+        lower = np.floor((coords - axis[0]) / steps[0])
+        lower = np.clip(np.nan_to_num(lower), 0, n - 2).astype(int)
+    else:
+        lower = np.clip(np.searchsorted(axis, coords, side="right") - 1, 0, n - 2)
+    t = np.clip((coords - axis[lower]) / (axis[lower + 1] - axis[lower]), 0.0, 1.0)
+    return lower, lower + 1, t, outside
+
+
+class RectilinearInterpolator:
+    """矩形格子上の双線形補間.
+
+    `VelocityMap` の標本点は、空間ピクセル位置とスリットオフセットの
+    矩形格子上に並ぶ（フィットに失敗した点は欠損）。この配置を検出し、
+    格子上の値の表を作ってから各グリッド点を双線形補間するため、
+    三角形分割を必要とせず、計算量はグリッドサイズに比例する。
+
+    - 同じ格子点に複数の値がある場合は平均する
+    - スリット内部の欠損は、スリット方向の線形補間で埋めてから補間する
+    - 補間に寄与する格子点に欠損（スリット端より外側など）がある
+      グリッド点、および格子の範囲外のグリッド点は NaN
+    - 矩形格子とみなせない配置（格子点の充填率が低い場合）は
+      `LinearInterpolator` で補間する
+    """
+
+    def interpolate(
+        self,
+        points: np.ndarray,
+        values: np.ndarray,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+    ) -> np.ndarray:
+        """双線形補間で矩形格子上の既知点をグリッドに補間する.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            既知点の座標 (N, 2)
+        values : np.ndarray
+            既知点の値 (N,) または (N, k)
+        grid_x : np.ndarray
+            補間先グリッドの X 座標（2D meshgrid）
+        grid_y : np.ndarray
+            補間先グリッドの Y 座標（2D meshgrid）
+
+        Returns
+        -------
+        np.ndarray
+            双線形補間された 2D 配列（values が (N, k) の場合は末尾に k）
+        """
+        points = np.asarray(points, dtype=float)
+        values = np.asarray(values, dtype=float)
+        layout = _rectilinear_layout(points)
+        if layout is None:
+            return LinearInterpolator().interpolate(points, values, grid_x, grid_y)
+        x_axis, y_axis, ix, iy = layout
+
+        flat = values.reshape(len(values), -1)
+        total = np.zeros((len(y_axis), len(x_axis), flat.shape[1]))
+        count = np.zeros((len(y_axis), len(x_axis), 1))
+        np.add.at(total, (iy, ix), flat)
+        np.add.at(count, (iy, ix), 1.0)
+        with np.errstate(invalid="ignore"):
+            table = _fill_row_gaps(np.where(count > 0, total / count, np.nan), x_axis)
+
+        gx = np.ravel(grid_x).astype(float)
+        gy = np.ravel(grid_y).astype(float)
+        x0, x1, tx, x_out = _axis_cells(x_axis, gx)
+        y0, y1, ty, y_out = _axis_cells(y_axis, gy)
+
+        result = np.zeros((len(gx), flat.shape[1]))
+        for yi, xi, w in (
+            (y0, x0, (1 - tx) * (1 - ty)),
+            (y0, x1, tx * (1 - ty)),
+            (y1, x0, (1 - tx) * ty),
+            (y1, x1, tx * ty),
+        ):
+            w = w[:, np.newaxis]
+            result += np.where(w > 0, w * table[yi, xi], 0.0)
+        result[x_out | y_out] = np.nan
+        return result.reshape(np.shape(grid_x) + values.shape[1:])
+
+    def is_local(self, points: np.ndarray) -> bool:
+        """双線形補間で補間する配置かどうか.
+
+        欠損はスリット内の補間でのみ埋め、各グリッド点は上下のスリットの
+        値だけから求めるため、矩形格子とみなせる配置であれば局所的である。
+        """
+        return _rectilinear_layout(np.asarray(points, dtype=float)) is not None
+
+
+def _padded_weights(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    data: np.ndarray,
+    n_points: int,
+    inside: np.ndarray,
+    shape: tuple[int, ...],
+) -> GridWeights:
+    """(グリッド点, 既知点, 重み) の組から、幅を揃えた `GridWeights` を作る.
+
+    同じ組の重みは合計する。幅に満たない行は、その行の最初の近傍点を
+    重み 0 で繰り返して埋める。
+    """
+    n_grid = len(inside)
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(n_grid, n_points))
+    matrix.sum_duplicates()
+    counts = np.diff(matrix.indptr)
+    width = max(int(counts.max(initial=0)), 1)
+    row_of = np.repeat(np.arange(n_grid), counts)
+    position = np.arange(matrix.nnz) - np.repeat(matrix.indptr[:-1], counts)
+
+    first = np.where(counts > 0, matrix.indices[np.minimum(matrix.indptr[:-1], matrix.nnz - 1)], 0)
+    vertices = np.repeat(first[:, np.newaxis], width, axis=1)
+    weights = np.zeros((n_grid, width))
+    vertices[row_of, position] = matrix.indices
+    weights[row_of, position] = matrix.data
+    return GridWeights(vertices=vertices, weights=weights, inside=inside, shape=shape)
+
+
+def _idw_weights(
+    points: np.ndarray,
+    grid_x: np.ndarray,
+    grid_y: np.ndarray,
+    k: int,
+    power: float,
+    radius: float | None,
+) -> GridWeights:
+    """k 近傍の逆距離加重の重みを計算する.
+
+    探索半径内に既知点がないグリッド点は未定義、既知点と一致する
+    グリッド点はその値とする。
+    """
+    xi = _grid_points(grid_x, grid_y)
+    n_points = len(points)
+    k = min(k, n_points)
+    upper = np.inf if radius is None else radius
+    dist, index = kd_tree(points).query(xi, k=k, distance_upper_bound=upper)
+    dist = np.reshape(dist, (len(xi), k))
+    index = np.reshape(index, (len(xi), k))
+
+    found = index < n_points
+    inside = found[:, 0]
+    exact = inside & (dist[:, 0] == 0.0)
+    weights = np.zeros_like(dist)
+    np.divide(1.0, dist**power, out=weights, where=found & (dist > 0.0))
+    weights[exact] = 0.0
+    weights[exact, 0] = 1.0
+    total = weights.sum(axis=1, keepdims=True)
+    np.divide(weights, total, out=weights, where=total > 0.0)
+
+    index = np.where(found, index, index[:, :1])
+    index[~inside] = 0
+    return GridWeights(vertices=index, weights=weights, inside=inside, shape=np.shape(grid_x))
+
+
+def slit_spacing(points: np.ndarray) -> float | None:
+    """隣り合うスリットの間隔（スリットオフセットの隣接差の中央値）を返す.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        既知点の座標 (N, 2): [スリット方向, スリット垂直方向]
+
+    Returns
+    -------
+    float or None
+        スリット間隔 [arcsec]。スリットが1本以下の場合は None。
+    """
+    offsets = np.unique(np.asarray(points, dtype=float)[:, 1])
+    if len(offsets) < 2:
+        return None
+    return float(np.median(np.diff(offsets)))
+
+
+def _circumcenters_at_origin(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """原点・a・b を通る円の中心を返す.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (中心 (n, 2), 3点がほぼ同一直線上にあるかどうか (n,))
+    """
+    cross = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    a2 = np.sum(a**2, axis=1)
+    b2 = np.sum(b**2, axis=1)
+    degenerate = np.abs(cross) <= 1e-10 * np.sqrt(a2 * b2)
+    d = np.where(degenerate, 1.0, 2.0 * cross)
+    center = np.column_stack([
+        (b[:, 1] * a2 - a[:, 1] * b2) / d,
+        (a[:, 0] * b2 - b[:, 0] * a2) / d,
+    ])
+    center[degenerate] = 0.0
+    return center, degenerate
+
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """2次元ベクトルの外積 (n,)."""
+    return u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+
+
+def _natural_neighbour_weights(
+    points: np.ndarray, grid_x: np.ndarray, grid_y: np.ndarray
+) -> GridWeights:
+    """Sibson の自然近傍座標を計算する.
+
+    グリッド点 x を挿入したときに外接円が x を含む三角形（Bowyer–Watson の
+    空洞）を隣接関係をたどって求め、各頂点の Voronoi 領域のうち x の
+    新しい Voronoi 領域に奪われる面積を、空洞の三角形ごとの寄与の和として
+    計算する（座標は x を原点とする）。空洞の内部の辺上の Voronoi 頂点は
+    隣接する2つの三角形の寄与で打ち消し合うため、辺の中点で代用する。
+
+    既知点と一致するグリッド点、凸包の境界上のグリッド点（いずれも
+    自然近傍座標が線形補間に一致する）は重心座標の重みとする。
+    凸包外のグリッド点は未定義。
+    """
+    triangulation = triangulate(points)
+    xi = _grid_points(grid_x, grid_y)
+    vertices = triangulation.points
+
+    # 三角形の頂点を反時計回りに揃える（隣接三角形は対向する頂点の順）
+    simplices = triangulation.simplices.copy()
+    neighbors = triangulation.neighbors.copy()
+    a, b, c = (vertices[simplices[:, i]] for i in range(3))
+    clockwise = _cross(b - a, c - a) < 0
+    simplices[clockwise] = simplices[clockwise][:, [0, 2, 1]]
+    neighbors[clockwise] = neighbors[clockwise][:, [0, 2, 1]]
+    offset, _ = _circumcenters_at_origin(b - a, c - a)
+    centers = a + offset
+    radius2 = np.sum(offset**2, axis=1)
+
+    # 外接円がグリッド点を含む三角形を、含む三角形から隣接関係でたどる
+    n_simplices = len(simplices)
+    start = triangulation.find_simplex(xi)
+    inside = start >= 0
+    cavity = np.flatnonzero(inside) * n_simplices + start[inside]
+    frontier = cavity
+    while len(frontier):
+        grid_index, simplex = np.divmod(frontier, n_simplices)
+        candidate = neighbors[simplex].ravel()
+        grid_index = np.repeat(grid_index, 3)
+        valid = candidate >= 0
+        grid_index, candidate = grid_index[valid], candidate[valid]
+        d2 = np.sum((xi[grid_index] - centers[candidate]) ** 2, axis=1)
+        within = d2 < radius2[candidate] * (1.0 - 1e-10)
+        keys = np.unique(grid_index[within] * n_simplices + candidate[within])
+        frontier = keys[~np.isin(keys, cavity, assume_unique=True)]
+        cavity = np.union1d(cavity, frontier)
+
+    pair_grid, pair_simplex = np.divmod(cavity, n_simplices)
+    across = neighbors[pair_simplex]
+    boundary = (across < 0) | ~np.isin(pair_grid[:, np.newaxis] * n_simplices + across, cavity)
+
+    origin = xi[pair_grid]
+    corner = vertices[simplices[pair_simplex]] - origin[:, np.newaxis, :]
+    center = centers[pair_simplex] - origin
+    area = np.zeros((len(cavity), 3))
+    degenerate = np.zeros(len(cavity), dtype=bool)
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        p_i = corner[:, i]
+        # 辺 (i, j) は頂点 k の、辺 (i, k) は頂点 j の対辺
+        ends = []
+        for other, opposite in ((corner[:, j], k), (corner[:, k], j)):
+            new_center, flat = _circumcenters_at_origin(p_i, other)
+            on_boundary = boundary[:, opposite]
+            degenerate |= on_boundary & flat
+            ends.append(np.where(on_boundary[:, np.newaxis], new_center, 0.5 * (p_i + other)))
+        m_ij, m_ik = ends
+        half = 0.5 * p_i
+        area[:, i] = 0.5 * (
+            _cross(m_ij, center) + _cross(center, m_ik)
+            + np.where(boundary[:, k], _cross(half, m_ij), 0.0)
+            - np.where(boundary[:, j], _cross(half, m_ik), 0.0)
+        )
+
+    # 既知点と一致するグリッド点、退化した空洞、面積の和が正にならない
+    # グリッド点（丸め誤差による）は重心座標の重みで置き換える
+    fallback = np.zeros(len(xi), dtype=bool)
+    fallback[pair_grid[degenerate]] = True
+    fallback |= kd_tree(vertices).query(xi, k=1)[0] == 0.0
+    area_total = np.bincount(pair_grid, weights=area.sum(axis=1), minlength=len(xi))
+    fallback |= inside & ~(area_total > 0.0)
+    keep = ~fallback[pair_grid]
+    rows = np.repeat(pair_grid[keep], 3)
+    cols = simplices[pair_simplex[keep]].ravel()
+    data = area[keep].ravel()
+    total = np.bincount(rows, weights=data, minlength=len(xi))
+    data = data / total[rows]
+
+    linear = BarycentricWeights.from_triangulation(triangulation, grid_x, grid_y)
+    replaced = np.flatnonzero(fallback & inside)
+    rows = np.concatenate([rows, np.repeat(replaced, 3)])
+    cols = np.concatenate([cols, linear.vertices[replaced].ravel()])
+    data = np.concatenate([data, linear.weights[replaced].ravel()])
+    return _padded_weights(rows, cols, data, len(points), inside, np.shape(grid_x))
+
+
+@dataclass(frozen=True)
+class IDWInterpolator:
+    """k 近傍の逆距離加重（IDW）補間.
+
+    `kd_tree` で再利用する KD 木から、各グリッド点の探索半径内の
+    最大 k 個の近傍点を求め、距離の ``power`` 乗の逆数で重み付け平均する。
+    近傍点と重みは既知点とグリッドの組ごとに保持する。
+
+    探索半径を指定すると、半径内に既知点がないグリッド点は NaN となり、
+    スリット間の広い隙間やフィットに失敗した領域を埋めない。探索半径は
+    ``radius`` で直接指定するか、``radius_scale`` でスリット間隔
+    （`slit_spacing`）の倍数として既知点の配置から決める。`INTERPOLATORS` の
+    "idw" はスリット間隔の 1.5 倍とする。別の設定を使う場合はインスタンスを
+    `get_interpolator` や `VelocityMap` の ``method`` に直接渡す。
+
+    Attributes
+    ----------
+    k : int
+        近傍点の最大数（デフォルト: 8）
+    power : float
+        距離の重みの指数（デフォルト: 2.0）
+    radius : float or None
+        探索半径 [arcsec]（デフォルト: None）
+    radius_scale : float or None
+        探索半径のスリット間隔に対する倍率。``radius`` とは同時に指定
+        できない。スリットが1本の場合は制限しない。``radius`` と
+        ``radius_scale`` がともに None の場合は制限しない（デフォルト: None）
+    """
+
+    k: int = 8
+    power: float = 2.0
+    radius: float | None = None
+    radius_scale: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.k < 1:
+            raise ValueError("k は1以上を指定してください")
+        if self.power <= 0:
+            raise ValueError("power は正の値を指定してください")
+        if self.radius is not None and self.radius <= 0:
+            raise ValueError("radius は正の値を指定してください")
+        if self.radius_scale is not None and self.radius_scale <= 0:
+            raise ValueError("radius_scale は正の値を指定してください")
+        if self.radius is not None and self.radius_scale is not None:
+            raise ValueError("radius と radius_scale は同時に指定できません")
+
+    def search_radius(self, points: np.ndarray) -> float | None:
+        """既知点の配置に対する探索半径 [arcsec] を返す（None は制限なし）."""
+        if self.radius_scale is None:
+            return self.radius
+        spacing = slit_spacing(points)
+        return None if spacing is None else self.radius_scale * spacing
+
+    def interpolate(
+        self,
+        points: np.ndarray,
+        values: np.ndarray,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+    ) -> np.ndarray:
+        """逆距離加重で散布データをグリッドに補間する.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            既知点の座標 (N, 2)
+        values : np.ndarray
+            既知点の値 (N,) または (N, k)
+        grid_x : np.ndarray
+            補間先グリッドの X 座標（2D meshgrid）
+        grid_y : np.ndarray
+            補間先グリッドの Y 座標（2D meshgrid）
+
+        Returns
+        -------
+        np.ndarray
+            補間された 2D 配列（values が (N, k) の場合は末尾に k）
+        """
+        points = np.asarray(points, dtype=float)
+        radius = self.search_radius(points)
+        key = _grid_key(points, grid_x, grid_y, "idw", self.k, self.power, radius)
+        weights = _cached(
+            _weights, key,
+            lambda: _idw_weights(points, grid_x, grid_y, self.k, self.power, radius),
+        )
+        return weights.apply(values)
+
+
+class NaturalNeighbourInterpolator:
+    """自然近傍補間（Sibson 補間）.
+
+    各グリッド点を挿入したときに、その Voronoi 領域が既知点の
+    Voronoi 領域から奪う面積の比を重みとする。補間値は既知点を通り、
+    既知点以外では連続で、線形関数を再現する。三角形分割は
+    `triangulate` で再利用し、重みは既知点とグリッドの組ごとに保持する。
+    凸包外の点は NaN。
+    """
+
+    def interpolate(
+        self,
+        points: np.ndarray,
+        values: np.ndarray,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+    ) -> np.ndarray:
+        """自然近傍補間で散布データをグリッドに補間する.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            既知点の座標 (N, 2)
+        values : np.ndarray
+            既知点の値 (N,) または (N, k)
+        grid_x : np.ndarray
+            補間先グリッドの X 座標（2D meshgrid）
+        grid_y : np.ndarray
+            補間先グリッドの Y 座標（2D meshgrid）
+
+        Returns
+        -------
+        np.ndarray
+            補間された 2D 配列（values が (N, k) の場合は末尾に k）
+        """
+        points = np.asarray(points, dtype=float)
+        weights = _cached(
+            _weights, _grid_key(points, grid_x, grid_y, "natural"),
+            lambda: _natural_neighbour_weights(points, grid_x, grid_y),
+        )
+        return weights.apply(values)
 
 
 #: 補間メソッド名から Interpolator インスタンスへのマッピング
@@ -153,16 +894,45 @@ INTERPOLATORS: dict[str, Interpolator] = {
     "linear": LinearInterpolator(),
     "nearest": NearestInterpolator(),
     "cubic": CubicInterpolator(),
+    "rectilinear": RectilinearInterpolator(),
+    "idw": IDWInterpolator(radius_scale=1.5),
+    "natural": NaturalNeighbourInterpolator(),
 }
 
 
-def get_interpolator(method: str = "linear") -> Interpolator:
+def has_local_support(interpolator: Interpolator, points: np.ndarray) -> bool:
+    """補間値が隣り合うスリットの標本点だけで決まるかどうかを判定する.
+
+    ``is_local`` を実装しない補間アルゴリズム（勾配を全体から推定する
+    "cubic"、k 近傍が離れたスリットに及ぶ "idw"、Voronoi 領域が欠損を
+    越えて広がる "natural" など）は常に False とする。
+
+    Parameters
+    ----------
+    interpolator : Interpolator
+        補間アルゴリズム
+    points : np.ndarray
+        既知点の座標 (N, 2): [スリット方向, スリット垂直方向]
+
+    Returns
+    -------
+    bool
+        局所的であることが保証される場合は True
+    """
+    is_local = getattr(interpolator, "is_local", None)
+    return bool(is_local(points)) if is_local is not None else False
+
+
+def get_interpolator(method: str | Interpolator = "linear") -> Interpolator:
     """補間メソッド名から対応する Interpolator を取得する.
 
     Parameters
     ----------
-    method : str, optional
-        補間メソッド名（"linear", "nearest", "cubic"）。デフォルト: "linear"
+    method : str or Interpolator, optional
+        補間メソッド名（"linear", "nearest", "cubic", "rectilinear",
+        "idw", "natural"）、または Interpolator のインスタンス
+        （設定を変えた ``IDWInterpolator(k=4, radius=0.3)`` など。
+        そのまま返す）。デフォルト: "linear"
 
     Returns
     -------
@@ -174,6 +944,8 @@ def get_interpolator(method: str = "linear") -> Interpolator:
     ValueError
         未知の補間メソッド名が指定された場合
     """
+    if not isinstance(method, str):
+        return method
     if method not in INTERPOLATORS:
         raise ValueError(
             f"未知の補間メソッド: '{method}'. "
@@ -0,0 +1,80 @@
+"""並列実行ユーティリティ.
+
+ファイル読み込みやフィッティングをスレッド/プロセスプールで
+並列に実行するための共通処理を提供する。結果は常に入力順に返す。
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+#: エグゼキュータ名から Executor クラスへのマッピング
+EXECUTORS: dict[str, type[Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+def get_executor(executor: str = "thread") -> type[Executor]:
+    """エグゼキュータ名から対応する Executor クラスを取得する.
+
+    Parameters
+    ----------
+    executor : str, optional
+        エグゼキュータ名（"thread", "process"）。デフォルト: "thread"
+
+    Returns
+    -------
+    type[Executor]
+        対応する Executor クラス
+
+    Raises
+    ------
+    ValueError
+        未知のエグゼキュータ名が指定された場合
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"未知のエグゼキュータ: '{executor}'. "
+            f"利用可能: {list(EXECUTORS.keys())}"
+        )
+    return EXECUTORS[executor]
+
+
+def parallel_map(
+    func: Callable[..., T],
+    *iterables: Iterable[Any],
+    max_workers: int | None = None,
+    executor: str = "thread",
+) -> list[T]:
+    """関数を各要素に適用し、結果を入力順のリストで返す.
+
+    Parameters
+    ----------
+    func : Callable[..., T]
+        適用する関数。"process" の場合はモジュールレベルの関数である必要がある。
+    *iterables : Iterable[Any]
+        関数の引数列（`map` と同様）
+    max_workers : int or None, optional
+        並列ワーカー数。None の場合は逐次に実行する（デフォルト: None）
+    executor : str, optional
+        並列実行方式（"thread", "process"）。デフォルト: "thread"
+
+    Returns
+    -------
+    list[T]
+        入力順に並んだ結果のリスト
+
+    Raises
+    ------
+    ValueError
+        未知のエグゼキュータ名が指定された場合
+    """
+    pool_cls = get_executor(executor)
+    if max_workers is None:
+        return list(map(func, *iterables))
+    with pool_cls(max_workers=max_workers) as pool:
+        return list(pool.map(func, *iterables))
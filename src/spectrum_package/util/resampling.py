@@ -0,0 +1,384 @@
+"""疎行列による補間演算子モジュール.
+
+観測配置（各スリットの空間位置とスリットオフセット）と補間先グリッドが
+決まれば、標本点の値からグリッドへの補間は値によらない線形写像となる。
+`ResamplingOperator` はこれを `scipy.sparse` の CSR 行列として一度だけ構築し、
+任意の物理量、あるいは数千の波長チャンネルを (N, k) の配列として
+1回の疎行列積で補間する。
+
+演算子は `ResultCache` またはファイル（``.npz``）に保存して再利用できる。
+
+対応する補間メソッド:
+
+- ``"linear"``: Delaunay 三角形分割上の線形補間（1行あたり最大3要素）
+- ``"nearest"``: 最近傍補間（1行あたり1要素）
+- ``"rectilinear"``: 矩形格子上の双線形補間（スリット内部の欠損の補間を含む）
+
+"cubic" は勾配の推定が値に依存する反復計算を含むため対応しない。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Self
+
+import numpy as np
+from scipy import sparse  # type: ignore
+from scipy.spatial import cKDTree  # type: ignore
+
+from .interpolation import _array_key, _axis_cells, _rectilinear_layout, barycentric_weights
+from .result_cache import ResultCache, cache_key
+
+#: 演算子の構築関数の型: (既知点 (N, 2), グリッド X, グリッド Y) -> (疎行列, 定義域)
+OperatorBuilder = Callable[
+    [np.ndarray, np.ndarray, np.ndarray], tuple[sparse.csr_matrix, np.ndarray]
+]
+
+
+def _linear_operator(
+    points: np.ndarray, grid_x: np.ndarray, grid_y: np.ndarray
+) -> tuple[sparse.csr_matrix, np.ndarray]:
+    """三角形分割上の線形補間の演算子（凸包外のグリッド点は未定義）."""
+    weights = barycentric_weights(points, grid_x, grid_y)
+    n_grid = len(weights.inside)
+    matrix = sparse.csr_matrix(
+        (
+            weights.weights.ravel(),
+            (np.repeat(np.arange(n_grid), 3), weights.vertices.ravel()),
+        ),
+        shape=(n_grid, len(points)),
+    )
+    matrix.eliminate_zeros()
+    return matrix, weights.inside
+
+
+def _nearest_operator(
+    points: np.ndarray, grid_x: np.ndarray, grid_y: np.ndarray
+) -> tuple[sparse.csr_matrix, np.ndarray]:
+    """最近傍補間の演算子（全グリッド点で定義される）."""
+    xi = np.column_stack([np.ravel(grid_x), np.ravel(grid_y)])
+    _, nearest = cKDTree(points).query(xi)
+    n_grid = len(xi)
+    matrix = sparse.csr_matrix(
+        (np.ones(n_grid), (np.arange(n_grid), nearest)), shape=(n_grid, len(points))
+    )
+    return matrix, np.ones(n_grid, dtype=bool)
+
+
+def _row_gap_operator(
+    present: np.ndarray, x_axis: np.ndarray
+) -> tuple[sparse.csr_matrix, np.ndarray]:
+    """各行の内部の欠損を行方向の線形補間で埋める演算子.
+
+    `RectilinearInterpolator` と同じく、格子の X 座標に対して補間し、
+    行の最初と最後の既知点より外側は埋めない。
+
+    Parameters
+    ----------
+    present : np.ndarray
+        格子点に既知点があるかどうか (ny, nx)
+    x_axis : np.ndarray
+        格子の X 座標 (nx,)（等間隔とは限らない）
+
+    Returns
+    -------
+    tuple[sparse.csr_matrix, np.ndarray]
+        (格子点の値から欠損を埋めた格子点の値への演算子 (T, T),
+         値が定義される格子点 (T,))
+    """
+    ny, nx = present.shape
+    rows: list[np.ndarray] = []
+    cols: list[np.ndarray] = []
+    data: list[np.ndarray] = []
+    filled = present.copy()
+    columns = np.arange(nx)
+    for r in range(ny):
+        known = np.flatnonzero(present[r])
+        base = r * nx
+        rows.append(base + known)
+        cols.append(base + known)
+        data.append(np.ones(len(known)))
+        if len(known) < 2:
+            continue
+        gaps = columns[(columns > known[0]) & (columns < known[-1]) & ~present[r]]
+        right = known[np.searchsorted(known, gaps)]
+        left = known[np.searchsorted(known, gaps) - 1]
+        t = (x_axis[gaps] - x_axis[left]) / (x_axis[right] - x_axis[left])
+        rows.extend([base + gaps, base + gaps])
+        cols.extend([base + left, base + right])
+        data.extend([1.0 - t, t])
+        filled[r, gaps] = True
+    size = ny * nx
+    matrix = sparse.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(size, size),
+    )
+    return matrix, filled.ravel()
+
+
+def _rectilinear_operator(
+    points: np.ndarray, grid_x: np.ndarray, grid_y: np.ndarray
+) -> tuple[sparse.csr_matrix, np.ndarray]:
+    """矩形格子上の双線形補間の演算子.
+
+    (格子点 ← 既知点の平均) → (スリット内部の欠損の補間) → (双線形補間)
+    の3つの疎行列の積として構築する。補間に寄与する格子点が未定義の
+    グリッド点、および格子の範囲外のグリッド点は未定義とする。
+    矩形格子とみなせない配置は線形補間の演算子とする。
+    """
+    layout = _rectilinear_layout(points)
+    if layout is None:
+        return _linear_operator(points, grid_x, grid_y)
+    x_axis, y_axis, ix, iy = layout
+    nx, ny = len(x_axis), len(y_axis)
+    n_points = len(points)
+
+    cell = iy * nx + ix
+    counts = np.bincount(cell, minlength=nx * ny)
+    averaging = sparse.csr_matrix(
+        (1.0 / counts[cell], (cell, np.arange(n_points))), shape=(nx * ny, n_points)
+    )
+    gap_filling, filled = _row_gap_operator((counts > 0).reshape(ny, nx), x_axis)
+
+    gx = np.ravel(grid_x).astype(float)
+    gy = np.ravel(grid_y).astype(float)
+    x0, x1, tx, x_out = _axis_cells(x_axis, gx)
+    y0, y1, ty, y_out = _axis_cells(y_axis, gy)
+    n_grid = len(gx)
+
+    defined = ~(x_out | y_out)
+    rows, cols, data = [], [], []
+    for yi, xi, w in (
+        (y0, x0, (1 - tx) * (1 - ty)),
+        (y0, x1, tx * (1 - ty)),
+        (y1, x0, (1 - tx) * ty),
+        (y1, x1, tx * ty),
+    ):
+        corner = yi * nx + xi
+        used = w > 0
+        defined &= ~used | filled[corner]
+        rows.append(np.flatnonzero(used))
+        cols.append(corner[used])
+        data.append(w[used])
+    bilinear = sparse.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n_grid, nx * ny),
+    )
+    # 未定義のグリッド点の行は空にする
+    matrix = (sparse.diags(defined.astype(float)) @ bilinear @ gap_filling @ averaging).tocsr()
+    matrix.eliminate_zeros()
+    return matrix, defined
+
+
+#: 補間メソッド名から演算子の構築関数へのマッピング
+OPERATOR_BUILDERS: dict[str, OperatorBuilder] = {
+    "linear": _linear_operator,
+    "nearest": _nearest_operator,
+    "rectilinear": _rectilinear_operator,
+}
+
+
+@dataclass(frozen=True)
+class ResamplingOperator:
+    """標本点の値から補間先グリッドへの疎行列の補間演算子.
+
+    Attributes
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        補間の重み (n_grid, n_points)
+    defined : np.ndarray
+        各グリッド点で補間が定義されるかどうか (n_grid,)。
+        未定義のグリッド点（凸包外など）の補間結果は NaN。
+    grid_x : np.ndarray
+        補間先グリッドの X 座標（2D）
+    grid_y : np.ndarray
+        補間先グリッドの Y 座標（2D）
+    method : str
+        補間メソッド名
+    """
+
+    matrix: sparse.csr_matrix
+    defined: np.ndarray
+    grid_x: np.ndarray
+    grid_y: np.ndarray
+    method: str
+
+    def __repr__(self) -> str:
+        return (
+            f"ResamplingOperator(method='{self.method}', "
+            f"n_points={self.n_points}, grid_shape={self.grid_x.shape}, "
+            f"nnz={self.matrix.nnz})"
+        )
+
+    @property
+    def n_points(self) -> int:
+        """標本点の数."""
+        return self.matrix.shape[1]
+
+    @property
+    def n_grid(self) -> int:
+        """グリッド点の数."""
+        return self.matrix.shape[0]
+
+    @classmethod
+    def build(
+        cls,
+        points: np.ndarray,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        method: str = "linear",
+        cache: ResultCache | None = None,
+    ) -> Self:
+        """標本点の配置と補間先グリッドから補間演算子を構築する.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            標本点の座標 (N, 2)
+        grid_x : np.ndarray
+            補間先グリッドの X 座標（2D）
+        grid_y : np.ndarray
+            補間先グリッドの Y 座標（grid_x と同形状）
+        method : str, optional
+            補間メソッド名（"linear", "nearest", "rectilinear"）。
+            デフォルト: "linear"
+        cache : ResultCache or None, optional
+            演算子のディスクキャッシュ。標本点・グリッド・補間メソッドが
+            一致する演算子があれば読み込み、なければ構築して保存する
+            （デフォルト: None）
+
+        Returns
+        -------
+        ResamplingOperator
+            補間演算子
+
+        Raises
+        ------
+        ValueError
+            演算子に対応していない補間メソッド名が指定された場合
+        """
+        if method not in OPERATOR_BUILDERS:
+            raise ValueError(
+                f"補間演算子に対応していない補間メソッド: '{method}'. "
+                f"利用可能: {list(OPERATOR_BUILDERS.keys())}"
+            )
+        points = np.asarray(points, dtype=float)
+        grid_x = np.asarray(grid_x, dtype=float)
+        grid_y = np.asarray(grid_y, dtype=float)
+
+        key = None
+        if cache is not None:
+            key = cache_key(
+                kind="resampling_operator",
+                geometry=_array_key(points, grid_x, grid_y),
+                method=method,
+            )
+            arrays = cache.get(key)
+            if arrays is not None:
+                return cls._from_arrays(arrays)
+
+        matrix, defined = OPERATOR_BUILDERS[method](points, grid_x, grid_y)
+        operator = cls(
+            matrix=matrix, defined=defined, grid_x=grid_x, grid_y=grid_y, method=method
+        )
+        if cache is not None and key is not None:
+            cache.put(key, operator._to_arrays())
+        return operator
+
+    def apply(self, values: np.ndarray, renormalize: bool = False) -> np.ndarray:
+        """標本点の値をグリッドに補間する.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            標本点の値 (N,) または (N, k)。k 個の物理量・波長チャンネルを
+            1回の疎行列積でまとめて補間する。
+        renormalize : bool, optional
+            True の場合、NaN の標本点を除外し、残りの標本点の重みの和で
+            正規化する（NaN の点を避けて補間する）。False の場合、
+            NaN の標本点は重みを持つグリッド点に NaN として伝播する
+            （デフォルト: False）
+
+        Returns
+        -------
+        np.ndarray
+            補間された配列（グリッド形状、またはグリッド形状 + (k,)）
+
+        Raises
+        ------
+        ValueError
+            値の数が標本点の数と一致しない場合
+        """
+        values = np.asarray(values, dtype=float)
+        if values.shape[0] != self.n_points:
+            raise ValueError(
+                f"値の数 ({values.shape[0]}) が標本点の数 ({self.n_points}) と一致しません"
+            )
+        flat = values.reshape(self.n_points, -1)
+        if renormalize:
+            valid = np.isfinite(flat)
+            total = self.matrix @ np.where(valid, flat, 0.0)
+            norm = self.matrix @ valid.astype(float)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = np.where(norm > 0, total / norm, np.nan)
+        else:
+            result = np.asarray(self.matrix @ flat)
+        result[~self.defined] = np.nan
+        return result.reshape(self.grid_x.shape + values.shape[1:])
+
+    def _to_arrays(self) -> dict[str, np.ndarray]:
+        """保存する配列を返す."""
+        return {
+            "data": self.matrix.data,
+            "indices": self.matrix.indices,
+            "indptr": self.matrix.indptr,
+            "shape": np.asarray(self.matrix.shape),
+            "defined": self.defined,
+            "grid_x": self.grid_x,
+            "grid_y": self.grid_y,
+            "method": np.asarray(self.method),
+        }
+
+    @classmethod
+    def _from_arrays(cls, arrays: dict[str, np.ndarray]) -> Self:
+        """`_to_arrays` で保存した配列から演算子を復元する."""
+        matrix = sparse.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=tuple(int(n) for n in arrays["shape"]),
+        )
+        return cls(
+            matrix=matrix,
+            defined=arrays["defined"],
+            grid_x=arrays["grid_x"],
+            grid_y=arrays["grid_y"],
+            method=str(arrays["method"]),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """演算子を非圧縮の ``.npz`` ファイルに保存する.
+
+        Parameters
+        ----------
+        path : str or Path
+            保存先のパス
+        """
+        with open(path, "wb") as f:
+            np.savez(f, **self._to_arrays())
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """`save` で保存した演算子を読み込む.
+
+        Parameters
+        ----------
+        path : str or Path
+            読み込むファイルのパス
+
+        Returns
+        -------
+        ResamplingOperator
+            補間演算子
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            return cls._from_arrays({name: archive[name] for name in archive.files})
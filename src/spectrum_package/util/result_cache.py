@@ -0,0 +1,191 @@
+"""フィット結果のディスクキャッシュモジュール.
+
+フィット条件から求めたキー（SHA-256 の16進文字列）ごとに、結果の配列を
+非圧縮の NumPy ``.npz`` ファイルとして保存する。キャッシュ全体の容量が
+上限を超えた場合は、最後に使用された時刻（ファイルの更新時刻）が
+最も古いエントリから削除する（LRU）。
+
+キャッシュの構成::
+
+    <directory>/<key>.npz
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+#: キャッシュファイルのフォーマットバージョン（キーに含める）
+CACHE_VERSION: int = 2
+
+#: キャッシュディレクトリのデフォルト
+DEFAULT_CACHE_DIR: Path = Path.home() / ".cache" / "spectrum_package"
+
+#: キャッシュ容量の上限のデフォルト [byte]
+DEFAULT_MAX_BYTES: int = 256 * 1024**2
+
+
+def cache_key(**parts: Any) -> str:
+    """キーワード引数からキャッシュキーを生成する.
+
+    値は JSON で表現できる必要がある（Path などは文字列化する）。
+
+    Parameters
+    ----------
+    **parts : Any
+        キーを構成する値
+
+    Returns
+    -------
+    str
+        SHA-256 の16進文字列
+    """
+    payload = json.dumps(
+        {"version": CACHE_VERSION, **parts}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ResultCache:
+    """容量上限付きのフィット結果キャッシュ.
+
+    Attributes
+    ----------
+    directory : Path
+        キャッシュディレクトリ
+    max_bytes : int
+        キャッシュ全体の容量の上限 [byte]
+    """
+
+    directory: Path = DEFAULT_CACHE_DIR
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "directory", Path(self.directory))
+
+    def __repr__(self) -> str:
+        return (
+            f"ResultCache(directory={self.directory}, entries={len(self)}, "
+            f"size={self.size_bytes / 1024**2:.1f}/{self.max_bytes / 1024**2:.1f} MiB)"
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob("*.npz"))
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    @property
+    def size_bytes(self) -> int:
+        """キャッシュ全体の容量 [byte]."""
+        return sum(p.stat().st_size for p in self._entries())
+
+    def get(self, key: str) -> dict[str, np.ndarray] | None:
+        """キーに対応する配列を読み込む.
+
+        読み込んだエントリは最後に使用された時刻を更新する。壊れたエントリ
+        （書き込み途中のファイルや切り詰められたファイル）は削除する。
+
+        Parameters
+        ----------
+        key : str
+            キャッシュキー
+
+        Returns
+        -------
+        dict[str, np.ndarray] or None
+            保存された配列。エントリが存在しない、または読み込めない場合は None。
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return arrays
+
+    def put(self, key: str, arrays: dict[str, np.ndarray]) -> None:
+        """配列を保存し、容量の上限を超えた分を古い順に削除する.
+
+        一時ファイルに書き込んでから置き換えるため、書き込み途中で
+        中断されても壊れたエントリは残らない。
+
+        Parameters
+        ----------
+        key : str
+            キャッシュキー
+        arrays : dict[str, np.ndarray]
+            保存する配列
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        self.evict(keep=path)
+
+    def evict(self, keep: Path | None = None) -> int:
+        """容量が上限以下になるまで、最後の使用が古いエントリから削除する.
+
+        Parameters
+        ----------
+        keep : Path or None, optional
+            削除しないエントリ（直前に保存したエントリなど）
+
+        Returns
+        -------
+        int
+            削除したエントリ数
+        """
+        stats = []
+        for p in self._entries():
+            try:
+                stats.append((p, p.stat()))
+            except OSError:
+                continue
+        total = sum(st.st_size for _, st in stats)
+        n_removed = 0
+        for p, st in sorted(stats, key=lambda item: item[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if p == keep:
+                continue
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= st.st_size
+            n_removed += 1
+        return n_removed
+
+    def clear(self) -> None:
+        """すべてのエントリを削除する."""
+        for p in self._entries():
+            p.unlink(missing_ok=True)
@@ -0,0 +1,147 @@
+"""テスト共通のフィクスチャ.
+
+STIS の ``_flt`` ファイルと同じ HDU 構成（HDU 0: Primary, HDU 1: 科学データ,
+HDU 2: 統計的誤差, HDU 3: 品質フラグ）の合成 FITS ファイルを作成する。
+データ配列は (波長, 空間位置) で、[OIII] 5007 Å 付近に既知の後退速度の
+ガウス輝線を置く。
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+import pytest
+from astropy.io import fits  # type: ignore
+
+from spectrum_package.processing import ImageCollection
+from spectrum_package.util import ReaderCollection
+from spectrum_package.util.constants import SPEED_OF_LIGHT
+
+#: 輝線の静止波長 [m]（[OIII] 5007）
+REST_WAVELENGTH: float = 5.007e-7
+
+#: フィッティングウィンドウの半幅 [m]
+WINDOW_WIDTH: float = 1.5e-9
+
+#: 合成スペクトルの波長軸 [Å]
+WAVE_START: float = 4990.0
+WAVE_STEP: float = 0.5
+N_WAVE: int = 80
+
+
+def slit_velocities(n_spatial: int, slit: int = 0) -> np.ndarray:
+    """合成スリットの各空間ピクセルの後退速度 [m/s]."""
+    columns = np.arange(n_spatial)
+    return 2.0e5 + 3.0e4 * np.sin(columns / 9.0 + 0.7 * slit)
+
+
+def write_stis_file(
+    path: Path,
+    velocities: np.ndarray,
+    amplitude: float | np.ndarray = 100.0,
+    sigma: float = 1.2,
+    continuum: float = 5.0,
+    noise: float = 0.0,
+    extra_lines: tuple[tuple[float, float], ...] = (),
+    optical_element: str = "G430M",
+    seed: int = 0,
+) -> Path:
+    """合成の STIS 形式 FITS ファイルを書き出す.
+
+    Parameters
+    ----------
+    path : Path
+        出力先
+    velocities : np.ndarray
+        各空間ピクセルの後退速度 [m/s] (n_spatial,)
+    amplitude : float or np.ndarray
+        輝線の振幅（空間ピクセルごとの配列も可）
+    sigma : float
+        輝線の幅 [Å]
+    continuum : float
+        連続光
+    noise : float
+        ガウスノイズの標準偏差（HDU 2 の誤差にも使用）
+    extra_lines : tuple[tuple[float, float], ...]
+        追加の輝線の (静止波長 [Å], 振幅比)。後退速度は共通
+    optical_element : str
+        OPT_ELEM キーワード
+    seed : int
+        ノイズの乱数シード
+    """
+    velocities = np.asarray(velocities, dtype=float)
+    n_spatial = len(velocities)
+    wave = WAVE_START + WAVE_STEP * np.arange(N_WAVE)
+    factor = 1.0 + velocities / SPEED_OF_LIGHT
+    amplitude = np.broadcast_to(np.asarray(amplitude, dtype=float), (n_spatial,))
+    data = np.full((N_WAVE, n_spatial), continuum)
+    for rest, ratio in ((REST_WAVELENGTH * 1e10, 1.0), *extra_lines):
+        center = rest * factor
+        data += ratio * amplitude * np.exp(-0.5 * ((wave[:, None] - center) / sigma) ** 2)
+    error = np.full_like(data, max(noise, 1.0))
+    if noise > 0:
+        data += np.random.default_rng(seed).normal(0.0, noise, data.shape)
+
+    primary = fits.PrimaryHDU()
+    primary.header["FILENAME"] = path.name
+    primary.header["ROOTNAME"] = path.stem.split("_")[0]
+    primary.header["OPT_ELEM"] = optical_element
+    primary.header["BANDWID"] = 2.0
+    science = fits.ImageHDU(data.astype(np.float32), name="SCI")
+    header = science.header
+    header["ROOTNAME"] = primary.header["ROOTNAME"]
+    header["OPT_ELEM"] = optical_element
+    header["CTYPE1"] = "WAVE"
+    header["CUNIT1"] = "Angstrom"
+    header["CRPIX1"] = 1.0
+    header["CRVAL1"] = WAVE_START
+    header["CD1_1"] = WAVE_STEP
+    header["CTYPE2"] = "ANGLE"
+    header["CUNIT2"] = "deg"
+    header["CRPIX2"] = 1.0
+    header["CRVAL2"] = 0.0
+    header["CD2_2"] = 1.4e-5
+    hdus = [
+        primary,
+        science,
+        fits.ImageHDU(error.astype(np.float32), name="ERR"),
+        fits.ImageHDU(np.zeros(data.shape, dtype=np.int16), name="DQ"),
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fits.HDUList(hdus).writeto(path, overwrite=True)
+    return path
+
+
+@pytest.fixture
+def make_stis_file(tmp_path: Path) -> Callable[..., Path]:
+    """``tmp_path`` の下に合成ファイルを作成する関数を返す."""
+
+    def make(name: str, velocities: np.ndarray, **kwargs: object) -> Path:
+        return write_stis_file(tmp_path / name, velocities, **kwargs)  # type: ignore
+
+    return make
+
+
+@pytest.fixture
+def slit_paths(tmp_path: Path) -> list[Path]:
+    """4本のスリットの合成ファイル（各 48 空間ピクセル, 低ノイズ）."""
+    return [
+        write_stis_file(
+            tmp_path / "HST" / f"o5650{k}010" / f"o5650{k}010_flt.fits",
+            slit_velocities(48, k),
+            noise=0.5,
+            seed=k,
+        )
+        for k in range(4)
+    ]
+
+
+@pytest.fixture
+def image_collection(slit_paths: list[Path]) -> ImageCollection:
+    """合成スリットの ImageCollection."""
+    return ImageCollection.from_readers(ReaderCollection.from_paths(slit_paths))
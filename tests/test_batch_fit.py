@@ -0,0 +1,74 @@
+"""バッチ Levenberg–Marquardt エンジンのテスト."""
+
+from __future__ import annotations
+
+import numpy as np
+from scipy.optimize import curve_fit  # type: ignore
+
+from spectrum_package.processing import ImageCollection, VelocityModel
+from spectrum_package.processing.velocity import (
+    _gaussian,
+    _gaussian_batch,
+    _gaussian_batch_jacobian,
+)
+from spectrum_package.util.batch_fit import levenberg_marquardt
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH, slit_velocities
+
+X = np.linspace(-5.0, 5.0, 41)
+
+
+def _true_params(n: int) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    return np.column_stack([
+        rng.uniform(5.0, 50.0, n),
+        rng.uniform(-1.0, 1.0, n),
+        rng.uniform(0.6, 1.5, n),
+        rng.uniform(-2.0, 2.0, n),
+    ])
+
+
+def test_recovers_noiseless_parameters() -> None:
+    truth = _true_params(64)
+    y = _gaussian_batch(X, truth)
+    p0 = truth * np.array([0.7, 0.0, 1.3, 0.0]) + np.array([0.0, 0.3, 0.0, 0.5])
+    result = levenberg_marquardt(_gaussian_batch, _gaussian_batch_jacobian, X, y, p0)
+    assert result.converged.all()
+    params = result.params.copy()
+    params[:, 2] = np.abs(params[:, 2])  # σ の符号は不定
+    np.testing.assert_allclose(params, truth, rtol=1e-6, atol=1e-6)
+    assert np.all(result.nfev >= result.n_iter)
+
+
+def test_matches_curve_fit_on_noisy_data() -> None:
+    truth = _true_params(16)
+    y = _gaussian_batch(X, truth) + np.random.default_rng(2).normal(0.0, 0.5, (16, len(X)))
+    p0 = truth * 1.1
+    result = levenberg_marquardt(_gaussian_batch, _gaussian_batch_jacobian, X, y, p0)
+    assert result.converged.all()
+    for series, params, guess in zip(y, result.params, p0):
+        expected, _ = curve_fit(_gaussian, X, series, p0=guess)
+        np.testing.assert_allclose(params, expected, rtol=1e-4, atol=1e-5)
+
+
+def test_series_with_too_few_points_are_not_fitted() -> None:
+    truth = _true_params(2)
+    y = _gaussian_batch(X, truth)
+    weights = np.ones_like(y)
+    weights[1, 3:] = 0.0
+    result = levenberg_marquardt(
+        _gaussian_batch, _gaussian_batch_jacobian, X, y, truth * 1.05, weights=weights
+    )
+    assert result.converged[0] and not result.converged[1]
+    np.testing.assert_array_equal(result.params[1], truth[1] * 1.05)
+    assert result.n_iter[1] == 0
+
+
+def test_gaussian_batch_engine_matches_curve_fit(image_collection: ImageCollection) -> None:
+    image = image_collection[0]
+    batch = VelocityModel.from_image(
+        image, REST_WAVELENGTH, WINDOW_WIDTH, method="gaussian_batch"
+    )
+    serial = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, method="gaussian")
+    np.testing.assert_allclose(batch.velocities, serial.velocities, rtol=0, atol=1.0)
+    np.testing.assert_allclose(batch.velocities, slit_velocities(48), rtol=0, atol=2e3)
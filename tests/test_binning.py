@@ -0,0 +1,75 @@
+"""空間方向のビニングのテスト."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import ImageCollection, VelocityModel
+from spectrum_package.processing.binning import SpatialBinning
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH
+
+
+def test_fixed_merges_remainder_into_last_bin() -> None:
+    binning = SpatialBinning.fixed(10, 4)
+    np.testing.assert_array_equal(binning.labels, [0, 0, 0, 0, 1, 1, 1, 1, 1, 1])
+    assert binning.n_bins == 2
+    np.testing.assert_array_equal(SpatialBinning.fixed(8, 4).labels, [0] * 4 + [1] * 4)
+    np.testing.assert_array_equal(SpatialBinning.fixed(3, 4).labels, [0, 0, 0])
+    assert SpatialBinning.fixed(0, 4).n_bins == 0
+    with pytest.raises(ValueError, match="bin_factor"):
+        SpatialBinning.fixed(10, 0)
+
+
+def test_adaptive_reaches_target_snr() -> None:
+    signal = np.array([1.0, 1.0, 1.0, 1.0, 9.0, 1.0, 1.0])
+    noise = np.ones(7)
+    binning = SpatialBinning.adaptive(signal, noise, target_snr=2.0)
+    # 4列で S/N = 4/2 = 2、次の1列で 9、残りの2列は直前のビンへ
+    np.testing.assert_array_equal(binning.labels, [0, 0, 0, 0, 1, 1, 1])
+    assert binning.n_bins == 2
+
+    limited = SpatialBinning.adaptive(signal, noise, target_snr=2.0, max_bin_size=3)
+    np.testing.assert_array_equal(limited.labels, [-1, -1, -1, 0, 0, -1, -1])
+
+
+def test_coadd_and_expand() -> None:
+    data = np.arange(12, dtype=float).reshape(2, 6)
+    error = np.ones_like(data)
+    weights = np.ones_like(data)
+    weights[0, 1] = 0.0
+    binning = SpatialBinning.fixed(6, 3)
+    binned, binned_error, binned_weights = binning.coadd(data, error, weights, use_error=True)
+    np.testing.assert_allclose(binned, [[1.0, 4.0], [7.0, 10.0]])
+    np.testing.assert_allclose(
+        binned_error, [[np.sqrt(2) / 2, np.sqrt(3) / 3], [np.sqrt(3) / 3] * 2]
+    )
+    np.testing.assert_allclose(binned_weights, 1.0 / binned_error**2)
+
+    expanded = binning.expand(np.array([10.0, 20.0]))
+    np.testing.assert_array_equal(expanded, [10, 10, 10, 20, 20, 20])
+    excluded = SpatialBinning(labels=np.array([0, -1, 0]), n_bins=1)
+    np.testing.assert_array_equal(excluded.expand(np.array([5.0])), [5.0, np.nan, 5.0])
+
+
+def test_binned_fit(image_collection: ImageCollection) -> None:
+    image = list(image_collection)[0]
+    full = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH)
+    binned = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, bin_factor=5)
+    labels = SpatialBinning.fixed(len(full.velocities), 5).labels
+    np.testing.assert_array_equal(binned.bin_labels, labels)
+    for label in range(labels.max() + 1):
+        values = binned.velocities[labels == label]
+        assert np.all(values == values[0])
+        assert abs(values[0] - np.mean(full.velocities[labels == label])) < 2e3
+
+    adaptive = VelocityModel.from_image(
+        image, REST_WAVELENGTH, WINDOW_WIDTH, use_error=True, target_snr=50.0
+    )
+    assert adaptive.bin_labels is not None and np.all(adaptive.bin_labels >= 0)
+    assert np.all(np.isfinite(adaptive.velocities))
+    with pytest.raises(ValueError, match="同時に指定できません"):
+        VelocityModel.from_image(
+            image, REST_WAVELENGTH, WINDOW_WIDTH, bin_factor=2, target_snr=5.0
+        )
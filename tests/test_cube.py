@@ -0,0 +1,82 @@
+"""3次元データキューブの書き込みと読み込みのテスト."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import DataCube, ImageCollection, ImageModel
+from spectrum_package.util import ReaderCollection
+
+from .conftest import REST_WAVELENGTH, slit_velocities, write_stis_file
+
+
+def test_round_trip(image_collection: ImageCollection, tmp_path: Path) -> None:
+    cube = DataCube.from_image_collection(image_collection, tmp_path / "cube", slit_step=0.25)
+    assert cube.shape == (4, 48, 80)
+    assert len(cube) == 4
+    assert isinstance(cube.data, np.memmap) and not cube.data.flags.writeable
+
+    reopened = DataCube.open(tmp_path / "cube")
+    for current in (cube, reopened):
+        for image, slit in zip(image_collection, current):
+            for name in ("data", "error", "quality"):
+                expected = getattr(image.spectrum, name)
+                np.testing.assert_array_equal(getattr(slit, name), expected)
+                assert getattr(slit, name).dtype == expected.dtype.newbyteorder("=")
+        np.testing.assert_allclose(
+            current.wavelength_array,
+            image_collection[0].header.spectrogram.wavelength_array,
+            rtol=1e-12,
+        )
+        np.testing.assert_allclose(current.spatial_positions, 0.05 * np.arange(48))
+        np.testing.assert_allclose(current.slit_offsets, 0.25 * np.arange(4))
+        assert current.wcs.pixel_shape == (80, 48, 4)
+
+
+def test_from_readers_matches_wavelength_cut(slit_paths: list[Path], tmp_path: Path) -> None:
+    wavelength_range = (REST_WAVELENGTH - 1.5e-9, REST_WAVELENGTH + 1.5e-9)
+    readers = ReaderCollection.from_paths(slit_paths, lazy=True)
+    cube = DataCube.from_readers(readers, tmp_path / "cube", wavelength_range=wavelength_range)
+
+    eager = ReaderCollection.from_paths(slit_paths)
+    images = [ImageModel.from_reader(r, wavelength_range=wavelength_range) for r in eager]
+    assert cube.shape == (4, 48, len(images[0].header.spectrogram.wavelength_array))
+    for image, slit in zip(images, cube):
+        np.testing.assert_array_equal(slit.data, image.spectrum.data)
+    np.testing.assert_allclose(
+        cube.wavelength_array, images[0].header.spectrogram.wavelength_array, rtol=1e-12
+    )
+
+
+def test_overwrite(image_collection: ImageCollection, tmp_path: Path) -> None:
+    directory = tmp_path / "cube"
+    DataCube.from_image_collection(image_collection, directory)
+    with pytest.raises(FileExistsError):
+        DataCube.from_image_collection(image_collection, directory)
+    cube = DataCube.from_image_collection(image_collection, directory, overwrite=True)
+    assert cube.shape == (4, 48, 80)
+
+
+def test_incomplete_cube_cannot_be_opened(slit_paths: list[Path], tmp_path: Path) -> None:
+    short = write_stis_file(tmp_path / "short" / "o56509010_flt.fits", slit_velocities(40))
+    readers = ReaderCollection.from_paths([*slit_paths[:2], short])
+    directory = tmp_path / "cube"
+    with pytest.raises(ValueError, match="スリット 2"):
+        DataCube.from_readers(readers, directory)
+    assert (directory / "data.npy").exists()
+    with pytest.raises(FileNotFoundError):
+        DataCube.open(directory)
+
+
+def test_unknown_version(image_collection: ImageCollection, tmp_path: Path) -> None:
+    directory = tmp_path / "cube"
+    DataCube.from_image_collection(image_collection, directory)
+    meta_path = directory / "cube.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta_path.write_text(json.dumps({**meta, "version": 99}), encoding="utf-8")
+    with pytest.raises(ValueError, match="未対応のキューブのバージョン"):
+        DataCube.open(directory)
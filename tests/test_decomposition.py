@@ -0,0 +1,79 @@
+"""多成分ガウス分解のテスト."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import ComponentVelocityModel, ImageCollection, ImageModel
+from spectrum_package.util import ReaderCollection
+from spectrum_package.util.constants import SPEED_OF_LIGHT
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH, slit_velocities
+
+#: 2番目の成分の基準成分に対する波長のずれ [Å]
+SECOND_OFFSET: float = -4.0
+
+
+def _image(path: Path) -> ImageModel:
+    (image,) = ImageCollection.from_readers(ReaderCollection.from_paths([path]))
+    return image
+
+
+@pytest.fixture
+def velocities() -> np.ndarray:
+    return slit_velocities(24)
+
+
+@pytest.mark.parametrize("criterion", ["bic", "ftest"])
+def test_single_component_selected(
+    make_stis_file: Callable[..., Path], velocities: np.ndarray, criterion: str
+) -> None:
+    image = _image(make_stis_file("single_flt.fits", velocities, noise=0.5))
+    model = ComponentVelocityModel.from_image(
+        image, REST_WAVELENGTH, WINDOW_WIDTH, max_components=2, criterion=criterion
+    )
+    assert len(model) == 2
+    assert np.mean(model.n_components == 1) >= 0.9
+    single = model.n_components == 1
+    np.testing.assert_allclose(model[0].velocities[single], velocities[single], atol=1e3)
+    assert np.all(np.isnan(model[1].velocities[single]))
+
+
+@pytest.mark.parametrize("criterion", ["bic", "ftest"])
+def test_two_components_recovered(
+    make_stis_file: Callable[..., Path], velocities: np.ndarray, criterion: str
+) -> None:
+    path = make_stis_file(
+        "double_flt.fits", velocities, noise=0.5,
+        extra_lines=((REST_WAVELENGTH * 1e10 + SECOND_OFFSET, 0.6),),
+    )
+    image = _image(path)
+    model = ComponentVelocityModel.from_image(
+        image, REST_WAVELENGTH, WINDOW_WIDTH, max_components=2, criterion=criterion
+    )
+    np.testing.assert_array_equal(model.n_components, 2)
+    assert np.all(np.isinf(model.bic[0]) | (model.bic[1] < model.bic[0]))
+
+    # 成分は速度分散の順に並ぶので、速度の大小で対応付けて比較する
+    found = np.sort(np.stack([model[0].velocities, model[1].velocities]), axis=0)
+    shift = SPEED_OF_LIGHT * SECOND_OFFSET * 1e-10 / REST_WAVELENGTH
+    expected = np.stack([velocities + shift * (1 + velocities / SPEED_OF_LIGHT), velocities])
+    np.testing.assert_allclose(found, expected, atol=2e3)
+
+    # 余分な成分はノイズによる少数のピクセルを除いて選ばれない
+    model = ComponentVelocityModel.from_image(
+        image, REST_WAVELENGTH, WINDOW_WIDTH, max_components=3, criterion=criterion
+    )
+    assert np.mean(model.n_components == 2) >= 0.9
+
+
+def test_invalid_arguments(make_stis_file: Callable[..., Path], velocities: np.ndarray) -> None:
+    image = _image(make_stis_file("single_flt.fits", velocities))
+    with pytest.raises(ValueError, match="未知の選択規準"):
+        ComponentVelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, criterion="aic")
+    with pytest.raises(ValueError, match="max_components"):
+        ComponentVelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, max_components=0)
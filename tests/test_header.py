@@ -0,0 +1,44 @@
+"""HeaderSpectrogram の波長配列のキャッシュのテスト."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import header
+from spectrum_package.processing.header import HeaderProfile
+from spectrum_package.util import ReaderCollection
+
+from .conftest import N_WAVE, WAVE_START, WAVE_STEP, write_stis_file
+
+
+def _spectrogram(path: Path):
+    return HeaderProfile.from_reader(ReaderCollection.from_paths([path])[0]).spectrogram
+
+
+def test_wavelength_array_shared_between_matching_headers(tmp_path: Path) -> None:
+    a = _spectrogram(write_stis_file(tmp_path / "a_flt.fits", np.zeros(4)))
+    b = _spectrogram(write_stis_file(tmp_path / "b_flt.fits", np.zeros(4)))
+    expected = (WAVE_START + WAVE_STEP * np.arange(N_WAVE)) * 1e-10
+    np.testing.assert_allclose(a.wavelength_array, expected, rtol=1e-12)
+    assert a.wavelength_array is b.wavelength_array
+    assert not a.wavelength_array.flags.writeable
+
+
+def test_wavelength_cache_is_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(header, "_WAVELENGTH_CACHE_SIZE", 3)
+    header._WAVELENGTH_CACHE.clear()
+    path = write_stis_file(tmp_path / "a_flt.fits", np.zeros(4))
+    spectrogram = _spectrogram(path)
+    for k in range(10):
+        spectrogram.wcs.wcs.crval[0] = 4.99e-7 + k * 1e-10
+        shifted = header.HeaderSpectrogram(
+            rootname="", optical_element="", wcs=spectrogram.wcs.deepcopy(),
+            shape=spectrogram.shape,
+        )
+        assert shifted.wavelength_array[0] == pytest.approx(4.99e-7 + k * 1e-10)
+    assert len(header._WAVELENGTH_CACHE) == 3
@@ -0,0 +1,110 @@
+"""InstrumentModel のディレクトリ探索とヘッダー索引のテスト."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import InstrumentModel
+from spectrum_package.util import header_index
+
+from .conftest import write_stis_file
+
+
+@pytest.fixture(autouse=True)
+def index_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(header_index, "DEFAULT_INDEX_DIR", directory)
+    return directory
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    root = tmp_path / "HST"
+    for k, element in enumerate(["G430M", "G430M", "G750M"]):
+        write_stis_file(
+            root / f"o5650{k}010" / f"o5650{k}010_flt.fits",
+            np.zeros(8),
+            optical_element=element,
+        )
+    (root / "o56500010" / "o56500010_raw.fits").write_bytes(b"")
+    return root
+
+
+def test_path_list_matches_glob(archive: Path) -> None:
+    model = InstrumentModel(str(archive), "_flt", ".fits", exclude_files=("o56501010_flt",))
+    expected = sorted(
+        p for p in archive.glob("*/*_flt.fits") if p.name != "o56501010_flt.fits"
+    )
+    assert model.path_list == expected
+
+
+def test_index_written_to_cache_directory(archive: Path, index_dir: Path) -> None:
+    model = InstrumentModel(str(archive), "_flt", ".fits")
+    model.path_list
+    assert header_index.default_index_path(archive).exists()
+    assert header_index.default_index_path(archive).parent == index_dir
+    assert not list(archive.rglob("*.json"))
+
+
+def test_path_list_served_from_fresh_index(
+    archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model = InstrumentModel(str(archive), "_flt", ".fits")
+    first = model.path_list
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("ディレクトリを走査した")
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "glob", fail)
+        assert model.path_list == first
+
+
+def test_path_list_rescans_changed_directory(archive: Path) -> None:
+    model = InstrumentModel(str(archive), "_flt", ".fits")
+    assert len(model.path_list) == 3
+    added = write_stis_file(archive / "o56503010" / "o56503010_flt.fits", np.zeros(8))
+    assert added in model.path_list
+    added.unlink()
+    assert added not in model.path_list
+
+
+def test_query_by_optical_element(archive: Path) -> None:
+    model = InstrumentModel(str(archive), "_flt", ".fits")
+    assert [p.parent.name for p in model.query(optical_element="G750M")] == ["o56502010"]
+    index = model.header_index()
+    assert len(index) == 3
+    assert {e.shape for e in index} == {(8, 80)}
+
+
+@pytest.mark.parametrize(
+    "content",
+    ['{"version": 2, "entr', "", '{"version": 2, "entries": [{"path": "x"}]}',
+     '{"version": 2, "scans": {"k": {"paths": []}}}', "[1, 2]"],
+    ids=["truncated", "empty", "entry_keys", "scan_keys", "not_object"],
+)
+def test_corrupt_index_is_rebuilt(archive: Path, content: str) -> None:
+    model = InstrumentModel(str(archive), "_flt", ".fits")
+    index_path = header_index.default_index_path(archive)
+    index_path.parent.mkdir(parents=True)
+    index_path.write_text(content, encoding="utf-8")
+    assert len(model.path_list) == 3
+    assert len(model.header_index()) == 3
+    assert len(header_index.HeaderIndex.load(index_path)) == 3
+
+
+def test_unwritable_index_directory(
+    archive: Path, index_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(self: header_index.HeaderIndex) -> None:
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(header_index.HeaderIndex, "save", fail)
+    model = InstrumentModel(str(archive), "_flt", ".fits")
+    assert len(model.path_list) == 3
+    assert model.query(optical_element="G750M") == [
+        archive / "o56502010" / "o56502010_flt.fits"
+    ]
@@ -0,0 +1,299 @@
+"""補間アルゴリズムのテスト."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.interpolate import griddata  # type: ignore
+
+from spectrum_package.util import interpolation
+from spectrum_package.util.interpolation import (
+    INTERPOLATORS,
+    clear_interpolation_cache,
+    get_interpolator,
+    triangulate,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache() -> None:
+    clear_interpolation_cache()
+
+
+def _scattered(seed: int = 0, n: int = 80) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(0.0, 1.0, (n, 2))
+    values = np.sin(4.0 * points[:, 0]) + np.cos(3.0 * points[:, 1])
+    return points, values
+
+
+def _slit_layout(gaps: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """空間位置 × スリットオフセットの格子（gaps=True なら欠損あり）."""
+    x, y = np.meshgrid(0.05 * np.arange(25), 0.2 * np.arange(6))
+    points = np.column_stack([x.ravel(), y.ravel()])
+    if gaps:
+        keep = np.ones(len(points), dtype=bool)
+        keep[[7, 8, 9, 33, 60, 61, 110]] = False
+        points = points[keep]
+    values = 2.0e5 + 3.0e4 * np.sin(3.0 * points[:, 0] + 2.0 * points[:, 1])
+    return points, values
+
+
+def _nonuniform_layout() -> tuple[np.ndarray, np.ndarray]:
+    """ピクセルスケールと切り出し位置の異なるスリットの格子（X 軸は不等間隔）."""
+    rows = []
+    for slit in range(4):
+        x = 0.05 * np.arange(25) if slit % 2 == 0 else 0.02 + 0.1 * np.arange(12)
+        rows.append(np.column_stack([x, np.full(len(x), 0.2 * slit)]))
+    points = np.concatenate(rows)
+    values = 2.0e5 + 3.0e4 * np.sin(3.0 * points[:, 0] + 2.0 * points[:, 1])
+    return points, values
+
+
+def _grid(points: np.ndarray, n: int = 23) -> tuple[np.ndarray, np.ndarray]:
+    return np.meshgrid(
+        np.linspace(points[:, 0].min(), points[:, 0].max(), n),
+        np.linspace(points[:, 1].min(), points[:, 1].max(), n + 4),
+    )
+
+
+@pytest.mark.parametrize("method", ["linear", "nearest", "cubic"])
+@pytest.mark.parametrize("layout", ["scattered", "slits"])
+def test_matches_griddata(method: str, layout: str) -> None:
+    points, values = _scattered() if layout == "scattered" else _slit_layout(gaps=True)
+    grid_x, grid_y = _grid(points)
+    expected = griddata(points, values, (grid_x, grid_y), method=method)
+    result = get_interpolator(method).interpolate(points, values, grid_x, grid_y)
+    scale = np.nanmax(np.abs(expected))
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-10 * scale, equal_nan=True)
+
+
+def test_triangulation_and_weights_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    points, values = _slit_layout(gaps=True)
+    grid_x, grid_y = _grid(points)
+    linear = get_interpolator("linear")
+    first = linear.interpolate(points, values, grid_x, grid_y)
+    assert triangulate(points) is triangulate(points.copy())
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("三角形分割を作り直した")
+
+    # 同じ配置であれば、値を変えても三角形分割と重みを再利用する
+    with monkeypatch.context() as m:
+        m.setattr(interpolation, "Delaunay", fail)
+        second = linear.interpolate(points, 2.0 * values, grid_x, grid_y)
+        get_interpolator("cubic").interpolate(points, values, grid_x, grid_y)
+    np.testing.assert_allclose(second, 2.0 * first, equal_nan=True)
+
+    clear_interpolation_cache()
+    with monkeypatch.context() as m:
+        m.setattr(interpolation, "Delaunay", fail)
+        with pytest.raises(AssertionError):
+            linear.interpolate(points, values, grid_x, grid_y)
+
+
+def test_cache_is_bounded() -> None:
+    grid_x, grid_y = _grid(_scattered()[0])
+    for seed in range(2 * interpolation._CACHE_SIZE):
+        points, values = _scattered(seed)
+        get_interpolator("linear").interpolate(points, values, grid_x, grid_y)
+    assert len(interpolation._triangulations) <= interpolation._CACHE_SIZE
+    assert len(interpolation._weights) <= interpolation._CACHE_SIZE
+
+
+@pytest.mark.parametrize("method", ["linear", "rectilinear", "idw", "natural"])
+def test_multiple_value_columns(method: str) -> None:
+    points, values = _slit_layout(gaps=True)
+    grid_x, grid_y = _grid(points)
+    stacked = np.column_stack([values, -values, np.ones_like(values)])
+    interpolator = get_interpolator(method)
+    result = interpolator.interpolate(points, stacked, grid_x, grid_y)
+    assert result.shape == grid_x.shape + (3,)
+    for k in range(3):
+        single = interpolator.interpolate(points, stacked[:, k], grid_x, grid_y)
+        np.testing.assert_allclose(result[..., k], single, rtol=1e-12, equal_nan=True)
+
+
+def test_unknown_method() -> None:
+    with pytest.raises(ValueError, match="未知の補間メソッド"):
+        get_interpolator("spline")
+    assert set(INTERPOLATORS) >= {"linear", "nearest", "cubic", "rectilinear", "idw", "natural"}
+
+
+def _bilinear(points: np.ndarray) -> np.ndarray:
+    return 1.0 + 2.0 * points[:, 0] - 3.0 * points[:, 1] + 5.0 * points[:, 0] * points[:, 1]
+
+
+def test_rectilinear_reproduces_bilinear_function() -> None:
+    points, _ = _slit_layout()
+    grid_x, grid_y = _grid(points)
+    result = get_interpolator("rectilinear").interpolate(
+        points, _bilinear(points), grid_x, grid_y
+    )
+    expected = _bilinear(np.column_stack([grid_x.ravel(), grid_y.ravel()])).reshape(grid_x.shape)
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_rectilinear_fills_gaps_along_slit() -> None:
+    points, _ = _slit_layout(gaps=True)
+    values = 1.0 + 2.0 * points[:, 0] - 3.0 * points[:, 1]  # スリット方向に線形
+    grid_x, grid_y = _grid(points)
+    result = get_interpolator("rectilinear").interpolate(points, values, grid_x, grid_y)
+    expected = 1.0 + 2.0 * grid_x - 3.0 * grid_y
+    # 欠損は各スリットの内部にあるので、全グリッド点で値が定義される
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    # グリッドが格子の外に出た点は NaN
+    outside = get_interpolator("rectilinear").interpolate(
+        points, values, grid_x + 0.5, grid_y
+    )
+    assert np.all(np.isnan(outside[grid_x + 0.5 > points[:, 0].max()]))
+
+
+def test_rectilinear_fills_gaps_on_nonuniform_axis() -> None:
+    points, _ = _nonuniform_layout()
+    assert interpolation._rectilinear_layout(points) is not None
+    values = 1.0 + 2.0 * points[:, 0] - 3.0 * points[:, 1]
+    grid_x, grid_y = _grid(points, n=41)
+    result = get_interpolator("rectilinear").interpolate(points, values, grid_x, grid_y)
+    # スリット端の外側を除き、X 座標に対する補間で線形関数を再現する
+    defined = np.isfinite(result)
+    assert np.count_nonzero(defined) > 0.9 * result.size
+    np.testing.assert_allclose(
+        result[defined], (1.0 + 2.0 * grid_x - 3.0 * grid_y)[defined], rtol=1e-12
+    )
+
+
+def test_rectilinear_falls_back_to_linear() -> None:
+    points, values = _scattered()
+    grid_x, grid_y = _grid(points)
+    np.testing.assert_allclose(
+        get_interpolator("rectilinear").interpolate(points, values, grid_x, grid_y),
+        get_interpolator("linear").interpolate(points, values, grid_x, grid_y),
+        equal_nan=True,
+    )
+
+
+def test_rectilinear_averages_duplicates() -> None:
+    points, values = _slit_layout()
+    doubled = np.concatenate([points, points])
+    both = np.concatenate([values - 1.0, values + 1.0])
+    grid_x, grid_y = _grid(points)
+    interpolator = get_interpolator("rectilinear")
+    np.testing.assert_allclose(
+        interpolator.interpolate(doubled, both, grid_x, grid_y),
+        interpolator.interpolate(points, values, grid_x, grid_y),
+        rtol=1e-12,
+    )
+
+
+def _brute_force_idw(
+    points: np.ndarray, values: np.ndarray, xi: np.ndarray, k: int, power: float
+) -> np.ndarray:
+    result = np.empty(len(xi))
+    for i, x in enumerate(xi):
+        distance = np.hypot(*(points - x).T)
+        nearest = np.argsort(distance)[:k]
+        weights = 1.0 / distance[nearest] ** power
+        result[i] = np.sum(weights * values[nearest]) / np.sum(weights)
+    return result
+
+
+def test_idw_matches_brute_force() -> None:
+    points, values = _scattered()
+    grid_x, grid_y = _grid(points, n=9)
+    grid_x = grid_x + 1e-3  # 既知点と一致しないようにずらす
+    idw = interpolation.IDWInterpolator(k=5, power=1.5)
+    expected = _brute_force_idw(
+        points, values, np.column_stack([grid_x.ravel(), grid_y.ravel()]), 5, 1.5
+    )
+    np.testing.assert_allclose(
+        idw.interpolate(points, values, grid_x, grid_y).ravel(), expected, rtol=1e-12
+    )
+    # 既知点ではその値をとる
+    exact = idw.interpolate(points, values, points[:, 0], points[:, 1])
+    np.testing.assert_allclose(exact, values, rtol=1e-12)
+
+
+def test_idw_search_radius() -> None:
+    points, values = _slit_layout()
+    grid_x, grid_y = np.meshgrid(np.linspace(0.0, 1.2, 13), np.linspace(-0.95, 1.95, 30))
+    distance = interpolation.kd_tree(points).query(
+        np.column_stack([grid_x.ravel(), grid_y.ravel()])
+    )[0].reshape(grid_x.shape)
+
+    fixed = get_interpolator(interpolation.IDWInterpolator(radius=0.3))
+    result = fixed.interpolate(points, values, grid_x, grid_y)
+    np.testing.assert_array_equal(np.isnan(result), distance > 0.3)
+
+    # 登録済みの "idw" はスリット間隔 (0.2) の 1.5 倍を探索半径とする
+    assert interpolation.slit_spacing(points) == pytest.approx(0.2)
+    default = get_interpolator("idw").interpolate(points, values, grid_x, grid_y)
+    np.testing.assert_array_equal(np.isnan(default), distance > 0.3)
+
+    unlimited = interpolation.IDWInterpolator().interpolate(points, values, grid_x, grid_y)
+    assert not np.isnan(unlimited).any()
+
+
+def test_idw_invalid_parameters() -> None:
+    for kwargs in ({"k": 0}, {"power": 0.0}, {"radius": -1.0}, {"radius_scale": 0.0},
+                   {"radius": 0.3, "radius_scale": 1.5}):
+        with pytest.raises(ValueError):
+            interpolation.IDWInterpolator(**kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("layout", ["scattered", "slits", "gaps"])
+def test_natural_neighbour_reproduces_linear_functions(layout: str) -> None:
+    if layout == "scattered":
+        points, _ = _scattered()
+    else:
+        points, _ = _slit_layout(gaps=layout == "gaps")
+    values = 2.0 - 3.0 * points[:, 0] + 0.5 * points[:, 1]
+    grid_x, grid_y = _grid(points)
+    result = get_interpolator("natural").interpolate(points, values, grid_x, grid_y)
+    linear = get_interpolator("linear").interpolate(points, values, grid_x, grid_y)
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(linear))
+    expected = np.where(np.isnan(linear), np.nan, 2.0 - 3.0 * grid_x + 0.5 * grid_y)
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+
+
+def test_natural_neighbour_weights_are_convex() -> None:
+    points, values = _slit_layout(gaps=True)
+    grid_x, grid_y = _grid(points)
+    weights = interpolation._natural_neighbour_weights(points, grid_x, grid_y)
+    assert np.all(weights.weights[weights.inside] >= -1e-12)
+    np.testing.assert_allclose(weights.weights[weights.inside].sum(axis=1), 1.0)
+    # 既知点と一致するグリッド点ではその値をとる
+    exact = get_interpolator("natural").interpolate(points, values, points[:, 0], points[:, 1])
+    np.testing.assert_allclose(exact, values, rtol=1e-12)
+
+
+def test_natural_neighbour_differs_from_linear() -> None:
+    # 正方形の中心では4頂点の自然近傍座標はすべて 1/4（線形補間は対角線上の2頂点のみ）
+    points = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    centre = (np.array([[0.5]]), np.array([[0.5]]))
+    weights = get_interpolator("natural").interpolate(points, np.eye(4), *centre)
+    np.testing.assert_allclose(weights[0, 0], 0.25, rtol=1e-12)
+    linear = get_interpolator("linear").interpolate(points, np.eye(4), *centre)
+    assert np.count_nonzero(linear[0, 0] > 0) == 2
+
+
+def _stolen_areas(points: np.ndarray, x: np.ndarray, n: int = 800) -> np.ndarray:
+    """x を挿入したときに各既知点の Voronoi 領域から奪われる面積の割合（[0, 1]² の標本で数える）."""
+    samples = (np.arange(n) + 0.5) / n
+    sx, sy = np.meshgrid(samples, samples)
+    s = np.column_stack([sx.ravel(), sy.ravel()])
+    _, owner = interpolation.kd_tree(points).query(s)
+    stolen = np.hypot(*(s - x).T) < np.hypot(*(s - points[owner]).T)
+    return np.bincount(owner[stolen], minlength=len(points)) / np.count_nonzero(stolen)
+
+
+def test_natural_neighbour_matches_voronoi_areas() -> None:
+    points, _ = _scattered()
+    queries = np.array([[0.5, 0.5], [0.3, 0.62], [0.71, 0.28]])
+    weights = get_interpolator("natural").interpolate(
+        points, np.eye(len(points)), queries[:, :1], queries[:, 1:]
+    )
+    for x, w in zip(queries, weights[:, 0]):
+        np.testing.assert_allclose(w, _stolen_areas(points, x), rtol=0, atol=2e-3)
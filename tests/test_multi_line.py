@@ -0,0 +1,61 @@
+"""複数輝線の同時フィッティングのテスト."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import ImageCollection, ImageModel, MultiLineVelocityModel
+from spectrum_package.util import ReaderCollection
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH, slit_velocities
+
+#: 合成の2本目の輝線の静止波長 [m]（ウィンドウが基準輝線と重なる）
+SECOND_LINE: float = 5.019e-7
+
+
+@pytest.fixture
+def velocities() -> np.ndarray:
+    return slit_velocities(32)
+
+
+@pytest.fixture
+def image(make_stis_file: Callable[..., Path], velocities: np.ndarray) -> ImageModel:
+    path = make_stis_file(
+        "o56500010_flt.fits", velocities, noise=0.5,
+        extra_lines=((SECOND_LINE * 1e10, 0.5),),
+    )
+    (image,) = ImageCollection.from_readers(ReaderCollection.from_paths([path]))
+    return image
+
+
+def test_tied_fit_recovers_velocities(image: ImageModel, velocities: np.ndarray) -> None:
+    model = MultiLineVelocityModel.from_image(
+        image, [REST_WAVELENGTH, SECOND_LINE], WINDOW_WIDTH
+    )
+    assert model.tied and len(model) == 2
+    assert model.joint is not None
+    assert model.joint.rest_wavelength == REST_WAVELENGTH
+    np.testing.assert_allclose(model.joint.velocities, velocities, atol=1e3)
+    # 運動学を共有するので、各輝線の速度は共通の速度と一致する
+    for line in model.line_models:
+        np.testing.assert_allclose(line.velocities, model.joint.velocities, rtol=0, atol=1e-6)
+
+
+def test_untied_fit_has_no_joint_model(image: ImageModel, velocities: np.ndarray) -> None:
+    model = MultiLineVelocityModel.from_image(
+        image, [REST_WAVELENGTH, SECOND_LINE], WINDOW_WIDTH, tie_kinematics=False
+    )
+    assert model.joint is None
+    for line in model.line_models:
+        np.testing.assert_allclose(line.velocities, velocities, atol=2e3)
+
+
+def test_line_outside_wavelength_range(image: ImageModel) -> None:
+    with pytest.raises(ValueError, match="ウィンドウ内に波長ピクセルがない"):
+        MultiLineVelocityModel.from_image(image, [REST_WAVELENGTH, 4.959e-7], WINDOW_WIDTH)
+    with pytest.raises(ValueError):
+        MultiLineVelocityModel.from_image(image, [], WINDOW_WIDTH)
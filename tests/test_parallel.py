@@ -0,0 +1,68 @@
+"""列チャンクの並列フィットと逐次フィットの比較テスト."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import ImageCollection, VelocityModel
+from spectrum_package.util.parallel import parallel_map
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH
+
+
+def _fit(collection: ImageCollection, **kwargs: object) -> list[VelocityModel]:
+    return VelocityModel.from_images(
+        list(collection), REST_WAVELENGTH, WINDOW_WIDTH, **kwargs  # type: ignore
+    )
+
+
+def test_parallel_map_keeps_input_order() -> None:
+    values = list(range(20))
+    assert parallel_map(np.square, values, max_workers=4) == [v * v for v in values]
+    with pytest.raises(ValueError):
+        parallel_map(np.square, values, executor="gpu")
+
+
+@pytest.mark.parametrize("method", ["gaussian", "moment", "caruana", "log_gaussian"])
+def test_parallel_matches_serial_exactly(
+    image_collection: ImageCollection, method: str
+) -> None:
+    serial = _fit(image_collection, method=method)
+    parallel = _fit(
+        image_collection, method=method, max_workers=3, chunk_size=7, executor="thread"
+    )
+    for s, p in zip(serial, parallel):
+        np.testing.assert_array_equal(p.velocities, s.velocities)
+
+
+def test_parallel_batch_engine_within_tolerance(image_collection: ImageCollection) -> None:
+    # 一括処理する列数が変わるため、丸め誤差の範囲の差は許容する
+    serial = _fit(image_collection, method="gaussian_batch")
+    parallel = _fit(
+        image_collection, method="gaussian_batch",
+        max_workers=2, chunk_size=5, executor="thread",
+    )
+    for s, p in zip(serial, parallel):
+        np.testing.assert_allclose(p.velocities, s.velocities, rtol=0, atol=1e-3)
+
+
+def test_process_pool_matches_serial(image_collection: ImageCollection) -> None:
+    images = list(image_collection)[:1]
+    serial = VelocityModel.from_images(images, REST_WAVELENGTH, WINDOW_WIDTH)
+    parallel = VelocityModel.from_images(
+        images, REST_WAVELENGTH, WINDOW_WIDTH, max_workers=2, chunk_size=16,
+    )
+    np.testing.assert_array_equal(parallel[0].velocities, serial[0].velocities)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -4])
+def test_invalid_chunk_size(image_collection: ImageCollection, chunk_size: int) -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        _fit(image_collection, max_workers=2, chunk_size=chunk_size, executor="thread")
+
+
+@pytest.mark.parametrize("n_offsets", [3, 5])
+def test_slit_offsets_length_mismatch(image_collection: ImageCollection, n_offsets: int) -> None:
+    with pytest.raises(ValueError, match="slit_offsets"):
+        _fit(image_collection, slit_offsets=[0.0] * n_offsets)
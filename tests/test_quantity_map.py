@@ -0,0 +1,64 @@
+"""多層の物理量マップのテスト."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import ImageCollection, QuantityMap, VelocityMap, VelocityModel
+from spectrum_package.util.constants import SPEED_OF_LIGHT
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH
+
+
+@pytest.fixture
+def models(image_collection: ImageCollection) -> list[VelocityModel]:
+    return VelocityModel.from_images(
+        list(image_collection), REST_WAVELENGTH, WINDOW_WIDTH,
+        slit_offsets=[0.2 * k for k in range(len(image_collection))],
+    )
+
+
+@pytest.mark.parametrize("method", ["linear", "cubic", "rectilinear"])
+def test_velocity_layer_matches_velocity_map(models: list[VelocityModel], method: str) -> None:
+    quantity_map = QuantityMap.from_velocity_models(models, method=method)
+    velocity_map = VelocityMap._from_velocity_models(models, method)
+    np.testing.assert_allclose(
+        quantity_map["velocity"], velocity_map.velocity_2d, rtol=1e-12, equal_nan=True
+    )
+    np.testing.assert_array_equal(quantity_map.x_coords, velocity_map.x_coords)
+    np.testing.assert_array_equal(quantity_map.y_coords, velocity_map.y_coords)
+
+
+def test_layers_match_single_quantity_maps(models: list[VelocityModel]) -> None:
+    combined = QuantityMap.from_velocity_models(models)
+    assert combined.names == ("velocity", "sigma", "flux", "continuum")
+    assert combined.layers.shape[0] == len(combined) == 4
+    for name in combined.names:
+        single = QuantityMap.from_velocity_models(models, quantities=[name])
+        np.testing.assert_allclose(combined[name], single[name], rtol=1e-12, equal_nan=True)
+
+    # 合成データの輝線幅 1.2 Å と連続光 5
+    sigma = SPEED_OF_LIGHT * 1.2e-10 / REST_WAVELENGTH
+    assert abs(np.nanmedian(combined["sigma"]) - sigma) < 0.02 * sigma
+    assert abs(np.nanmedian(combined["continuum"]) - 5.0) < 0.1
+
+
+def test_custom_quantities_and_tiling(models: list[VelocityModel]) -> None:
+    ones = [np.ones_like(m.velocities) for m in models]
+    custom = QuantityMap.from_velocity_models(models, quantities={"ones": ones})
+    np.testing.assert_allclose(custom["ones"][np.isfinite(custom["ones"])], 1.0)
+
+    full = QuantityMap.from_velocity_models(models)
+    tiled = QuantityMap.from_velocity_models(models, max_memory=1, store_axes=True)
+    np.testing.assert_allclose(tiled.layers, full.layers, rtol=1e-12, equal_nan=True)
+    assert tiled.x_coords.ndim == tiled.y_coords.ndim == 1
+
+
+def test_invalid_quantities(models: list[VelocityModel]) -> None:
+    with pytest.raises(ValueError, match="未知の物理量"):
+        QuantityMap.from_velocity_models(models, quantities=["temperature"])
+    with pytest.raises(ValueError):
+        QuantityMap.from_velocity_models(models, quantities=[])
+    with pytest.raises(KeyError):
+        QuantityMap.from_velocity_models(models, quantities=["velocity"])["sigma"]
@@ -0,0 +1,94 @@
+"""疎行列の補間演算子のテスト."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import ImageCollection, VelocityMap, VelocityModel
+from spectrum_package.util import ResamplingOperator, ResultCache
+from spectrum_package.util.interpolation import get_interpolator
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH
+from .test_interpolation import _grid, _nonuniform_layout, _scattered, _slit_layout
+
+METHODS: list[str] = ["linear", "nearest", "rectilinear"]
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("layout", ["scattered", "slits", "gaps", "nonuniform"])
+def test_matches_interpolator(method: str, layout: str) -> None:
+    if layout == "scattered":
+        points, values = _scattered()
+    elif layout == "nonuniform":
+        points, values = _nonuniform_layout()
+    else:
+        points, values = _slit_layout(gaps=layout == "gaps")
+    grid_x, grid_y = _grid(points)
+    operator = ResamplingOperator.build(points, grid_x, grid_y, method=method)
+    expected = get_interpolator(method).interpolate(points, values, grid_x, grid_y)
+    scale = np.nanmax(np.abs(expected))
+    np.testing.assert_allclose(
+        operator.apply(values), expected, rtol=0, atol=1e-10 * scale, equal_nan=True
+    )
+
+    stacked = np.column_stack([values, 2.0 * values])
+    result = operator.apply(stacked)
+    assert result.shape == grid_x.shape + (2,)
+    np.testing.assert_allclose(result[..., 1], 2.0 * result[..., 0], equal_nan=True)
+
+
+def test_renormalize_skips_nan_samples() -> None:
+    points, values = _slit_layout()
+    grid_x, grid_y = _grid(points)
+    operator = ResamplingOperator.build(points, grid_x, grid_y)
+    np.testing.assert_allclose(operator.apply(values, renormalize=True), operator.apply(values))
+
+    constant = np.full(len(points), 3.0)
+    constant[[5, 40, 41]] = np.nan
+    assert np.isnan(operator.apply(constant)).any()
+    renormalized = operator.apply(constant, renormalize=True)
+    np.testing.assert_allclose(renormalized[np.isfinite(renormalized)], 3.0)
+    assert np.mean(np.isfinite(renormalized)) > 0.95
+
+
+def test_save_load_and_cache(tmp_path: Path) -> None:
+    points, values = _slit_layout(gaps=True)
+    grid_x, grid_y = _grid(points)
+    operator = ResamplingOperator.build(points, grid_x, grid_y, method="rectilinear")
+    operator.save(tmp_path / "operator.npz")
+    loaded = ResamplingOperator.load(tmp_path / "operator.npz")
+    assert loaded.method == "rectilinear"
+    np.testing.assert_array_equal(loaded.apply(values), operator.apply(values))
+
+    cache = ResultCache(tmp_path / "cache")
+    first = ResamplingOperator.build(points, grid_x, grid_y, cache=cache)
+    second = ResamplingOperator.build(points, grid_x, grid_y, cache=cache)
+    assert len(cache) == 1
+    assert (first.matrix != second.matrix).nnz == 0
+
+
+def test_invalid_arguments() -> None:
+    points, values = _slit_layout()
+    grid_x, grid_y = _grid(points)
+    with pytest.raises(ValueError, match="対応していない"):
+        ResamplingOperator.build(points, grid_x, grid_y, method="cubic")
+    operator = ResamplingOperator.build(points, grid_x, grid_y)
+    with pytest.raises(ValueError, match="一致しません"):
+        operator.apply(values[:-1])
+
+
+def test_velocity_map_operator(image_collection: ImageCollection) -> None:
+    models = VelocityModel.from_images(
+        list(image_collection), REST_WAVELENGTH, WINDOW_WIDTH,
+        slit_offsets=[0.2 * k for k in range(len(image_collection))],
+    )
+    operator = VelocityMap.resampling_operator(models)
+    velocities = np.concatenate([m.velocities for m in models])
+    np.testing.assert_allclose(
+        operator.apply(velocities, renormalize=True),
+        VelocityMap._from_velocity_models(models).velocity_2d,
+        rtol=1e-12, equal_nan=True,
+    )
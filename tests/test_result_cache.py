@@ -0,0 +1,140 @@
+"""フィット結果のディスクキャッシュのテスト."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import ImageCollection, VelocityModel
+from spectrum_package.processing import velocity
+from spectrum_package.util import ResultCache
+from spectrum_package.util.result_cache import cache_key
+
+from .conftest import REST_WAVELENGTH, WINDOW_WIDTH
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResultCache:
+    return ResultCache(tmp_path / "results")
+
+
+def test_cache_key_is_deterministic() -> None:
+    assert cache_key(a=1, b=[1.0, 2.0]) == cache_key(b=[1.0, 2.0], a=1)
+    assert cache_key(a=1) != cache_key(a=2)
+    assert cache_key(path=Path("/x")) == cache_key(path="/x")
+
+
+def test_round_trip(cache: ResultCache) -> None:
+    arrays = {"velocities": np.linspace(0, 1, 5), "labels": np.arange(5)}
+    assert cache.get("missing") is None
+    cache.put("key", arrays)
+    assert "key" in cache and len(cache) == 1
+    loaded = cache.get("key")
+    assert loaded is not None
+    for name, values in arrays.items():
+        np.testing.assert_array_equal(loaded[name], values)
+        assert loaded[name].dtype == values.dtype
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_evicted(tmp_path: Path) -> None:
+    arrays = {"values": np.zeros(1000)}
+    probe = ResultCache(tmp_path / "probe")
+    probe.put("probe", arrays)
+    cache = ResultCache(tmp_path / "results", max_bytes=2 * probe.size_bytes)
+
+    cache.put("a", arrays)
+    cache.put("b", arrays)
+    # 更新時刻の分解能に依存しないよう、使用時刻を明示的にずらす
+    os.utime(cache.directory / "a.npz", (1000, 1000))
+    os.utime(cache.directory / "b.npz", (2000, 2000))
+    assert cache.get("a") is not None  # a が最も新しく使用されたエントリになる
+    cache.put("c", arrays)
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.size_bytes <= cache.max_bytes
+
+
+def test_fit_served_from_cache(
+    image_collection: ImageCollection, cache: ResultCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    image = list(image_collection)[0]
+    fitted = VelocityModel.from_image(
+        image, REST_WAVELENGTH, WINDOW_WIDTH, use_error=True, cache=cache
+    )
+    assert len(cache) == 1
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("キャッシュがあるのにフィットした")
+
+    with monkeypatch.context() as m:
+        m.setattr(velocity, "_fit_images", fail)
+        cached = VelocityModel.from_image(
+            image, REST_WAVELENGTH, WINDOW_WIDTH, use_error=True, cache=cache,
+            slit_offset=0.3, max_workers=2, executor="thread",
+        )
+    np.testing.assert_array_equal(cached.velocities, fitted.velocities)
+    np.testing.assert_array_equal(cached.spatial_positions, fitted.spatial_positions)
+    assert cached.slit_offset == 0.3
+    assert cached.diagnostics is not None and fitted.diagnostics is not None
+    np.testing.assert_array_equal(cached.diagnostics["failure"], fitted.diagnostics["failure"])
+
+
+def test_changed_settings_miss_cache(
+    image_collection: ImageCollection, cache: ResultCache
+) -> None:
+    images = list(image_collection)[:2]
+    VelocityModel.from_images(images, REST_WAVELENGTH, WINDOW_WIDTH, cache=cache)
+    assert len(cache) == 2
+    VelocityModel.from_images(images, REST_WAVELENGTH, WINDOW_WIDTH, method="moment", cache=cache)
+    VelocityModel.from_images(images, REST_WAVELENGTH, 1.2 * WINDOW_WIDTH, cache=cache)
+    assert len(cache) == 6
+
+    # 読み込み元ファイルが更新されたらキーが変わる
+    source = Path(images[0].source)  # type: ignore[arg-type]
+    stat = source.stat()
+    os.utime(source, (stat.st_atime, stat.st_mtime + 10))
+    VelocityModel.from_images(images, REST_WAVELENGTH, WINDOW_WIDTH, cache=cache)
+    assert len(cache) == 7
+
+
+@pytest.mark.parametrize("corruption", ["truncated", "empty", "garbage"])
+def test_corrupt_entry_is_dropped(cache: ResultCache, corruption: str) -> None:
+    cache.put("key", {"velocities": np.linspace(0, 1, 500)})
+    path = cache.directory / "key.npz"
+    content = path.read_bytes()
+    path.write_bytes(
+        {"truncated": content[: len(content) // 2], "empty": b"", "garbage": b"not an archive"}[
+            corruption
+        ]
+    )
+    assert cache.get("key") is None
+    assert "key" not in cache
+
+
+def test_corrupt_entry_is_refitted(image_collection: ImageCollection, cache: ResultCache) -> None:
+    image = list(image_collection)[0]
+    fitted = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, cache=cache)
+    (path,) = cache.directory.glob("*.npz")
+    path.write_bytes(path.read_bytes()[:100])
+    refitted = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, cache=cache)
+    np.testing.assert_array_equal(refitted.velocities, fitted.velocities)
+    assert cache.get(path.stem) is not None
+
+
+def test_cache_write_failure_keeps_result(
+    image_collection: ImageCollection, cache: ResultCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(self: ResultCache, key: str, arrays: dict[str, np.ndarray]) -> None:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(ResultCache, "put", fail)
+    images = list(image_collection)[:2]
+    models = VelocityModel.from_images(images, REST_WAVELENGTH, WINDOW_WIDTH, cache=cache)
+    assert len(models) == 2
+    assert np.all(np.isfinite(models[0].velocities))
+    assert len(cache) == 0
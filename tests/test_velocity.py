@@ -0,0 +1,285 @@
+"""後退速度フィッティングのテスト."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+from astropy.io import fits  # type: ignore
+
+from spectrum_package.processing import ImageCollection, ImageModel, VelocityModel
+from spectrum_package.processing.velocity import FIT_METHODS
+from spectrum_package.util import ReaderCollection
+from spectrum_package.util.constants import SPEED_OF_LIGHT, STIS_SDQ_FLAGS
+
+from .conftest import (
+    N_WAVE, REST_WAVELENGTH, WAVE_START, WAVE_STEP, WINDOW_WIDTH, slit_velocities,
+    write_stis_file,
+)
+
+METHODS: list[str] = ["gaussian", "gaussian_batch", "moment", "caruana", "log_gaussian"]
+
+
+@pytest.fixture
+def velocities() -> np.ndarray:
+    return slit_velocities(24)
+
+
+@pytest.fixture
+def nan_image(make_stis_file: Callable[..., Path], velocities: np.ndarray) -> ImageModel:
+    """ウィンドウ内に非有限値を含むスリット（列 20 は全点 NaN）."""
+    path = make_stis_file("o56500010_flt.fits", velocities, noise=0.5)
+    with fits.open(path, mode="update") as hdul:
+        data = hdul["SCI"].data
+        data[30, 3] = np.nan
+        data[25:28, 8] = np.nan
+        data[40, 15] = np.inf
+        data[:, 20] = np.nan
+    (image,) = ImageCollection.from_readers(ReaderCollection.from_paths([path]))
+    return image
+
+
+@pytest.fixture
+def flagged_image(make_stis_file: Callable[..., Path], velocities: np.ndarray) -> ImageModel:
+    """宇宙線を含むスリット.
+
+    列 5 の宇宙線には品質フラグを付け、列 9 の宇宙線には大きな誤差を付ける。
+    列 12 は全点に品質フラグを付ける。
+    """
+    path = make_stis_file("o56500010_flt.fits", velocities, noise=0.5)
+    wave = WAVE_START + WAVE_STEP * np.arange(N_WAVE)
+    center = REST_WAVELENGTH * 1e10 * (1 + velocities / SPEED_OF_LIGHT)
+    with fits.open(path, mode="update") as hdul:
+        for column, key in ((5, "DQ"), (9, "ERR")):
+            row = int(np.argmin(np.abs(wave - (center[column] - 3.0))))
+            hdul["SCI"].data[row, column] += 300.0
+            if key == "DQ":
+                hdul["DQ"].data[row, column] = 8192  # 宇宙線
+            else:
+                hdul["ERR"].data[row, column] = 1.0e4
+        hdul["DQ"].data[:, 12] = 8192
+    (image,) = ImageCollection.from_readers(ReaderCollection.from_paths([path]))
+    return image
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_recovers_velocities(
+    image_collection: ImageCollection, method: str
+) -> None:
+    image = list(image_collection)[0]
+    model = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, method=method)
+    tolerance = 1e3 if method.startswith("gaussian") else 2e4
+    np.testing.assert_allclose(model.velocities, slit_velocities(48), atol=tolerance)
+    assert model.diagnostics is not None
+    assert not np.any(model.diagnostics["failure"] != "")
+
+
+@pytest.mark.parametrize("warm_start", [False, True])
+def test_non_finite_flux_is_masked(
+    nan_image: ImageModel, velocities: np.ndarray, warm_start: bool
+) -> None:
+    model = VelocityModel.from_image(
+        nan_image, REST_WAVELENGTH, WINDOW_WIDTH, warm_start=warm_start
+    )
+    assert model.diagnostics is not None
+    good = np.arange(len(velocities)) != 20
+    np.testing.assert_allclose(model.velocities[good], velocities[good], atol=1e3)
+    assert np.isnan(model.velocities[20])
+    assert model.diagnostics["failure"][20] == "too_few_points"
+    assert np.all(model.diagnostics["failure"][good] == "")
+
+
+@pytest.mark.parametrize("method", METHODS[1:])
+def test_non_finite_flux_other_engines(
+    nan_image: ImageModel, velocities: np.ndarray, method: str
+) -> None:
+    model = VelocityModel.from_image(nan_image, REST_WAVELENGTH, WINDOW_WIDTH, method=method)
+    assert model.diagnostics is not None
+    assert np.isnan(model.velocities[20])
+    assert model.diagnostics["failure"][20] == "too_few_points"
+    good = np.arange(len(velocities)) != 20
+    assert np.all(np.isfinite(model.velocities[good]))
+
+
+def test_context_masks_non_finite_flux() -> None:
+    from spectrum_package.processing.velocity import _GaussianFitContext, _gaussian
+
+    wave = np.linspace(4.99e-7, 5.03e-7, 80)
+    context = _GaussianFitContext.from_wavelengths(wave, REST_WAVELENGTH, WINDOW_WIDTH)
+    flux = _gaussian(context.wave_window, 100.0, 5.01e-7, 1.2e-10, 5.0)
+    flux[[4, 9]] = np.nan
+    popt, _ = context.fit_window_nfev(flux)
+    assert abs(popt[1] - 5.01e-7) < 1e-14
+
+
+def test_warm_start_matches_cold_fit(image_collection: ImageCollection) -> None:
+    image = list(image_collection)[0]
+    cold = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH)
+    warm = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, warm_start=True)
+    np.testing.assert_allclose(warm.velocities, cold.velocities, rtol=0, atol=1.0)
+    assert warm.diagnostics is not None
+    assert np.all(warm.diagnostics["failure"] == "")
+
+
+def test_warm_start_falls_back_on_implausible_seed(
+    image_collection: ImageCollection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from spectrum_package.processing import velocity
+
+    image = list(image_collection)[0]
+    cold = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH)
+    attempt = velocity._attempt_fit
+    seeds: list[bool] = []
+
+    def implausible_when_seeded(context, flux, p0, sigma, record):  # type: ignore[no-untyped-def]
+        seeds.append(p0 is not None)
+        popt = attempt(context, flux, p0, sigma, record)
+        if p0 is not None and popt is not None:
+            # 隣接列の初期値からの結果をウィンドウ外の中心に置き換える
+            popt = popt.copy()
+            popt[1] = REST_WAVELENGTH + 2 * WINDOW_WIDTH
+        return popt
+
+    monkeypatch.setattr(velocity, "_attempt_fit", implausible_when_seeded)
+    warm = VelocityModel.from_image(image, REST_WAVELENGTH, WINDOW_WIDTH, warm_start=True)
+    # 最も明るい列以外は、隣接列の初期値で1回、通常の初期値でもう1回フィットする
+    n_spatial = len(cold.velocities)
+    assert seeds.count(True) == n_spatial - 1
+    assert seeds.count(False) == n_spatial
+    np.testing.assert_allclose(warm.velocities, cold.velocities, rtol=0, atol=1e-6)
+    assert warm.diagnostics is not None
+    assert np.all(warm.diagnostics["failure"] == "")
+
+
+@pytest.mark.parametrize("method", sorted(FIT_METHODS))
+def test_dq_flagged_pixels_are_excluded(
+    flagged_image: ImageModel, velocities: np.ndarray, method: str
+) -> None:
+    unmasked = VelocityModel.from_image(flagged_image, REST_WAVELENGTH, WINDOW_WIDTH, method=method)
+    masked = VelocityModel.from_image(
+        flagged_image, REST_WAVELENGTH, WINDOW_WIDTH, method=method, dq_mask=STIS_SDQ_FLAGS
+    )
+    # 宇宙線は列 5 の速度を数十 km/s 以上ずらす（またはフィットを失敗させる）
+    assert not abs(unmasked.velocities[5] - velocities[5]) < 3e4
+    assert abs(masked.velocities[5] - velocities[5]) < 5e3
+
+    # 全点に品質フラグの付いた列はフィットしない
+    assert masked.diagnostics is not None
+    assert np.isnan(masked.velocities[12])
+    assert masked.diagnostics["failure"][12] == "too_few_points"
+    assert np.isfinite(unmasked.velocities[12])
+
+
+@pytest.mark.parametrize("method", sorted(FIT_METHODS))
+def test_error_weighting(flagged_image: ImageModel, velocities: np.ndarray, method: str) -> None:
+    unweighted = VelocityModel.from_image(flagged_image, REST_WAVELENGTH, WINDOW_WIDTH, method=method)
+    weighted = VelocityModel.from_image(
+        flagged_image, REST_WAVELENGTH, WINDOW_WIDTH, method=method, use_error=True
+    )
+    assert not abs(unweighted.velocities[9] - velocities[9]) < 3e4
+    if method in ("moment", "caruana"):
+        # 誤差は除外点の判定にのみ使用する
+        np.testing.assert_array_equal(weighted.velocities, unweighted.velocities)
+    else:
+        # 大きな誤差を付けた宇宙線はほとんど寄与しない
+        assert abs(weighted.velocities[9] - velocities[9]) < 5e3
+
+
+@pytest.mark.parametrize("method", ["gaussian", "moment"])
+def test_velocity_errors_match_empirical_scatter(tmp_path: Path, method: str) -> None:
+    velocities = slit_velocities(48)
+    paths = [
+        write_stis_file(tmp_path / f"o5650{k:02d}10_flt.fits", velocities, noise=3.0, seed=k)
+        for k in range(16)
+    ]
+    images = list(ImageCollection.from_readers(ReaderCollection.from_paths(paths)))
+    fitted = VelocityModel.from_images(images, REST_WAVELENGTH, WINDOW_WIDTH, method=method)
+    scatter = np.nanstd(np.array([m.velocities for m in fitted]) - velocities)
+
+    model = VelocityModel.from_image(
+        images[0], REST_WAVELENGTH, WINDOW_WIDTH, method=method, n_realizations=200, seed=1
+    )
+    assert model.velocity_errors is not None
+    assert np.median(model.velocity_errors) == pytest.approx(scatter, rel=0.2)
+
+
+def test_velocity_errors_seed(image_collection: ImageCollection) -> None:
+    image = list(image_collection)[0]
+
+    def errors(seed: int, **kwargs: object) -> np.ndarray:
+        model = VelocityModel.from_image(
+            image, REST_WAVELENGTH, WINDOW_WIDTH, n_realizations=20, seed=seed, **kwargs  # type: ignore
+        )
+        assert model.velocity_errors is not None
+        return model.velocity_errors
+
+    first = errors(3)
+    np.testing.assert_array_equal(errors(3), first)
+    assert not np.array_equal(errors(4), first)
+    # 実現値は "gaussian_batch" でフィットするため warm_start は誤差に影響しない
+    np.testing.assert_array_equal(errors(3, warm_start=True), first)
+
+
+def test_negative_n_realizations(image_collection: ImageCollection) -> None:
+    with pytest.raises(ValueError, match="n_realizations"):
+        VelocityModel.from_image(
+            list(image_collection)[0], REST_WAVELENGTH, WINDOW_WIDTH, n_realizations=-1
+        )
+
+
+def test_diagnostics_summary_counts_failures(
+    nan_image: ImageModel, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from spectrum_package.processing import velocity
+
+    curve_fit = velocity.curve_fit
+    categories = {
+        2: "maxfev", 5: "maxfev", 7: "bad_bounds", 11: "bad_bounds", 13: "bad_bounds",
+        16: "invalid",
+    }
+    calls: list[int] = []
+
+    def forced(*args, **kwargs):  # type: ignore[no-untyped-def]
+        # 列 20 は全点 NaN で curve_fit を呼ばないため、呼び出し順 = 列番号 (< 20)
+        category = categories.get(len(calls))
+        calls.append(len(calls))
+        if category == "maxfev":
+            raise RuntimeError(
+                "Optimal parameters not found: Number of calls to function has reached maxfev = 10."
+            )
+        if category == "invalid":
+            raise ValueError("Residuals are not finite in the initial point.")
+        popt, pcov, info, message, ier = curve_fit(*args, **kwargs)
+        if category == "bad_bounds":
+            popt = popt.copy()
+            popt[1] = REST_WAVELENGTH + 2 * WINDOW_WIDTH
+        return popt, pcov, info, message, ier
+
+    monkeypatch.setattr(velocity, "curve_fit", forced)
+    model = VelocityModel.from_image(nan_image, REST_WAVELENGTH, WINDOW_WIDTH)
+    summary = model.diagnostics_summary()
+
+    assert summary["n_positions"] == 24
+    assert summary["failures"] == {
+        "too_few_points": 1, "maxfev": 2, "bad_bounds": 3, "invalid": 1,
+    }
+    # 中心がウィンドウ外でも収束はしている
+    assert summary["n_converged"] == 24 - 1 - 2 - 1
+    assert summary["max_nfev"] == velocity._CURVE_FIT_MAXFEV
+    assert summary["total_nfev"] == int(model.diagnostics["nfev"].sum())  # type: ignore[index]
+    assert summary["total_nfev"] >= 2 * velocity._CURVE_FIT_MAXFEV
+    assert 0 <= summary["slowest_position"] < 24
+    assert np.isnan(model.velocities[[2, 5, 16, 20]]).all()
+
+
+def test_maxfev_failure_from_curve_fit(
+    image_collection: ImageCollection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from spectrum_package.processing import velocity
+
+    monkeypatch.setattr(velocity, "_CURVE_FIT_MAXFEV", 2)
+    model = VelocityModel.from_image(list(image_collection)[0], REST_WAVELENGTH, WINDOW_WIDTH)
+    assert model.diagnostics_summary()["failures"] == {"maxfev": 48}
+    assert np.isnan(model.velocities).all()
@@ -0,0 +1,123 @@
+"""2D 速度マップの生成と部分的な再補間のテスト."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from spectrum_package.processing import VelocityMap, VelocityModel
+from spectrum_package.processing import velocity_map
+from spectrum_package.util.interpolation import INTERPOLATORS, IDWInterpolator, get_interpolator
+
+N_POSITIONS: int = 30
+PIXEL_SCALE: float = 0.05
+SLIT_STEP: float = 0.2
+
+
+def _model(slit: int, gaps: bool, offset: float | None = None) -> VelocityModel:
+    positions = PIXEL_SCALE * np.arange(N_POSITIONS)
+    offset = SLIT_STEP * slit if offset is None else offset
+    velocities = 2.0e5 + 4.0e4 * np.sin(3.0 * positions + 5.0 * offset) + 1.0e4 * offset**2
+    if gaps:
+        # スリットごとに異なる位置の欠損（フィット失敗）
+        start = (7 * slit) % (N_POSITIONS - 8) + 2
+        velocities[start:start + 5 + slit % 3] = np.nan
+    redshifts = velocities / 2.998e8
+    return VelocityModel(
+        rest_wavelength=5.007e-7,
+        observed_wavelengths=5.007e-7 * (1 + redshifts),
+        redshifts=redshifts,
+        velocities=velocities,
+        spatial_positions=positions,
+        slit_offset=offset,
+    )
+
+
+def _rebuild(current: VelocityMap) -> np.ndarray:
+    """現在のグリッドのまま全点から補間し直した速度マップ."""
+    points, values = velocity_map._scatter_points(current.velocity_models)
+    grid_x, grid_y = np.meshgrid(current.x_axis, current.y_axis)
+    return get_interpolator(current.interpolation_method).interpolate(
+        points, values, grid_x, grid_y
+    )
+
+
+@pytest.fixture(params=[False, True], ids=["complete", "gaps"])
+def gaps(request: pytest.FixtureRequest) -> bool:
+    return request.param
+
+
+@pytest.mark.parametrize("method", sorted(INTERPOLATORS))
+def test_incremental_update_matches_rebuild(method: str, gaps: bool) -> None:
+    models = [_model(k, gaps) for k in range(7)]
+    base = VelocityMap._from_velocity_models(models, method, grid_resolution=31)
+
+    updated = [
+        base.without_slit(3),
+        base.without_slit(0),
+        base.without_slit(3).with_slit(models[3]),
+        base.replace_slit(2, _model(2, not gaps)),
+        base.with_slit(_model(9, gaps, offset=0.5)),
+    ]
+    for current in updated:
+        np.testing.assert_allclose(
+            current.velocity_2d, _rebuild(current),
+            rtol=0, atol=1e-6, equal_nan=True,
+        )
+
+
+@pytest.mark.parametrize(
+    ("method", "gaps", "local"),
+    [
+        ("linear", False, True),
+        ("linear", True, False),
+        ("nearest", True, False),
+        ("rectilinear", True, True),
+        ("cubic", False, False),
+        ("idw", False, False),
+        ("natural", False, False),
+    ],
+)
+def test_local_update_only_when_exact(
+    method: str, gaps: bool, local: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    models = [_model(k, gaps) for k in range(7)]
+    base = VelocityMap._from_velocity_models(models, method, grid_resolution=31)
+    calls: list[int] = []
+    evaluate = velocity_map._evaluate_tiled
+
+    def spy(*args, **kwargs):  # type: ignore[no-untyped-def]
+        calls.append(len(args[4]))
+        return evaluate(*args, **kwargs)
+
+    monkeypatch.setattr(velocity_map, "_evaluate_tiled", spy)
+    base.without_slit(3)
+    (n_rows,) = calls
+    assert (n_rows < len(base.y_axis)) == local
+
+
+def test_interpolator_instance() -> None:
+    models = [_model(k, False) for k in range(7)]
+    idw = IDWInterpolator(k=4, radius=0.05)
+    assert get_interpolator(idw) is idw
+    base = VelocityMap._from_velocity_models(models, idw, grid_resolution=31)
+    assert base.interpolation_method is idw
+    # 半径 0.05 arcsec ではスリット間 (0.2 arcsec) の中央付近に届かない
+    assert np.isnan(base.velocity_2d).any()
+    current = base.without_slit(3)
+    np.testing.assert_allclose(
+        current.velocity_2d, _rebuild(current), rtol=0, atol=1e-6, equal_nan=True
+    )
+
+
+def test_without_slit_removes_only_that_position() -> None:
+    models = [_model(k, False) for k in range(5)]
+    base = VelocityMap._from_velocity_models(models, "linear", grid_resolution=31)
+    doubled = base.with_slit(models[2])
+    assert len(doubled.velocity_models) == 6
+    removed = doubled.without_slit(2)
+    assert len(removed.velocity_models) == 5
+    assert removed.velocity_models[-1] is models[2]
+    np.testing.assert_allclose(
+        removed.velocity_2d, _rebuild(removed), rtol=0, atol=1e-6, equal_nan=True
+    )